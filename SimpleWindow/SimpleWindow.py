@@ -1,88 +1,5520 @@
-from ctypes import c_int, windll, sizeof, byref
-import win32gui, win32con
-import OpenGL.GL as gl
+import collections
+import contextlib
+import threading
+import queue
+import importlib
 import ctypes
 import numpy
-import glfw
-import cv2
+import json
+import zlib
+import math
+import time
+import sys
 import os
 
 
+class _LazyModule:
+    # MARK: __init__()
+    def __init__(self, name: str):
+        """
+        Stand in for a module which is only imported when one of its attributes is used for the first time
+        Resolved attributes are cached on the instance, so later lookups cost the same as on the module
+
+        Parameters
+        ----------
+        name : str
+            The name of the module
+
+        Returns
+        -------
+        None
+        """
+        self._name = name
+        self._module = None
+
+
+    # MARK: __getattr__()
+    def __getattr__(self, attribute: str):
+        """
+        Import the module if needed and get the attribute from it
+
+        Parameters
+        ----------
+        attribute : str
+            The name of the attribute
+
+        Returns
+        -------
+        any
+            The attribute of the module
+        """
+        if self._module == None:
+            self._module = importlib.import_module(self._name)
+        value = getattr(self._module, attribute)
+        setattr(self, attribute, value)
+        return value
+
+
+# cv2 alone takes hundreds of milliseconds to import, so the heavy modules are only loaded when needed
+gl = _LazyModule("OpenGL.GL")
+glfw = _LazyModule("glfw")
+cv2 = _LazyModule("cv2")
+shared_memory = _LazyModule("multiprocessing.shared_memory")
+asyncio = _LazyModule("asyncio")
+resource_tracker = _LazyModule("multiprocessing.resource_tracker")
+
+_glfw_initialized = False
+_glfw_lock = threading.Lock()
+_backend = None
+_current_context = threading.local()
+# GLFW must only be used from the thread which initialized it
+_glfw_thread = None
+
+
 RED = "\033[91m"
 NORMAL = "\033[0m"
 
+SCALE_MODES = ("stretch", "fit", "fill")
+INTERPOLATIONS = ("nearest", "linear")
+TEXTURE_BUCKET = 64
+
+# dtype: (upload type, internal format for 1, 3 and 4 channels)
+TEXTURE_FORMATS = {
+    "uint8": ("GL_UNSIGNED_BYTE", {1: "GL_R8", 3: "GL_RGB8", 4: "GL_RGBA8"}),
+    "uint16": ("GL_UNSIGNED_SHORT", {1: "GL_R16", 3: "GL_RGB16", 4: "GL_RGBA16"}),
+    "float32": ("GL_FLOAT", {1: "GL_R32F", 3: "GL_RGB32F", 4: "GL_RGBA32F"}),
+}
+# channel order: (channel count, upload format)
+CHANNEL_ORDERS = {
+    "gray": (1, "GL_RED"),
+    "bgr": (3, "GL_BGR"),
+    "rgb": (3, "GL_RGB"),
+    "bgra": (4, "GL_BGRA"),
+    "rgba": (4, "GL_RGBA"),
+}
+DEFAULT_CHANNEL_ORDERS = {1: "gray", 3: "bgr", 4: "bgra"}
+
+TILE_SIZE = 512
+# the number of tile textures which are kept, enough for the visible tiles of a 4K window and some margin
+TILE_CACHE_SIZE = 96
+# the number of tiles uploaded per frame, missing tiles are drawn from coarser cached levels meanwhile
+TILE_UPLOAD_BUDGET = 8
+TILE_ZOOM_STEP = 1.2
+TILE_MAX_ZOOM = 64
+# the number of image pixels which are box filtered at once for a tile of a coarser level
+TILE_FILTER_CHUNK = 1 << 22
+# a tile of level n averages 2^TILE_FILTER_LEVELS x 2^TILE_FILTER_LEVELS samples of each 2^n x 2^n block of the image,
+# so a tile reads at most 4^TILE_FILTER_LEVELS times its own pixels, whatever its level
+TILE_FILTER_LEVELS = 2
+
+DIRTY_TILE_SIZE = 64
+# above this part of changed tiles a single full upload is cheaper than many small ones
+DIRTY_FULL_UPLOAD_FRACTION = 0.5
+
+READBACK_PBO_COUNT = 3
+# the number of read back frames which may wait for the encoder before frames are dropped
+RECORDING_QUEUE_SIZE = 8
+# how long capture() waits for the render thread to read back the last frame
+CAPTURE_TIMEOUT = 1.0
+
+VSYNC_MODES = ("off", "on", "adaptive")
+PACER_SPIN_TIME = 0.002
+PRESENT_HISTORY = 120
+SKIP_UNCHANGED_MODES = ("identity", "checksum")
+# how long run() waits for events between frames of a frame source if no target_fps is set
+IDLE_FRAME_TIME = 1 / 60
+
+# the events which events() did not deliver yet, the oldest are dropped when the consumer falls behind
+EVENT_QUEUE_SIZE = 1024
+# indexed by glfw.RELEASE, glfw.PRESS and glfw.REPEAT
+INPUT_ACTIONS = ("release", "press", "repeat")
+
+# the properties whose changes batch() collects and applies to the window at once
+BATCH_PROPERTIES = ("name", "size", "position", "title_bar_color", "border_color", "resizable", "topmost", "foreground", "minimized", "icon")
+CONFIGURE_PROPERTIES = BATCH_PROPERTIES + ("undestroyable", "scale_mode", "interpolation", "vsync", "target_fps", "skip_unchanged")
+
+# unit quad as a triangle strip, stretched to the target rectangle by the vertex shader
+QUAD_VERTICES = numpy.array([0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0], dtype=numpy.float32)
+
+IMAGE_VERTEX_SHADER = """
+#version 330 core
+layout(location = 0) in vec2 position;
+uniform vec4 u_rect;
+uniform vec4 u_texture_rect;
+out vec2 texture_coordinate;
+
+void main() {
+    gl_Position = vec4(mix(u_rect.xy, u_rect.zw, position), 0.0, 1.0);
+    texture_coordinate = mix(u_texture_rect.xy, u_texture_rect.zw, position);
+}
+"""
+
+IMAGE_FRAGMENT_SHADER = """
+#version 330 core
+in vec2 texture_coordinate;
+uniform sampler2D u_texture;
+uniform vec2 u_texture_limit;
+uniform float u_opacity;
+uniform int u_blend_mode;
+uniform bool u_colormapped;
+uniform sampler2D u_colormap;
+uniform vec2 u_value_range;
+out vec4 color;
+
+void main() {
+    // the storage can be larger than the frame, never sample the unused part
+    vec4 texel = texture(u_texture, min(texture_coordinate, u_texture_limit));
+    if (u_colormapped) {
+        // the raw value is mapped from the value range to the texel centers of the lookup table
+        float value = clamp((texel.r - u_value_range.x) / (u_value_range.y - u_value_range.x), 0.0, 1.0);
+        texel = vec4(texture(u_colormap, vec2((value * 255.0 + 0.5) / 256.0, 0.5)).rgb, 1.0);
+    }
+    float alpha = texel.a * u_opacity;
+    if (u_blend_mode < 0) {
+        // the frame itself is opaque
+        color = vec4(texel.rgb, 1.0);
+    } else if (u_blend_mode == 2) {
+        // multiply, the framebuffer is scaled by the color faded towards white
+        color = vec4(mix(vec3(1.0), texel.rgb, alpha), 1.0);
+    } else {
+        // premultiplied alpha, so normal, add and screen only differ in the blend function
+        color = vec4(texel.rgb * alpha, alpha);
+    }
+}
+"""
+
+YUV_FRAGMENT_SHADER = """
+#version 330 core
+in vec2 texture_coordinate;
+uniform sampler2D u_plane0;
+uniform sampler2D u_plane1;
+uniform sampler2D u_plane2;
+uniform vec2 u_plane_scale[3];
+uniform vec2 u_plane_limit[3];
+uniform int u_pixel_format;
+uniform vec2 u_frame_size;
+uniform mat3 u_matrix;
+uniform vec3 u_offset;
+out vec4 color;
+
+vec4 sample_plane(sampler2D plane, int index) {
+    return texture(plane, min(texture_coordinate * u_plane_scale[index], u_plane_limit[index]));
+}
+
+void main() {
+    vec3 yuv;
+    if (u_pixel_format == 0) {
+        // nv12, full resolution Y plane and half resolution interleaved UV plane
+        yuv = vec3(sample_plane(u_plane0, 0).r, sample_plane(u_plane1, 1).rg);
+    } else if (u_pixel_format == 1) {
+        // i420, full resolution Y plane and half resolution U and V planes
+        yuv = vec3(sample_plane(u_plane0, 0).r, sample_plane(u_plane1, 1).r, sample_plane(u_plane2, 2).r);
+    } else {
+        // yuyv, every RGBA texel holds Y0 U Y1 V of two pixels
+        ivec2 pixel = ivec2(min(texture_coordinate * u_frame_size, u_frame_size - 1.0));
+        vec4 texel = texelFetch(u_plane0, ivec2(pixel.x / 2, pixel.y), 0);
+        yuv = vec3(pixel.x % 2 == 0 ? texel.r : texel.b, texel.g, texel.a);
+    }
+    color = vec4(clamp(u_matrix * (yuv - u_offset), 0.0, 1.0), 1.0);
+}
+"""
+
+OVERLAY_VERTEX_SHADER = """
+#version 330 core
+layout(location = 0) in vec2 position;
+layout(location = 1) in vec2 atlas_position;
+layout(location = 2) in vec4 vertex_color;
+uniform vec4 u_transform;
+out vec2 texture_coordinate;
+out vec4 overlay_color;
+
+void main() {
+    // the vertices are in pixels of the frame, the transform maps them onto the quad of the frame
+    gl_Position = vec4(position * u_transform.xy + u_transform.zw, 0.0, 1.0);
+    texture_coordinate = atlas_position;
+    overlay_color = vertex_color;
+}
+"""
+
+OVERLAY_FRAGMENT_SHADER = """
+#version 330 core
+in vec2 texture_coordinate;
+in vec4 overlay_color;
+uniform sampler2D u_atlas;
+out vec4 color;
+
+void main() {
+    // shapes have no atlas position, glyphs take their coverage from the atlas
+    float coverage = texture_coordinate.x < 0.0 ? 1.0 : texture(u_atlas, texture_coordinate).r;
+    float alpha = overlay_color.a * coverage;
+    color = vec4(overlay_color.rgb * alpha, alpha);
+}
+"""
+
+# name: (vertex shader, fragment shader, uniforms)
+PROGRAMS = {
+    "image": (IMAGE_VERTEX_SHADER, IMAGE_FRAGMENT_SHADER, ("u_rect", "u_texture_rect", "u_texture_limit",
+                                                           "u_opacity", "u_blend_mode", "u_colormapped",
+                                                           "u_colormap", "u_value_range")),
+    "yuv": (IMAGE_VERTEX_SHADER, YUV_FRAGMENT_SHADER, ("u_rect", "u_texture_rect", "u_plane0", "u_plane1", "u_plane2",
+                                                       "u_plane_scale", "u_plane_limit", "u_pixel_format", "u_frame_size",
+                                                       "u_matrix", "u_offset")),
+    "overlay": (OVERLAY_VERTEX_SHADER, OVERLAY_FRAGMENT_SHADER, ("u_transform", "u_atlas")),
+}
+
+# the names of the OpenCV colormaps, used as lookup tables by the image shader
+COLORMAPS = ("autumn", "bone", "jet", "winter", "rainbow", "ocean", "summer", "spring", "cool", "hsv", "pink", "hot",
+             "parula", "magma", "inferno", "plasma", "viridis", "cividis", "twilight", "twilight_shifted", "turbo", "deepgreen")
+COLORMAP_SIZE = 256
+# "auto" value ranges are taken from about this many values, spread evenly over the frame
+AUTO_RANGE_SAMPLES = 16384
+AUTO_RANGE_PERCENTILES = (1, 99)
+
+# x, y, atlas u, atlas v, red, green, blue, alpha
+OVERLAY_VERTEX_SIZE = 8
+# the printable ASCII characters, other characters are drawn as "?"
+GLYPH_CHARACTERS = "".join(chr(code) for code in range(32, 127))
+GLYPH_THICKNESS = 2
+GLYPH_PADDING = 2
+
+# blend mode: (source factor, destination factor), the index of the mode is passed to the image shader
+BLEND_MODES = {
+    "normal": ("GL_ONE", "GL_ONE_MINUS_SRC_ALPHA"),
+    "add": ("GL_ONE", "GL_ONE"),
+    "multiply": ("GL_ZERO", "GL_SRC_COLOR"),
+    "screen": ("GL_ONE", "GL_ONE_MINUS_SRC_COLOR"),
+}
+
+YUV_PIXEL_FORMATS = ("nv12", "i420", "yuyv")
+# color space: (Kr, Kb)
+YUV_COLOR_SPACES = {"bt601": (0.299, 0.114), "bt709": (0.2126, 0.0722)}
+
+PROFILER_STAGES = ("prepare", "upload", "draw", "pace", "swap", "events")
+STAGE_PREPARE, STAGE_UPLOAD, STAGE_DRAW, STAGE_PACE, STAGE_SWAP, STAGE_EVENTS = range(len(PROFILER_STAGES))
+PROFILER_CAPACITY = 1024
+PROFILER_GPU_QUERIES = 4
+
+# EGL_PLATFORM_SURFACELESS_MESA, a display which needs neither a window system nor a GPU device file
+EGL_PLATFORM_SURFACELESS = 0x31DD
+
+# "SWFR", marks shared memory which holds a SharedFrameSource
+SHARED_FRAME_MAGIC = 0x53574652
+SHARED_FRAME_SLOTS = 3
+SHARED_FRAME_MAX_DIMENSIONS = 4
+# int64 magic, slot count, number of dimensions, shape and latest sequence, followed by the dtype string
+SHARED_FRAME_HEADER_SIZE = 128
+SHARED_FRAME_DTYPE_OFFSET = 64
+SHARED_FRAME_DTYPE_SIZE = 16
+# the frames start on a cache line, rows of 4 byte pixels can be uploaded without any realignment
+SHARED_FRAME_ALIGNMENT = 64
+
+
+def _init_glfw():
+    """
+    Initialize GLFW once per process
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    bool
+        If GLFW is initialized
+    """
+    global _glfw_initialized, _glfw_thread
+    with _glfw_lock:
+        if _glfw_initialized == False:
+            _glfw_initialized = bool(glfw.init())
+            _glfw_thread = threading.get_ident() if _glfw_initialized else None
+        return _glfw_initialized
+
+
+def _check_async_thread():
+    """
+    Make sure GLFW can be used from the thread of the running event loop, the async methods create and poll
+    the windows on that thread
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    """
+    if sys.platform == "darwin" and threading.current_thread() is not threading.main_thread():
+        raise RuntimeError("SimpleWindow: on macOS the async methods need an event loop which runs on the main thread")
+    if _glfw_thread != None and _glfw_thread != threading.get_ident():
+        raise RuntimeError("SimpleWindow: GLFW was initialized on another thread, "
+                           "the async methods need an event loop which runs on that thread")
+
+
+def _set_future(future, result, exception):
+    """
+    Resolve an asyncio future of Window.show_async() on the thread of its event loop
+
+    Parameters
+    ----------
+    future : asyncio.Future
+        The future, nothing happens if it was cancelled
+    result : any
+        The result
+    exception : Exception
+        The exception to raise instead, None to set the result
+
+    Returns
+    -------
+    None
+    """
+    if future.done():
+        return
+    if exception != None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+
+
+def _resolve_waiter(waiter: tuple, result, exception=None):
+    """
+    Resolve the future of a frame from Window.show_async() from any thread
+
+    Parameters
+    ----------
+    waiter : tuple
+        The event loop and the future
+    result : any
+        The result
+    exception : Exception, optional
+        The exception to raise instead
+
+    Returns
+    -------
+    None
+    """
+    loop, future = waiter
+    if loop.is_closed() == False:
+        loop.call_soon_threadsafe(_set_future, future, result, exception)
+
+
+def _make_context_current(window):
+    """
+    Make the context of the window current on this thread, skips the call if it already is
+
+    Parameters
+    ----------
+    window : glfw window or _EGLContext
+        The window or the context of a headless window, None to release the current context
+
+    Returns
+    -------
+    None
+    """
+    current = getattr(_current_context, "window", None)
+    if current is not window:
+        if isinstance(window, _EGLContext):
+            window.make_current()
+        elif window == None and isinstance(current, _EGLContext):
+            current.release()
+        else:
+            glfw.make_context_current(window)
+        _current_context.window = window
+
+
+def _set_context_hints():
+    """
+    Request a core profile OpenGL 3.3 context for the next created window
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    """
+    glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, 3)
+    glfw.window_hint(glfw.CONTEXT_VERSION_MINOR, 3)
+    glfw.window_hint(glfw.OPENGL_PROFILE, glfw.OPENGL_CORE_PROFILE)
+    glfw.window_hint(glfw.OPENGL_FORWARD_COMPAT, glfw.TRUE)
+
+
+def _create_context_window(width: int, height: int, name: str, share=None, visible: bool = True):
+    """
+    Create a GLFW window with a core profile OpenGL 3.3 context
+
+    Parameters
+    ----------
+    width : int
+        The width of the window
+    height : int
+        The height of the window
+    name : str
+        The title of the window
+    share : glfw window, optional
+        The window to share the GL objects with
+    visible : bool, optional
+        Whether the window is shown
+
+    Returns
+    -------
+    glfw window
+        The created window
+    """
+    _set_context_hints()
+    glfw.window_hint(glfw.VISIBLE, glfw.TRUE if visible else glfw.FALSE)
+    window = glfw.create_window(width, height, name, None, share)
+    glfw.window_hint(glfw.VISIBLE, glfw.TRUE)
+    # a failed creation returns a NULL pointer, which is falsy but not None
+    if not window:
+        # drivers which only offer OpenGL 2.1, like the GDI fallback over Remote Desktop, fail here
+        raise RuntimeError("SimpleWindow: could not create a window with an OpenGL 3.3 core profile context, "
+                           "the graphics driver does not support it (Remote Desktop or a missing GPU driver)")
+    return window
+
+
+def _get_backend():
+    """
+    Get the platform backend, the Win32 backend on Windows and the GLFW only fallback everywhere else
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    _GLFWBackend
+        The backend of this process
+    """
+    global _backend
+    if _backend == None:
+        backend = None
+        if sys.platform == "win32":
+            try:
+                backend = _Win32Backend()
+            except ImportError:
+                pass
+        _backend = backend if backend != None else _GLFWBackend()
+    return _backend
+
+
+class _GLFWBackend:
+    # MARK: prepare_process()
+    def prepare_process(self):
+        """
+        Prepare the process before the first window is created
 
-class Window:
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        pass
+
+
+    # MARK: get_handle()
+    def get_handle(self, window):
+        """
+        Get the native handle of the window
+
+        Parameters
+        ----------
+        window : glfw window
+            The window
+
+        Returns
+        -------
+        int
+            The native handle, None if not available
+        """
+        return None
+
+
+    # MARK: set_title_bar_color()
+    def set_title_bar_color(self, window, handle: int, color: tuple):
+        """
+        Set the title bar color of the window
+
+        Parameters
+        ----------
+        window : glfw window
+            The window
+        handle : int
+            The native handle of the window
+        color : tuple
+            The color of the title bar as (int, int, int)
+
+        Returns
+        -------
+        bool
+            If the color is supported on this platform
+        """
+        return False
+
+
+    # MARK: set_border_color()
+    def set_border_color(self, window, handle: int, color: tuple):
+        """
+        Set the border color of the window
+
+        Parameters
+        ----------
+        window : glfw window
+            The window
+        handle : int
+            The native handle of the window
+        color : tuple
+            The color of the border as (int, int, int)
+
+        Returns
+        -------
+        bool
+            If the color is supported on this platform
+        """
+        return False
+
+
+    # MARK: set_placement()
+    def set_placement(self, window, handle: int, position: tuple, size: tuple, insert_after: str, activate: bool):
+        """
+        Move, resize and restack the window with as few calls as possible
+
+        Parameters
+        ----------
+        window : glfw window
+            The window
+        handle : int
+            The native handle of the window
+        position : tuple
+            The new position of the window, None to keep it
+        size : tuple
+            The new size of the window, None to keep it
+        insert_after : str
+            Where the window goes in the stacking order, "top", "bottom", "topmost", "notopmost" or None to keep it
+        activate : bool
+            If the window should get the input focus
+
+        Returns
+        -------
+        bool
+            If the change is supported on this platform
+        """
+        if position != None and size != None:
+            # moves and resizes a windowed window in one request
+            glfw.set_window_monitor(window, None, position[0], position[1], size[0], size[1], glfw.DONT_CARE)
+        elif position != None:
+            glfw.set_window_pos(window, position[0], position[1])
+        elif size != None:
+            glfw.set_window_size(window, size[0], size[1])
+        if insert_after in ("topmost", "notopmost"):
+            glfw.set_window_attrib(window, glfw.FLOATING, glfw.TRUE if insert_after == "topmost" else glfw.FALSE)
+        if activate:
+            glfw.focus_window(window)
+        return insert_after != "bottom"
+
+
+    # MARK: get_foreground()
+    def get_foreground(self, window, handle: int):
+        """
+        Get if the window is in the foreground
+
+        Parameters
+        ----------
+        window : glfw window
+            The window
+        handle : int
+            The native handle of the window
+
+        Returns
+        -------
+        bool
+            If the window is in the foreground
+        """
+        return glfw.get_window_attrib(window, glfw.FOCUSED) == glfw.TRUE
+
+
+    # MARK: set_minimized()
+    def set_minimized(self, window, handle: int, state: bool):
+        """
+        Minimize or restore the window
+
+        Parameters
+        ----------
+        window : glfw window
+            The window
+        handle : int
+            The native handle of the window
+        state : bool
+            If the window should be minimized
+
+        Returns
+        -------
+        None
+        """
+        if state:
+            glfw.iconify_window(window)
+        else:
+            glfw.restore_window(window)
+
+
+    # MARK: get_minimized()
+    def get_minimized(self, window, handle: int):
+        """
+        Get if the window is minimized
+
+        Parameters
+        ----------
+        window : glfw window
+            The window
+        handle : int
+            The native handle of the window
+
+        Returns
+        -------
+        bool
+            If the window is minimized
+        """
+        return glfw.get_window_attrib(window, glfw.ICONIFIED) == glfw.TRUE
+
+
+    # MARK: set_icon()
+    def set_icon(self, window, handle: int, icon: str):
+        """
+        Set the icon of the window
+
+        Parameters
+        ----------
+        window : glfw window
+            The window
+        handle : int
+            The native handle of the window
+        icon : str
+            The path to the .ico icon
+
+        Returns
+        -------
+        bool
+            If the icon could be set on this platform
+        """
+        image = _load_icon(icon)
+        # macOS has no window icons, Wayland leaves them to the desktop entry of the application
+        wayland = hasattr(glfw, "get_platform") and glfw.get_platform() == glfw.PLATFORM_WAYLAND
+        if image is None or sys.platform == "darwin" or wayland:
+            return False
+        height, width = image.shape[:2]
+        glfw.set_window_icon(window, 1, [(width, height, cv2.cvtColor(image, cv2.COLOR_BGRA2RGBA))])
+        return True
+
+
+class _Win32Backend(_GLFWBackend):
     # MARK: __init__()
-    def __init__(self,
-                 name: str,
-                 size: tuple = (None, None),
-                 position: tuple = (None, None),
-                 title_bar_color: tuple = (None, None, None),
-                 border_color: tuple = (None, None, None),
-                 resizable: bool = True,
-                 topmost: bool = False,
-                 foreground: bool = True,
-                 minimized: bool = False,
-                 undestroyable: bool = False,
-                 icon: str = "",
-                 no_warnings: bool = False):
+    def __init__(self):
+        """
+        Backend which uses the Win32 and DWM APIs for the features GLFW does not cover
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self._win32gui = importlib.import_module("win32gui")
+        self._win32con = importlib.import_module("win32con")
+        self._wintypes = importlib.import_module("ctypes.wintypes")
+        self._windll = ctypes.windll
+
+
+    # MARK: prepare_process()
+    def prepare_process(self):
+        # some windows magic so that the icon is also shown int the taskbar
+        self._windll.shell32.SetCurrentProcessExplicitAppUserModelID("Python.Pip.Modules.SimpleWindow.PyPI.GitHub.OleFranz")
+
+
+    # MARK: get_handle()
+    def get_handle(self, window):
+        return glfw.get_win32_window(window)
+
+
+    # MARK: set_title_bar_color()
+    def set_title_bar_color(self, window, handle: int, color: tuple):
+        self._windll.dwmapi.DwmSetWindowAttribute(handle, 35, ctypes.byref(ctypes.c_int((max(0, min(255, round(color[0]))) << 16) | (max(0, min(255, round(color[1]))) << 8) | max(0, min(255, round(color[2]))))), ctypes.sizeof(ctypes.c_int))
+        return True
+
+
+    # MARK: set_border_color()
+    def set_border_color(self, window, handle: int, color: tuple):
+        self._windll.dwmapi.DwmSetWindowAttribute(handle, 34, ctypes.byref(ctypes.c_int((max(0, min(255, round(color[0]))) << 16) | (max(0, min(255, round(color[1]))) << 8) | max(0, min(255, round(color[2]))))), ctypes.sizeof(ctypes.c_int))
+        return True
+
+
+    # MARK: set_placement()
+    def set_placement(self, window, handle: int, position: tuple, size: tuple, insert_after: str, activate: bool):
+        win32con, user32 = self._win32con, self._windll.user32
+        flags = 0 if activate else win32con.SWP_NOACTIVATE
+        # the ignored parts of the rectangle are left at 0, SWP_NOMOVE and SWP_NOSIZE make SetWindowPos skip them
+        if position == None:
+            flags |= win32con.SWP_NOMOVE
+        if size == None:
+            flags |= win32con.SWP_NOSIZE
+        if insert_after == None:
+            flags |= win32con.SWP_NOZORDER
+        x, y = position if position != None else (0, 0)
+        width, height = size if size != None else (0, 0)
+        # GLFW positions and sizes refer to the client area, SetWindowPos to the whole window with its frame
+        rect = self._wintypes.RECT(x, y, x + width, y + height)
+        style = self._win32gui.GetWindowLong(handle, win32con.GWL_STYLE)
+        ex_style = self._win32gui.GetWindowLong(handle, win32con.GWL_EXSTYLE)
+        if hasattr(user32, "AdjustWindowRectExForDpi"):
+            user32.AdjustWindowRectExForDpi(ctypes.byref(rect), style, False, ex_style, user32.GetDpiForWindow(handle))
+        else:
+            user32.AdjustWindowRectEx(ctypes.byref(rect), style, False, ex_style)
+        insert_after = {None: 0, "top": win32con.HWND_TOP, "bottom": win32con.HWND_BOTTOM,
+                        "topmost": win32con.HWND_TOPMOST, "notopmost": win32con.HWND_NOTOPMOST}[insert_after]
+        self._win32gui.SetWindowPos(handle, insert_after, rect.left, rect.top, rect.right - rect.left, rect.bottom - rect.top, flags)
+        return True
+
+
+    # MARK: get_foreground()
+    def get_foreground(self, window, handle: int):
+        return handle == self._win32gui.GetForegroundWindow()
+
+
+    # MARK: set_minimized()
+    def set_minimized(self, window, handle: int, state: bool):
+        self._win32gui.ShowWindow(handle, self._win32con.SW_MINIMIZE if state else self._win32con.SW_RESTORE)
+
+
+    # MARK: get_minimized()
+    def get_minimized(self, window, handle: int):
+        return int(self._win32gui.IsIconic(handle)) == 1
+
+
+    # MARK: set_icon()
+    def set_icon(self, window, handle: int, icon: str):
+        win32gui, win32con = self._win32gui, self._win32con
+        icon_handle = win32gui.LoadImage(None, icon, win32con.IMAGE_ICON, 0, 0, win32con.LR_LOADFROMFILE | win32con.LR_DEFAULTSIZE)
+        win32gui.SendMessage(handle, win32con.WM_SETICON, win32con.ICON_SMALL, icon_handle)
+        win32gui.SendMessage(handle, win32con.WM_SETICON, win32con.ICON_BIG, icon_handle)
+        return True
+
+
+class _HeadlessBackend(_GLFWBackend):
+    # MARK: set_placement()
+    def set_placement(self, window, handle: int, position: tuple, size: tuple, insert_after: str, activate: bool):
+        return False
+
+
+    # MARK: get_foreground()
+    def get_foreground(self, window, handle: int):
+        return False
+
+
+    # MARK: set_minimized()
+    def set_minimized(self, window, handle: int, state: bool):
+        pass
+
+
+    # MARK: get_minimized()
+    def get_minimized(self, window, handle: int):
+        return False
+
+
+class _EGLContext:
+    # MARK: __init__()
+    def __init__(self):
+        """
+        Create an OpenGL 3.3 core profile context through EGL without any window, for headless windows
+        on machines without a display server, it renders into framebuffer objects only
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        if "OpenGL" not in sys.modules:
+            # PyOpenGL loads the GL functions through the platform it is first imported with
+            os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+        egl = importlib.import_module("OpenGL.EGL")
+        self._egl = egl
+
+        display = None
+        try:
+            display = egl.eglGetPlatformDisplayEXT(EGL_PLATFORM_SURFACELESS, egl.EGL_DEFAULT_DISPLAY, None)
+        except Exception:
+            pass
+        if not display:
+            display = egl.eglGetDisplay(egl.EGL_DEFAULT_DISPLAY)
+        major, minor = egl.EGLint(), egl.EGLint()
+        if not display or not egl.eglInitialize(display, ctypes.byref(major), ctypes.byref(minor)):
+            raise RuntimeError("SimpleWindow: could not initialize EGL for the headless window")
+
+        config_attributes = (egl.EGLint * 5)(egl.EGL_RENDERABLE_TYPE, egl.EGL_OPENGL_BIT, egl.EGL_SURFACE_TYPE, 0, egl.EGL_NONE)
+        config, count = egl.EGLConfig(), egl.EGLint()
+        if not egl.eglChooseConfig(display, config_attributes, ctypes.byref(config), 1, ctypes.byref(count)) or count.value == 0:
+            raise RuntimeError("SimpleWindow: no EGL config with OpenGL support for the headless window")
+        egl.eglBindAPI(egl.EGL_OPENGL_API)
+        context_attributes = (egl.EGLint * 7)(egl.EGL_CONTEXT_MAJOR_VERSION, 3, egl.EGL_CONTEXT_MINOR_VERSION, 3,
+                                              egl.EGL_CONTEXT_OPENGL_PROFILE_MASK, egl.EGL_CONTEXT_OPENGL_CORE_PROFILE_BIT,
+                                              egl.EGL_NONE)
+        context = egl.eglCreateContext(display, config, egl.EGL_NO_CONTEXT, context_attributes)
+        if not context:
+            raise RuntimeError("SimpleWindow: could not create an OpenGL 3.3 context through EGL")
+        self.display = display
+        self.context = context
+
+
+    # MARK: make_current()
+    def make_current(self):
+        """
+        Make the context current on this thread
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self._egl.eglMakeCurrent(self.display, self._egl.EGL_NO_SURFACE, self._egl.EGL_NO_SURFACE, self.context)
+
+
+    # MARK: release()
+    def release(self):
+        """
+        Release the context from this thread
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self._egl.eglMakeCurrent(self.display, self._egl.EGL_NO_SURFACE, self._egl.EGL_NO_SURFACE, self._egl.EGL_NO_CONTEXT)
+
+
+    # MARK: destroy()
+    def destroy(self):
+        """
+        Destroy the context
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self._egl.eglDestroyContext(self.display, self.context)
+        self.context = None
+
+
+def _box_filter(image: numpy.ndarray, factor: int):
+    """
+    Average every block of factor x factor pixels, the blocks which are cut off at the edges are padded with
+    copies of the edge pixels, the image is filtered in chunks of rows so only a few rows are held as float at once
+
+    Parameters
+    ----------
+    image : numpy.ndarray
+        The image with 1 or more channels
+    factor : int
+        The width and height of a block
+
+    Returns
+    -------
+    numpy.ndarray
+        The filtered image with the same dtype, its size is the size of the image divided by the factor, rounded up
+    """
+    if factor == 1:
+        return image
+    height, width = image.shape[:2]
+    channels = image.shape[2:]
+    output_height, output_width = -(-height // factor), -(-width // factor)
+    output = numpy.empty((output_height, output_width) + channels, dtype=image.dtype)
+    rows = max(1, TILE_FILTER_CHUNK // (factor * factor * output_width))
+    for start in range(0, output_height, rows):
+        block = image[start * factor:(start + rows) * factor]
+        padding = ((0, -block.shape[0] % factor), (0, -width % factor)) + ((0, 0),) * len(channels)
+        if padding[0][1] > 0 or padding[1][1] > 0:
+            block = numpy.pad(block, padding, mode="edge")
+        block = block.reshape((block.shape[0] // factor, factor, output_width, factor) + channels)
+        block = block.mean(axis=(1, 3), dtype=numpy.float32)
+        if numpy.issubdtype(image.dtype, numpy.integer):
+            block = numpy.rint(block)
+        output[start:start + rows] = block
+    return output
+
+
+def _get_yuv_matrix(color_space: str, full_range: bool):
+    """
+    Get the matrix and offset which convert normalized YUV values to RGB
+
+    Parameters
+    ----------
+    color_space : str
+        "bt601" or "bt709"
+    full_range : bool
+        If the values use the full range 0 to 255 instead of the limited range 16 to 235 (240 for chroma)
+
+    Returns
+    -------
+    tuple
+        The 3x3 matrix as numpy.ndarray and the offset which is subtracted before the multiplication
+    """
+    kr, kb = YUV_COLOR_SPACES[color_space]
+    kg = 1 - kr - kb
+    matrix = numpy.array([[1, 0, 2 * (1 - kr)],
+                          [1, -2 * kb * (1 - kb) / kg, -2 * kr * (1 - kr) / kg],
+                          [1, 2 * (1 - kb), 0]], dtype=numpy.float32)
+    if full_range:
+        return matrix, (0.0, 128 / 255, 128 / 255)
+    return matrix * numpy.array([255 / 219, 255 / 224, 255 / 224], dtype=numpy.float32), (16 / 255, 128 / 255, 128 / 255)
+
+
+def _load_icon(path: str):
+    """
+    Load the largest image of an .ico file, OpenCV has no decoder for icons, so the image is taken out of the file
+    and decoded as the PNG or the bitmap it is stored as
+
+    Parameters
+    ----------
+    path : str
+        The path to the .ico icon
+
+    Returns
+    -------
+    numpy.ndarray
+        The bgra uint8 image, None if the file is no valid icon
+    """
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+        _, kind, count = numpy.frombuffer(data, dtype="<u2", count=3)
+        entries = numpy.frombuffer(data, dtype=[("width", "u1"), ("height", "u1"), ("colors", "u1"), ("reserved", "u1"), ("planes", "<u2"),
+                                                ("bits", "<u2"), ("size", "<u4"), ("offset", "<u4")], count=count, offset=6)
+    except (OSError, ValueError):
+        return None
+    if kind != 1 or count == 0:
+        return None
+    # a width of 0 stands for 256 pixels
+    entry = max(entries, key=lambda entry: ((int(entry["width"]) - 1) % 256, int(entry["bits"])))
+    image = data[int(entry["offset"]):int(entry["offset"]) + int(entry["size"])]
+    if image[:8] == b"\x89PNG\r\n\x1a\n":
+        image = cv2.imdecode(numpy.frombuffer(image, dtype=numpy.uint8), cv2.IMREAD_UNCHANGED)
+    else:
+        if len(image) < 40:
+            return None
+        header_size, width, height = numpy.frombuffer(image, dtype="<i4", count=3).tolist()
+        bits = int(numpy.frombuffer(image, dtype="<u2", count=1, offset=14)[0])
+        colors = int(numpy.frombuffer(image, dtype="<u4", count=1, offset=32)[0]) or (1 << bits if bits <= 8 else 0)
+        height //= 2
+        # the bitmap stores the color image and a 1 bit transparency mask below it, so its height is doubled,
+        # with a file header and the real height it is a regular bitmap file
+        pixels_offset = 14 + header_size + colors * 4
+        info = bytearray(image[:header_size])
+        info[8:12] = int(height).to_bytes(4, "little", signed=True)
+        bitmap = b"BM" + (14 + len(image)).to_bytes(4, "little") + bytes(4) + pixels_offset.to_bytes(4, "little") + bytes(info) + image[header_size:]
+        color = cv2.imdecode(numpy.frombuffer(bitmap, dtype=numpy.uint8), cv2.IMREAD_UNCHANGED)
+        if color is None:
+            return None
+        if bits == 32:
+            # the alpha channel of 32 bit bitmaps is read from the raw rows, the rows are stored bottom up
+            alpha = numpy.frombuffer(image, dtype=numpy.uint8, count=width * height * 4,
+                                     offset=pixels_offset - 14).reshape(height, width, 4)[::-1, :, 3]
+        else:
+            stride = (width + 31) // 32 * 4
+            mask_offset = pixels_offset - 14 + (width * bits + 31) // 32 * 4 * height
+            mask = numpy.frombuffer(image, dtype=numpy.uint8, count=stride * height, offset=mask_offset).reshape(height, stride)
+            alpha = numpy.where(numpy.unpackbits(mask, axis=1)[::-1, :width] == 1, 0, 255).astype(numpy.uint8)
+        color = color[:, :, :3] if color.ndim == 3 else cv2.cvtColor(color, cv2.COLOR_GRAY2BGR)
+        image = numpy.dstack((color, alpha))
+    if image is None:
+        return None
+    if image.ndim == 2:
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2BGRA)
+    return image if image.shape[2] == 4 else cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
+
+
+_glyph_atlas = None
+_colormap_luts = {}
+
+
+def _get_colormap_lut(colormap):
+    """
+    Get the key of a colormap lookup table, the table is built on first use and kept in _colormap_luts
+
+    Parameters
+    ----------
+    colormap : str or numpy.ndarray
+        One of COLORMAPS or a custom lookup table of COLORMAP_SIZE bgr uint8 colors
+
+    Returns
+    -------
+    hashable
+        The key of the lookup table in _colormap_luts, None if the colormap is not valid
+    """
+    if isinstance(colormap, str):
+        if colormap not in COLORMAPS or hasattr(cv2, "COLORMAP_" + colormap.upper()) == False:
+            return None
+        if colormap not in _colormap_luts:
+            ramp = numpy.arange(COLORMAP_SIZE, dtype=numpy.uint8).reshape(1, COLORMAP_SIZE)
+            _colormap_luts[colormap] = cv2.applyColorMap(ramp, getattr(cv2, "COLORMAP_" + colormap.upper())).reshape(COLORMAP_SIZE, 3)
+        return colormap
+    lut = numpy.asarray(colormap)
+    if lut.dtype != numpy.uint8 or lut.size != COLORMAP_SIZE * 3:
+        return None
+    lut = numpy.ascontiguousarray(lut.reshape(COLORMAP_SIZE, 3))
+    key = ("custom", zlib.crc32(lut))
+    _colormap_luts.setdefault(key, lut)
+    return key
+
+
+def _get_glyph_atlas():
+    """
+    Get the glyph atlas for overlay text, rendered once with cv2.putText at a font scale of 1
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    tuple
+        The uint8 atlas as numpy.ndarray, the atlas rectangles (u0, v0, u1, v1) of the glyphs,
+        their advances, and the ascent and height of a glyph cell in pixels
+    """
+    global _glyph_atlas
+    if _glyph_atlas == None:
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        sizes = [cv2.getTextSize(character, font, 1.0, GLYPH_THICKNESS) for character in GLYPH_CHARACTERS]
+        ascent = max(size[1] for (size, baseline) in sizes) + GLYPH_PADDING
+        height = ascent + max(baseline for (size, baseline) in sizes) + GLYPH_PADDING
+        advances = numpy.array([size[0] for (size, baseline) in sizes], dtype=numpy.float32)
+        cell_widths = advances.astype(numpy.int32) + 2 * GLYPH_PADDING
+        lefts = numpy.concatenate(([0], numpy.cumsum(cell_widths)[:-1]))
+
+        atlas = numpy.zeros((height, int(cell_widths.sum())), dtype=numpy.uint8)
+        for character, left in zip(GLYPH_CHARACTERS, lefts):
+            cv2.putText(atlas, character, (int(left) + GLYPH_PADDING, ascent), font, 1.0, 255, GLYPH_THICKNESS, cv2.LINE_AA)
+
+        rectangles = numpy.stack((lefts / atlas.shape[1], numpy.zeros(len(lefts)),
+                                  (lefts + cell_widths) / atlas.shape[1], numpy.ones(len(lefts))), axis=1).astype(numpy.float32)
+        _glyph_atlas = (atlas, rectangles, advances, ascent, height)
+    return _glyph_atlas
+
+
+def _get_overlay_colors(colors, count: int):
+    """
+    Convert overlay colors to normalized RGBA
+
+    Parameters
+    ----------
+    colors : tuple or numpy.ndarray
+        One (b, g, r) or (b, g, r, a) color from 0 to 255 for all shapes, or one color per shape
+    count : int
+        The number of shapes
+
+    Returns
+    -------
+    numpy.ndarray
+        The (count, 4) float32 colors from 0 to 1
+    """
+    colors = numpy.asarray(colors, dtype=numpy.float32).reshape(-1, numpy.shape(colors)[-1])
+    if colors.shape[1] == 3:
+        colors = numpy.concatenate((colors, numpy.full((len(colors), 1), 255, dtype=numpy.float32)), axis=1)
+    colors = colors[:, [2, 1, 0, 3]] / 255
+    return numpy.broadcast_to(colors, (count, 4))
+
+
+def _get_overlay_vertices(corners: tuple, colors: numpy.ndarray, atlas_rectangles: numpy.ndarray = None):
+    """
+    Build the triangles of quads for the overlay vertex buffer
+
+    Parameters
+    ----------
+    corners : tuple
+        The top left, top right, bottom left and bottom right corners of the quads as (count, 2) arrays
+    colors : numpy.ndarray
+        The (count, 4) normalized RGBA colors of the quads
+    atlas_rectangles : numpy.ndarray, optional
+        The (count, 4) atlas rectangles (u0, v0, u1, v1) of glyph quads, None for solid quads
+
+    Returns
+    -------
+    numpy.ndarray
+        The (count * 6, OVERLAY_VERTEX_SIZE) float32 vertices
+    """
+    top_left, top_right, bottom_left, bottom_right = corners
+    count = len(top_left)
+    vertices = numpy.empty((count, 6, OVERLAY_VERTEX_SIZE), dtype=numpy.float32)
+    for index, corner in enumerate((top_left, top_right, bottom_left, top_right, bottom_right, bottom_left)):
+        vertices[:, index, 0:2] = corner
+    if atlas_rectangles is None:
+        vertices[:, :, 2:4] = -1.0
+    else:
+        u0, v0, u1, v1 = atlas_rectangles.T
+        for index, (u, v) in enumerate(((u0, v0), (u1, v0), (u0, v1), (u1, v0), (u1, v1), (u0, v1))):
+            vertices[:, index, 2] = u
+            vertices[:, index, 3] = v
+    vertices[:, :, 4:8] = colors[:, None, :]
+    return vertices.reshape(-1, OVERLAY_VERTEX_SIZE)
+
+
+class _Program:
+    # MARK: __init__()
+    def __init__(self, vertex_shader: str, fragment_shader: str, uniforms: tuple):
+        """
+        Compile and link a shader program
+        A current GL context is required
+
+        Parameters
+        ----------
+        vertex_shader : str
+            The source of the vertex shader
+        fragment_shader : str
+            The source of the fragment shader
+        uniforms : tuple
+            The names of the uniforms whose locations are looked up once
+
+        Returns
+        -------
+        None
+        """
+        shaders = []
+        for shader_type, source in ((gl.GL_VERTEX_SHADER, vertex_shader), (gl.GL_FRAGMENT_SHADER, fragment_shader)):
+            shader = gl.glCreateShader(shader_type)
+            gl.glShaderSource(shader, source)
+            gl.glCompileShader(shader)
+            if gl.glGetShaderiv(shader, gl.GL_COMPILE_STATUS) != gl.GL_TRUE:
+                raise RuntimeError("SimpleWindow: failed to compile shader: " + str(gl.glGetShaderInfoLog(shader)))
+            shaders.append(shader)
+
+        self.id = gl.glCreateProgram()
+        for shader in shaders:
+            gl.glAttachShader(self.id, shader)
+        gl.glLinkProgram(self.id)
+        if gl.glGetProgramiv(self.id, gl.GL_LINK_STATUS) != gl.GL_TRUE:
+            raise RuntimeError("SimpleWindow: failed to link shader program: " + str(gl.glGetProgramInfoLog(self.id)))
+        for shader in shaders:
+            gl.glDetachShader(self.id, shader)
+            gl.glDeleteShader(shader)
+
+        self.uniforms = {name: gl.glGetUniformLocation(self.id, name) for name in uniforms}
+
+
+class _Texture:
+    # MARK: __init__()
+    def __init__(self, bucket: int = TEXTURE_BUCKET):
+        """
+        Create a 2D texture whose storage is only reallocated when a frame does not fit into it
+        The size of the storage is tracked in Python, so no GL queries are needed per frame
+        A current GL context is required
+
+        Parameters
+        ----------
+        bucket : int, optional
+            The storage grows in steps of this many pixels, 1 for storage of exactly the size of the frame
+
+        Returns
+        -------
+        None
+        """
+        self.id = gl.glGenTextures(1)
+        self.bucket = bucket
+        self.capacity = (0, 0)
+        self.size = (0, 0)
+        self.internal_format = None
+        self.swizzle = None
+        self.filter = None
+        self.content = None
+        self.mipmapped = False
+        self.allocations = 0
+
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.id)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
+
+
+    # MARK: reserve()
+    def reserve(self, width: int, height: int, internal_format: int):
+        """
+        Make sure the bound texture can hold a frame of the given size and format
+        The storage only grows, in steps of the bucket size, and is only
+        shrunk again when the frame uses less than a quarter of it
+
+        Parameters
+        ----------
+        width : int
+            The width of the frame
+        height : int
+            The height of the frame
+        internal_format : int
+            The GL internal format of the texture
+
+        Returns
+        -------
+        bool
+            If the storage was reallocated
+        """
+        self.size = (width, height)
+        capacity_width, capacity_height = self.capacity
+        if (internal_format == self.internal_format and width <= capacity_width and height <= capacity_height and
+            width * height * 4 >= capacity_width * capacity_height):
+            return False
+
+        capacity_width = -(-width // self.bucket) * self.bucket
+        capacity_height = -(-height // self.bucket) * self.bucket
+        gl.glTexImage2D(
+            gl.GL_TEXTURE_2D,
+            0,
+            internal_format,
+            capacity_width,
+            capacity_height,
+            0,
+            gl.GL_RED,
+            gl.GL_UNSIGNED_BYTE,
+            None
+        )
+        self.capacity = (capacity_width, capacity_height)
+        self.internal_format = internal_format
+        self.allocations += 1
+        if self.mipmapped:
+            # the new storage has no mipmaps, so the filter must not use them anymore
+            self.mipmapped = False
+            self.filter = None
+        return True
+
+
+    # MARK: set_swizzle()
+    def set_swizzle(self, swizzle: tuple):
+        """
+        Set which channels the bound texture returns when it is sampled
+
+        Parameters
+        ----------
+        swizzle : tuple
+            The GL sources for the red, green, blue and alpha channel
+
+        Returns
+        -------
+        None
+        """
+        if swizzle != self.swizzle:
+            gl.glTexParameteriv(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_SWIZZLE_RGBA, swizzle)
+            self.swizzle = swizzle
+
+
+    # MARK: set_filter()
+    def set_filter(self, gl_filter: int):
+        """
+        Set the minification and magnification filter of the bound texture
+
+        Parameters
+        ----------
+        gl_filter : int
+            GL_NEAREST or GL_LINEAR
+
+        Returns
+        -------
+        None
+        """
+        if gl_filter != self.filter:
+            minification = gl.GL_LINEAR_MIPMAP_LINEAR if self.mipmapped and gl_filter == gl.GL_LINEAR else gl_filter
+            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, minification)
+            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl_filter)
+            self.filter = gl_filter
+
+
+    # MARK: generate_mipmaps()
+    def generate_mipmaps(self):
+        """
+        Generate the mipmaps of the bound texture, the linear filter then uses them for minification
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        gl.glGenerateMipmap(gl.GL_TEXTURE_2D)
+        if self.mipmapped == False:
+            self.mipmapped = True
+            self.filter = None
+
+
+    # MARK: get_texture_limit()
+    def get_texture_limit(self):
+        """
+        Get the largest texture coordinates which only sample the current frame
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        tuple
+            The texture coordinates (u, v) of the center of the bottom right pixel of the frame
+        """
+        if self.capacity[0] == 0 or self.capacity[1] == 0:
+            return 1.0, 1.0
+        return (self.size[0] - 0.5) / self.capacity[0], (self.size[1] - 0.5) / self.capacity[1]
+
+
+    # MARK: get_texture_scale()
+    def get_texture_scale(self):
+        """
+        Get the part of the storage which is covered by the current frame
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        tuple
+            The texture coordinates (u, v) of the bottom right corner of the frame
+        """
+        if self.capacity[0] == 0 or self.capacity[1] == 0:
+            return 1.0, 1.0
+        return self.size[0] / self.capacity[0], self.size[1] / self.capacity[1]
+
+
+class _Layer:
+    # MARK: __init__()
+    def __init__(self):
+        """
+        Create a layer which is composited on top of the frame of a window
+        The frame of the layer is kept, so it can be uploaded again when the window is created again
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self.frame = None
+        self.channel_order = None
+        self.position = (0, 0)
+        self.scale = 1.0
+        self.opacity = 1.0
+        self.blend_mode = "normal"
+        self.z = 0
+        self.texture = None
+        self.size = (0, 0)
+        self.changed = False
+
+
+class _FrameProfiler:
+    # MARK: __init__()
+    def __init__(self, capacity: int = PROFILER_CAPACITY):
+        """
+        Record the CPU time of every stage of a frame and the GPU time of the upload and draw
+        into a fixed size ring buffer, recording a stage only costs a perf_counter() call and two array writes
+
+        Parameters
+        ----------
+        capacity : int, optional
+            The number of frames to keep
+
+        Returns
+        -------
+        None
+        """
+        self.capacity = capacity
+        self.starts = numpy.zeros((capacity, len(PROFILER_STAGES)))
+        self.durations = numpy.full((capacity, len(PROFILER_STAGES)), numpy.nan)
+        self.gpu_starts = numpy.zeros(capacity)
+        self.gpu_durations = numpy.full(capacity, numpy.nan)
+        self.frame = 0
+        self.row = 0
+        self.last = 0.0
+        self.gpu_queries = None
+        self.gpu_pending = collections.deque()
+
+
+    # MARK: begin_frame()
+    def begin_frame(self):
+        """
+        Start recording a new frame
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self.row = self.frame % self.capacity
+        self.frame += 1
+        self.durations[self.row] = numpy.nan
+        self.gpu_durations[self.row] = numpy.nan
+        self.last = time.perf_counter()
+
+
+    # MARK: mark()
+    def mark(self, stage: int):
+        """
+        Record the time since the last mark as the duration of the stage
+
+        Parameters
+        ----------
+        stage : int
+            The index of the stage in PROFILER_STAGES
+
+        Returns
+        -------
+        None
+        """
+        now = time.perf_counter()
+        self.starts[self.row, stage] = self.last
+        self.durations[self.row, stage] = now - self.last
+        self.last = now
+
+
+    # MARK: begin_gpu()
+    def begin_gpu(self):
+        """
+        Start a GL timer query for the current frame, skipped while all queries are still pending
+        A current GL context is required
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+            If a query was started
+        """
+        self.collect_gpu()
+        if self.gpu_queries == None:
+            try:
+                self.gpu_queries = [int(query) for query in numpy.atleast_1d(gl.glGenQueries(PROFILER_GPU_QUERIES))]
+            except Exception:
+                self.gpu_queries = []
+        if len(self.gpu_pending) >= len(self.gpu_queries):
+            return False
+        pending = set(query for query, _ in self.gpu_pending)
+        query = next(query for query in self.gpu_queries if query not in pending)
+        gl.glBeginQuery(gl.GL_TIME_ELAPSED, query)
+        # tagged with the frame number, the row may belong to a newer frame by the time the result arrives
+        self.gpu_pending.append((query, self.frame - 1))
+        self.gpu_starts[self.row] = time.perf_counter()
+        return True
+
+
+    # MARK: end_gpu()
+    def end_gpu(self):
+        """
+        End the GL timer query of the current frame
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        gl.glEndQuery(gl.GL_TIME_ELAPSED)
+
+
+    # MARK: collect_gpu()
+    def collect_gpu(self):
+        """
+        Read the results of the finished GL timer queries without waiting for the GPU
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        while len(self.gpu_pending) > 0:
+            query, frame = self.gpu_pending[0]
+            if gl.glGetQueryObjectiv(query, gl.GL_QUERY_RESULT_AVAILABLE) == 0:
+                break
+            # 32 bits of nanoseconds are enough for a frame and avoid PyOpenGL's broken 64 bit wrapper
+            duration = gl.glGetQueryObjectuiv(query, gl.GL_QUERY_RESULT) / 1e9
+            self.gpu_pending.popleft()
+            if frame >= self.frame - self.capacity:
+                self.gpu_durations[frame % self.capacity] = duration
+
+
+    # MARK: reset_gpu()
+    def reset_gpu(self):
+        """
+        Forget the GL timer queries, needed when the GL context was recreated
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self.gpu_queries = None
+        self.gpu_pending.clear()
+
+
+    # MARK: get_rows()
+    def get_rows(self):
+        """
+        Get the rows of the recorded frames in chronological order
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        numpy.ndarray
+            The row indices
+        """
+        if self.frame <= self.capacity:
+            return numpy.arange(self.frame)
+        return numpy.arange(self.frame, self.frame + self.capacity) % self.capacity
+
+
+    # MARK: get_stats()
+    def get_stats(self):
+        """
+        Get the statistics of every stage over the recorded frames
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            The count, mean, p50, p90, p99 and max in milliseconds for every stage, "total" and "gpu"
+        """
+        rows = self.get_rows()
+        durations = self.durations[rows]
+        columns = {stage: durations[:, index] for index, stage in enumerate(PROFILER_STAGES)}
+        columns["total"] = numpy.nansum(durations, axis=1)[numpy.any(numpy.isfinite(durations), axis=1)]
+        columns["gpu"] = self.gpu_durations[rows]
+
+        stats = {}
+        for stage, values in columns.items():
+            values = values[numpy.isfinite(values)] * 1000
+            if len(values) == 0:
+                stats[stage] = {"count": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+                continue
+            p50, p90, p99 = numpy.percentile(values, (50, 90, 99))
+            stats[stage] = {"count": len(values), "mean": float(values.mean()), "p50": float(p50),
+                            "p90": float(p90), "p99": float(p99), "max": float(values.max())}
+        return stats
+
+
+    # MARK: get_trace_events()
+    def get_trace_events(self, name: str):
+        """
+        Get the recorded frames as Chrome trace events
+
+        Parameters
+        ----------
+        name : str
+            The name of the process in the trace
+
+        Returns
+        -------
+        list
+            The trace events
+        """
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": name}},
+                  {"name": "thread_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "CPU"}},
+                  {"name": "thread_name", "ph": "M", "pid": pid, "tid": 1, "args": {"name": "GPU"}}]
+        for row in self.get_rows():
+            for index, stage in enumerate(PROFILER_STAGES):
+                if numpy.isfinite(self.durations[row, index]):
+                    events.append({"name": stage, "cat": "cpu", "ph": "X", "pid": pid, "tid": 0,
+                                   "ts": self.starts[row, index] * 1e6, "dur": self.durations[row, index] * 1e6})
+            if numpy.isfinite(self.gpu_durations[row]):
+                # GL timer queries have no CPU timestamp, the GPU work is placed where it was submitted
+                events.append({"name": "upload + draw", "cat": "gpu", "ph": "X", "pid": pid, "tid": 1,
+                               "ts": self.gpu_starts[row] * 1e6, "dur": self.gpu_durations[row] * 1e6})
+        return events
+
+
+class Window:
+    # MARK: __init__()
+    def __init__(self,
+                 name: str,
+                 size: tuple = (None, None),
+                 position: tuple = (None, None),
+                 title_bar_color: tuple = (None, None, None),
+                 border_color: tuple = (None, None, None),
+                 resizable: bool = True,
+                 topmost: bool = False,
+                 foreground: bool = True,
+                 minimized: bool = False,
+                 undestroyable: bool = False,
+                 icon: str = "",
+                 no_warnings: bool = False,
+                 pbo_upload: bool = False,
+                 pbo_count: int = 2,
+                 scale_mode: str = "stretch",
+                 interpolation: str = "linear",
+                 threaded: bool = False,
+                 vsync: str = None,
+                 target_fps: float = None,
+                 profiling: bool = False,
+                 skip_unchanged: str = None,
+                 headless: bool = False):
+        """
+        Initialize a new window
+        The window will be shown when calling create_window() or when showing the first frame with show()
+
+        Parameters
+        ----------
+        name : str
+            The name of the window
+        size : tuple
+            The size of the window
+        position : tuple
+            The position of the window
+        title_bar_color : tuple, optional
+            The color of the title bar
+        border_color : tuple, optional
+            The color of the window border
+        resizable : bool, optional
+            If the window should be resizable
+        topmost : bool, optional
+            If the window should be always on top
+        foreground : bool, optional
+            If the window should be in the foreground on creation
+        minimized : bool, optional
+            If the window should be minimized on creation
+        undestroyable : bool, optional
+            If the window should be undestroyable
+        icon : str, optional
+            The path to the .ico icon
+        no_warnings : bool, optional
+            If warnings should be printed
+        pbo_upload : bool, optional
+            If frames should be streamed to the GPU through rotating pixel buffer objects
+        pbo_count : int, optional
+            The number of pixel buffer objects to rotate through, at least 2
+        scale_mode : str, optional
+            How the frame is scaled to the window, "stretch", "fit" (letterbox) or "fill" (crop)
+        interpolation : str, optional
+            The filter used when scaling the frame on the GPU, "nearest" or "linear"
+        threaded : bool, optional
+            If frames should be presented by a dedicated render thread, show() then only hands
+            the frame over and returns at once, frames which are not presented in time are dropped
+        vsync : str, optional
+            The vsync mode, "off", "on" or "adaptive", None to keep the driver default
+        target_fps : float, optional
+            The maximum number of frames per second to present, None for no limit
+        profiling : bool, optional
+            If the time spent in every stage of show() should be recorded, see get_stats()
+        skip_unchanged : str, optional
+            How show() detects a frame which did not change, "identity" if it is the same array as the last one,
+            which must then not be modified in place, "checksum" to compare a checksum of the pixels,
+            None to only use the version argument of show()
+        headless : bool, optional
+            If the window should render offscreen into a framebuffer object, show() then returns the result,
+            an invisible window is used if a display is available, otherwise a surfaceless EGL context
+        """
+        self._name = name
+        self._size = size
+        self._position = position
+        self._title_bar_color = title_bar_color
+        self._border_color = border_color
+        self._resizable = resizable
+        self._topmost = topmost
+        self._foreground = foreground
+        self._minimized = minimized            
+        self._close_requested = False
+        self._undestroyable = undestroyable
+        self._batch_depth = 0
+        self._batch_state = None
+        self._batch_changes = set()
+        self._icon = icon
+        self._no_warnings = no_warnings
+        self._pbo_upload = pbo_upload
+        self._pbo_count = max(2, int(pbo_count))
+        self._scale_mode = scale_mode if scale_mode in SCALE_MODES else "stretch"
+        self._interpolation = interpolation if interpolation in INTERPOLATIONS else "linear"
+        self._threaded = threaded
+        self._vsync = vsync if vsync in VSYNC_MODES else None
+        self._target_fps = target_fps if target_fps == None or target_fps > 0 else None
+        self._skip_unchanged = skip_unchanged if skip_unchanged in SKIP_UNCHANGED_MODES else None
+        self._headless = headless
+        if headless and threaded:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: headless windows render on the calling thread, threaded is ignored" + NORMAL)
+            self._threaded = False
+
+        self._open = False
+        self._group = None
+        self._backend = _HeadlessBackend() if headless else _get_backend()
+        self._hwnd = None
+        self._window = None
+        self._texture = None
+        self._plane_textures = []
+        self._programs = {}
+        self._quad_vao = None
+        self._quad_vbo = None
+        self._framebuffer_size = (0, 0)
+        self._pbo_ids = []
+        self._pbo_index = 0
+        self._pbo_size = 0
+        self._copies_avoided = 0
+        self._uploaded_bytes = 0
+        self._previous_frame = None
+
+        self._render_thread = None
+        self._render_running = False
+        self._mailbox = None
+        self._mailbox_condition = threading.Condition()
+        # the event loop and future of the frame from show_async() which the render thread presents next
+        self._mailbox_waiter = None
+        self._presented_frames = 0
+        self._dropped_frames = 0
+
+        self._vsync_changed = self._vsync != None
+        self._next_present_time = None
+        self._present_times = collections.deque(maxlen=PRESENT_HISTORY)
+        self._present_times_lock = threading.Lock()
+
+        self._profiler = _FrameProfiler() if profiling else None
+
+        self._content_key = None
+        self._content_frame = None
+        self._content_size = (0, 0)
+        self._damaged = True
+        self._skipped_frames = 0
+
+        self._pending = None
+        self._pending_lock = threading.Lock()
+        self._run_stopped = False
+        self._run_frame = None
+
+        self._events = None
+
+        self._layers = {}
+        self._layers_lock = threading.Lock()
+        self._released_textures = []
+
+        self._colormap_textures = {}
+
+        self._overlays = []
+        self._overlays_lock = threading.Lock()
+        self._overlays_changed = False
+        self._overlay_vao = None
+        self._overlay_vbo = None
+        self._overlay_vertex_count = 0
+        self._glyph_texture = None
+
+        self._tiles = collections.OrderedDict()
+        self._tiles_image = None
+        self._tiles_version = None
+
+        self._readback_pbo_ids = []
+        self._readback_pbo_sizes = []
+        self._readback_index = 0
+        self._readback_pending = collections.deque()
+        self._recording_queue = None
+        self._recording_thread = None
+        self._recorded_frames = 0
+        self._recording_dropped_frames = 0
+        self._capture_enabled = False
+        self._capture_requested = False
+        self._capture_condition = threading.Condition()
+        self._captured_frame = None
+        self._last_submitted = None
+
+        self._headless_framebuffer = None
+        self._headless_renderbuffer = None
+        self._headless_renderbuffer_size = (0, 0)
+        self._max_texture_size = None
+        self._view = None
+        self._drag_position = None
+
+
+    # MARK: create_window()
+    def create_window(self):
+        """
+        Create the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        if self._size[0] == None:
+            self._size = 150, self._size[1]
+        if self._size[1] == None:
+            self._size = self._size[0], 50
+
+        if self._position[0] == None:
+            self._position = 0, self._position[1]
+        if self._position[1] == None:
+            self._position = self._position[0], 0
+
+        if self._headless:
+            self._create_headless_context()
+        else:
+            self._create_glfw_window()
+
+        self._texture = _Texture()
+        self._plane_textures = []
+
+        # vertex arrays can not be shared between contexts, so every window has its own quad
+        self._quad_vao = gl.glGenVertexArrays(1)
+        gl.glBindVertexArray(self._quad_vao)
+        self._quad_vbo = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._quad_vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, QUAD_VERTICES.nbytes, QUAD_VERTICES, gl.GL_STATIC_DRAW)
+        gl.glEnableVertexAttribArray(0)
+        gl.glVertexAttribPointer(0, 2, gl.GL_FLOAT, gl.GL_FALSE, 0, ctypes.c_void_p(0))
+        self._get_program("image")
+
+        if self._pbo_upload:
+            self._pbo_ids = [int(pbo_id) for pbo_id in numpy.atleast_1d(gl.glGenBuffers(self._pbo_count))]
+            self._pbo_index = 0
+            self._pbo_size = 0
+
+        # the swap interval and timer queries belong to the new context, so they have to be created again
+        self._vsync_changed = self._vsync != None
+        self._next_present_time = None
+        # the new textures are empty, so the next frame has to be uploaded even if it did not change
+        self._content_key = None
+        self._content_frame = None
+        self._damaged = True
+        self._overlay_vao = None
+        self._overlay_vbo = None
+        self._glyph_texture = None
+        self._tiles = collections.OrderedDict()
+        self._tiles_image = None
+        self._max_texture_size = None
+        self._readback_pbo_ids = []
+        self._readback_pbo_sizes = []
+        self._readback_pending = collections.deque()
+        with self._overlays_lock:
+            self._overlays_changed = True
+        with self._layers_lock:
+            self._released_textures = []
+            for layer in self._layers.values():
+                layer.texture = None
+                layer.changed = layer.frame is not None
+        if self._profiler != None:
+            self._profiler.reset_gpu()
+
+        if self._threaded:
+            # the render thread owns the context from now on
+            _make_context_current(None)
+            self._render_running = True
+            self._render_thread = threading.Thread(target=self._render_loop, daemon=True)
+            self._render_thread.start()
+
+
+    # MARK: _create_glfw_window()
+    def _create_glfw_window(self):
+        """
+        Create the GLFW window with its context and apply the window attributes
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        _init_glfw()
+        self._backend.prepare_process()
+
+        # windows of a group share their textures, buffers and shaders with the hidden window of the group
+        share = self._group._get_share_window() if self._group != None else None
+        self._window = _create_context_window(self._size[0], self._size[1], self._name, share)
+        _make_context_current(self._window)
+        glfw.set_window_size_limits(self._window, 150, 50, glfw.DONT_CARE, glfw.DONT_CARE)
+        glfw.set_window_pos(self._window, self._position[0], self._position[1])
+
+        self._hwnd = self._backend.get_handle(self._window)
+        self._open = True
+
+        # a window which is created inside a batch gets its properties right away
+        batch_depth, self._batch_depth = self._batch_depth, 0
+        if None not in self._title_bar_color:
+            self.set_title_bar_color(self._title_bar_color)
+        if None not in self._border_color:
+            self.set_border_color(self._border_color)
+        if self._resizable == False:
+            glfw.set_window_attrib(self._window, glfw.RESIZABLE, glfw.FALSE)
+        if self._topmost:
+            glfw.set_window_attrib(self._window, glfw.FLOATING, glfw.TRUE)
+        if self._icon != "":
+            self.set_icon(self._icon)
+
+        # the cached state is queried once here and then kept up to date by the callbacks
+        foreground, minimized = self._foreground, self._minimized
+        self.refresh()
+        if foreground:
+            self.set_foreground(state=True)
+        if minimized:
+            self.set_minimized(state=True)
+        self._batch_depth = batch_depth
+
+        glfw.set_window_size_callback(self._window, self._on_window_size)
+        glfw.set_window_pos_callback(self._window, self._on_window_pos)
+        glfw.set_framebuffer_size_callback(self._window, self._on_framebuffer_size)
+        glfw.set_window_refresh_callback(self._window, self._on_refresh)
+        glfw.set_window_iconify_callback(self._window, self._on_iconify)
+        glfw.set_scroll_callback(self._window, self._on_scroll)
+        glfw.set_mouse_button_callback(self._window, self._on_mouse_button)
+        glfw.set_cursor_pos_callback(self._window, self._on_cursor_pos)
+        glfw.set_window_close_callback(self._window, self._on_close)
+        glfw.set_window_focus_callback(self._window, self._on_focus)
+        glfw.set_key_callback(self._window, self._on_key)
+
+
+    # MARK: _create_headless_context()
+    def _create_headless_context(self):
+        """
+        Create the context of a headless window and the framebuffer object it renders into
+        An invisible GLFW window provides the context if there is a display, otherwise EGL without any surface
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        no_display = sys.platform.startswith("linux") and os.environ.get("DISPLAY") == None and os.environ.get("WAYLAND_DISPLAY") == None
+        if no_display or _init_glfw() == False:
+            self._window = _EGLContext()
+        else:
+            share = self._group._get_share_window() if self._group != None else None
+            try:
+                self._window = _create_context_window(self._size[0], self._size[1], self._name, share, visible=False)
+            except RuntimeError:
+                # EGL may still offer OpenGL 3.3 when the driver of the display does not, but it can not share with a group
+                if share != None:
+                    raise
+                self._window = _EGLContext()
+        _make_context_current(self._window)
+        self._open = True
+
+        self._framebuffer_size = tuple(self._size)
+        self._headless_framebuffer = gl.glGenFramebuffers(1)
+        self._headless_renderbuffer = gl.glGenRenderbuffers(1)
+        self._headless_renderbuffer_size = (0, 0)
+
+
+    # MARK: close()
+    def close(self):
+        """
+        Close the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None"""
+        if self._open:
+            if self._render_thread != None:
+                with self._mailbox_condition:
+                    self._render_running = False
+                    self._mailbox = None
+                    self._mailbox_condition.notify()
+                self._render_thread.join()
+                self._render_thread = None
+                waiter, self._mailbox_waiter = self._mailbox_waiter, None
+                if waiter != None:
+                    # the frame of show_async() was not presented anymore
+                    _resolve_waiter(waiter, None)
+            self.stop_recording()
+            _make_context_current(self._window)
+            self._release_gl_objects()
+            if isinstance(self._window, _EGLContext):
+                _make_context_current(None)
+                self._window.destroy()
+            else:
+                if getattr(_current_context, "window", None) is self._window:
+                    _current_context.window = None
+                glfw.destroy_window(self._window)
+            self._open = False
+            self._headless_framebuffer = None
+            self._headless_renderbuffer = None
+            self._texture = None
+            self._plane_textures = []
+            self._previous_frame = None
+            self._content_key = None
+            self._content_frame = None
+            self._last_submitted = None
+            self._tiles_image = None
+            self._run_frame = None
+            self._colormap_textures = {}
+            self._programs = {}
+            self._quad_vao = None
+            self._quad_vbo = None
+            self._pbo_ids = []
+            self._pbo_size = 0
+
+
+    # MARK: _release_gl_objects()
+    def _release_gl_objects(self):
+        """
+        Delete the textures, buffers and vertex arrays of the window, must be called with the context of the window current
+        Textures and buffers are shared with the other windows of a group, so they would outlive the window otherwise
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        textures = [texture.id for texture in [self._texture] + self._plane_textures if texture != None]
+        textures += list(self._colormap_textures.values())
+        if self._glyph_texture != None:
+            textures.append(self._glyph_texture)
+        with self._layers_lock:
+            textures += self._released_textures
+            self._released_textures = []
+            for layer in self._layers.values():
+                if layer.texture != None:
+                    textures.append(layer.texture.id)
+                    layer.texture = None
+                layer.changed = layer.frame is not None
+        if len(textures) > 0:
+            gl.glDeleteTextures(textures)
+        self._release_tiles()
+
+        buffers = self._pbo_ids + self._readback_pbo_ids + [buffer for buffer in (self._quad_vbo, self._overlay_vbo) if buffer != None]
+        if len(buffers) > 0:
+            gl.glDeleteBuffers(len(buffers), buffers)
+        vertex_arrays = [vertex_array for vertex_array in (self._quad_vao, self._overlay_vao) if vertex_array != None]
+        if len(vertex_arrays) > 0:
+            gl.glDeleteVertexArrays(len(vertex_arrays), vertex_arrays)
+        for _, fence, _, _, _ in self._readback_pending:
+            gl.glDeleteSync(fence)
+        if self._headless_framebuffer != None:
+            gl.glDeleteFramebuffers(1, [self._headless_framebuffer])
+            gl.glDeleteRenderbuffers(1, [self._headless_renderbuffer])
+
+        self._glyph_texture = None
+        self._overlay_vao = None
+        self._overlay_vbo = None
+        self._readback_pbo_ids = []
+        self._readback_pbo_sizes = []
+        self._readback_pending = collections.deque()
+
+
+    # MARK: set_name()
+    def set_name(self, name: str):
+        """
+        Set the name of the window
+
+        Parameters
+        ----------
+        name : str
+            The name of the window
+
+        Returns
+        -------
+        None
+        """
+        self._name = name
+        self._apply_properties(("name",))
+
+
+    # MARK: get_name()
+    def get_name(self):
+        """
+        Get the name of the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        str
+            The name of the window
+        """
+        return self._name
+
+
+    # MARK: set_size()
+    def set_size(self, size: tuple):
+        """
+        Set the size of the window
+
+        Parameters
+        ----------
+        size : tuple
+            The size of the window
+
+        Returns
+        -------
+        None
+        """
+        if size != self._size and self._open:
+            if len(size) != 2 or isinstance(size[0], (int, type(None))) == False or isinstance(size[1], (int, type(None))) == False:
+                if self._no_warnings != True:
+                    print(RED + "SimpleWindow: size must be a tuple of (int, int)" + NORMAL)
+                return
+        if size[0] == None:
+            size = (self._size[0], size[1])
+        if size[1] == None:
+            size = (size[0], self._size[1])
+        if None in size:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: size not valid, found None value" + NORMAL)
+            return
+        if self._headless:
+            self._size = max(1, round(size[0])), max(1, round(size[1]))
+        else:
+            self._size = max(150, round(size[0])), max(50, round(size[1]))
+        self._apply_properties(("size",))
+
+
+    # MARK: get_size()
+    def get_size(self):
+        """
+        Get the size of the window, kept up to date by the resize callback, see refresh()
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        tuple
+            The size of the window
+        """
+        return self._size
+
+
+    # MARK: set_position()
+    def set_position(self, position: tuple):
+        """
+        Set the position of the window
+
+        Parameters
+        ----------
+        position : tuple
+            The position of the window
+
+        Returns
+        -------
+        None
+        """
+        if position != self._position and self._open:
+            if len(position) != 2 or isinstance(position[0], (int, type(None))) == False or isinstance(position[1], (int, type(None))) == False:
+                if self._no_warnings != True:
+                    print(RED + "SimpleWindow: position must be a tuple of (int, int)" + NORMAL)
+                return
+        if position[0] == None:
+            position = (self._position[0], position[1])
+        if position[1] == None:
+            position = (position[0], self._position[1])
+        if None in position:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: position not valid, found None value" + NORMAL)
+            return
+        self._position = tuple(position)
+        self._apply_properties(("position",))
+
+
+    # MARK: get_position()
+    def get_position(self):
+        """
+        Get the position of the window, kept up to date by the move callback, see refresh()
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        tuple
+            The position of the window
+        """
+        return self._position
+
+
+    # MARK: set_title_bar_color()
+    def set_title_bar_color(self, color: tuple):
+        """
+        Set the title bar color of the window
+
+        Parameters
+        ----------
+        color : tuple
+            The color of the title bar, must be a tuple of (int, int, int)
+
+        Returns
+        -------
+        None
+        """
+        if self._open:
+            if len(color) != 3 or isinstance(color[0], int) == False or isinstance(color[1], int) == False or isinstance(color[2], int) == False:
+                if self._no_warnings != True:
+                    print(RED + "SimpleWindow: title_bar_color must be a tuple of (int, int, int)" + NORMAL)
+                return
+        self._title_bar_color = color
+        self._apply_properties(("title_bar_color",))
+
+
+    # MARK: get_title_bar_color()
+    def get_title_bar_color(self):
+        """
+        Get the title bar color of the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        tuple
+            The title bar color of the window
+        """
+        return self._title_bar_color
+
+
+    # MARK: set_border_color()
+    def set_border_color(self, color: tuple):
+        """
+        Set the border color of the window
+
+        Parameters
+        ----------
+        color : tuple
+            The color of the border, must be a tuple of (int, int, int)
+
+        Returns
+        -------
+        None
+        """
+        if self._open:
+            if len(color) != 3 or isinstance(color[0], int) == False or isinstance(color[1], int) == False or isinstance(color[2], int) == False:
+                if self._no_warnings != True:
+                    print(RED + "SimpleWindow: border_color must be a tuple of (int, int, int)" + NORMAL)
+                return
+        self._border_color = color
+        self._apply_properties(("border_color",))
+
+
+    # MARK: get_border_color()
+    def get_border_color(self):
+        """
+        Get the border color of the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        tuple
+            The border color of the window
+        """
+        return self._border_color
+
+
+    # MARK: set_resizable()
+    def set_resizable(self, state: bool):
+        """
+        Set the resizable state of the window
+
+        Parameters
+        ----------
+        state : bool
+            If the window should be resizable
+
+        Returns
+        -------
+        None
+        """
+        self._resizable = state
+        self._apply_properties(("resizable",))
+
+
+    # MARK: get_resizable()
+    def get_resizable(self):
+        """
+        Get the resizable state of the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+            If the window is resizable
+        """
+        return self._resizable
+
+
+    # MARK: set_topmost()
+    def set_topmost(self, state: bool):
+        """
+        Set the window to be always on top of other windows
+
+        Parameters
+        ----------
+        state : bool
+            If the window should be always on top of other windows
+
+        Returns
+        -------
+        None
+        """
+        self._topmost = state
+        self._apply_properties(("topmost",))
+
+
+    # MARK: get_topmost()
+    def get_topmost(self):
+        """
+        Get the topmost state of the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+            If the window is on top of other windows
+        """
+        return self._topmost
+
+
+    # MARK: set_foreground()
+    def set_foreground(self, state: bool):
+        """
+        Set the window to be in the foreground
+
+        Parameters
+        ----------
+        state : bool
+            If the window should be in the foreground
+
+        Returns
+        -------
+        None
+        """
+        self._foreground = state
+        self._apply_properties(("foreground",))
+
+
+    # MARK: get_foreground()
+    def get_foreground(self):
+        """
+        Get the foreground state of the window, kept up to date by the focus callback, see refresh()
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+            If the window is in the foreground
+        """
+        return self._foreground
+
+
+    # MARK: set_minimized()
+    def set_minimized(self, state: bool):
+        """
+        Set the window to be minimized
+
+        Parameters
+        ----------
+        state : bool
+            If the window should be minimized
+
+        Returns
+        -------
+        None
+        """
+        self._minimized = state
+        self._apply_properties(("minimized",))
+
+
+    # MARK: get_minimized()
+    def get_minimized(self):
+        """
+        Get the minimized state of the window, kept up to date by the iconify callback, see refresh()
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+            If the window is minimized
+        """
+        return self._minimized
+
+
+    # MARK: set_undestroyable()
+    def set_undestroyable(self, state: bool):
+        """
+        Set the window to be undestroyable
+        Undestroyable windows will automatically reopen when the user closes the window
+
+        Parameters
+        ----------
+        state : bool
+            If the window should be undestroyable
+
+        Returns
+        -------
+        None
+        """
+        self._undestroyable = state
+
+
+    # MARK: get_undestroyable()
+    def get_undestroyable(self):
+        """
+        Get the undestroyable state of the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+            If the window is undestroyable
+        """
+        return self._undestroyable
+
+
+    # MARK: set_icon()
+    def set_icon(self, icon: str):
+        """
+        Set the window icon of the window
+
+        Parameters
+        ----------
+        icon : str
+            The path to the .ico icon
+
+        Returns
+        -------
+        None
+        """
+        if self._open:
+            if isinstance(icon, str) == False:
+                if self._no_warnings != True:
+                    print(RED + "SimpleWindow: icon must be a string, the path to the .ico file" + NORMAL)
+                return
+            if os.path.exists(icon) == False:
+                if self._no_warnings != True:
+                    print(RED + "SimpleWindow: invalid icon path" + NORMAL)
+                return
+            if icon.endswith(".ico") == False:
+                if self._no_warnings != True:
+                    print(RED + "SimpleWindow: icon must be an .ico file" + NORMAL)
+                return
+        self._icon = icon
+        self._apply_properties(("icon",))
+
+
+    # MARK: get_icon()
+    def get_icon(self):
+        """
+        Get the icon path of the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        str
+            The path to the .ico icon
+        """
+        return self._icon
+
+
+    # MARK: set_open()
+    def set_open(self, state: bool):
+        """
+        Set the open state of the window
+
+        Parameters
+        ----------
+        state : bool
+            If the window should be open
+
+        Returns
+        -------
+        None
+        """
+        if state and self._open != True:
+            self.create_window()
+        elif state == False and self._open:
+            self.close()
+
+
+    # MARK: get_open()
+    def get_open(self):
+        """
+        Get the open state of the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+            If the window is open
+        """
+        return self._open == True
+
+
+    # MARK: refresh()
+    def refresh(self):
+        """
+        Query the size, position, minimized, foreground and close state from the window system again
+        The getters return the state cached from the window callbacks, which only arrive while the events are polled,
+        this is only needed if the window was changed directly through its handle
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        if self._open != True or self._headless:
+            return
+        self._size = glfw.get_window_size(self._window)
+        self._position = glfw.get_window_pos(self._window)
+        self._framebuffer_size = glfw.get_framebuffer_size(self._window)
+        self._minimized = self._backend.get_minimized(self._window, self._hwnd)
+        self._foreground = self._backend.get_foreground(self._window, self._hwnd)
+        self._close_requested = glfw.window_should_close(self._window) == glfw.TRUE
+
+
+    # MARK: batch()
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Collect the changes of the window setters and apply them together when the with block ends
+        Changes which end up at the value from before the block are dropped, position, size and stacking order
+        are applied with a single call, so the window neither repaints nor jumps between the steps of a relayout
+        Batches can be nested, the changes are applied when the outermost one ends
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        context manager
+            Use with a with statement
+        """
+        if self._batch_depth == 0:
+            self._batch_state = {name: getattr(self, "_" + name) for name in BATCH_PROPERTIES}
+            self._batch_changes = set()
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                changes = [name for name in BATCH_PROPERTIES if name in self._batch_changes and
+                           getattr(self, "_" + name) != self._batch_state[name]]
+                self._batch_state = None
+                self._batch_changes = set()
+                self._apply_properties(changes)
+
+
+    # MARK: configure()
+    def configure(self, **properties):
+        """
+        Set several properties at once in a batch(), for example configure(size=(640, 360), position=(0, 0), topmost=True)
+        Properties which already have the given value are skipped
+
+        Parameters
+        ----------
+        properties : any
+            The new values, named like the setters without "set_": name, size, position, title_bar_color, border_color,
+            resizable, topmost, foreground, minimized, icon, undestroyable, scale_mode, interpolation, vsync,
+            target_fps and skip_unchanged
+
+        Returns
+        -------
+        None
+        """
+        with self.batch():
+            for name, value in properties.items():
+                if name not in CONFIGURE_PROPERTIES:
+                    if self._no_warnings != True:
+                        print(RED + "SimpleWindow: configure() got the unknown property " + str(name) + NORMAL)
+                    continue
+                if getattr(self, "get_" + name)() == value:
+                    continue
+                getattr(self, "set_" + name)(value)
+
+
+    # MARK: _apply_properties()
+    def _apply_properties(self, names):
+        """
+        Apply changed properties to the window, deferred to the end of batch() while a batch is open
+
+        Parameters
+        ----------
+        names : tuple
+            The names of the changed properties, see BATCH_PROPERTIES
+
+        Returns
+        -------
+        None
+        """
+        if self._batch_depth > 0:
+            self._batch_changes.update(names)
+            return
+        if self._open != True or len(names) == 0:
+            return
+        if self._headless:
+            if "size" in names:
+                # the framebuffer object is resized with the next frame
+                self._framebuffer_size = self._size
+                self._damaged = True
+            return
+
+        if "name" in names:
+            glfw.set_window_title(self._window, self._name)
+        if "resizable" in names:
+            glfw.set_window_attrib(self._window, glfw.RESIZABLE, glfw.TRUE if self._resizable else glfw.FALSE)
+        if "title_bar_color" in names:
+            if self._backend.set_title_bar_color(self._window, self._hwnd, self._title_bar_color) == False:
+                if self._no_warnings != True:
+                    print(RED + "SimpleWindow: title_bar_color is not supported on this platform" + NORMAL)
+        if "border_color" in names:
+            if self._backend.set_border_color(self._window, self._hwnd, self._border_color) == False:
+                if self._no_warnings != True:
+                    print(RED + "SimpleWindow: border_color is not supported on this platform" + NORMAL)
+        if "icon" in names:
+            if self._backend.set_icon(self._window, self._hwnd, self._icon) == False:
+                if self._no_warnings != True:
+                    print(RED + "SimpleWindow: icon is not supported on this platform" + NORMAL)
+
+        # moving to the back also drops the topmost state, moving to the front keeps it
+        insert_after = None
+        if "topmost" in names:
+            insert_after = "topmost" if self._topmost else "notopmost"
+        elif "foreground" in names:
+            insert_after = ("topmost" if self._topmost else "top") if self._foreground else "bottom"
+        position = self._position if "position" in names else None
+        size = self._size if "size" in names else None
+        supported = True
+        if position != None or size != None or insert_after != None:
+            activate = "foreground" in names and self._foreground
+            supported = self._backend.set_placement(self._window, self._hwnd, position, size, insert_after, activate)
+        if "topmost" in names and "foreground" in names and self._foreground == False:
+            # the topmost change went first, the window goes to the back afterwards like set_foreground(False) would
+            supported = self._backend.set_placement(self._window, self._hwnd, None, None, "bottom", False) and supported
+        if supported == False and self._no_warnings != True:
+            print(RED + "SimpleWindow: moving a window to the background is not supported on this platform" + NORMAL)
+
+        if "minimized" in names:
+            self._backend.set_minimized(self._window, self._hwnd, self._minimized)
+
+
+    # MARK: get_handle()
+    def get_handle(self):
+        """
+        Get the native handle (HWND on Windows) of the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+            The handle of the window, None if the platform backend does not provide one
+        """
+        return self._hwnd
+
+
+    # MARK: get_copies_avoided()
+    def get_copies_avoided(self):
+        """
+        Get the number of full frame copies which were avoided when uploading frames to the GPU
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+            The number of avoided frame copies
+        """
+        return self._copies_avoided
+
+
+    # MARK: get_uploaded_bytes()
+    def get_uploaded_bytes(self):
+        """
+        Get the number of bytes which were uploaded to the GPU
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+            The number of uploaded bytes
+        """
+        return self._uploaded_bytes
+
+
+    # MARK: get_presented_frames()
+    def get_presented_frames(self):
+        """
+        Get the number of frames which were presented in the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+            The number of presented frames
+        """
+        return self._presented_frames
+
+
+    # MARK: get_dropped_frames()
+    def get_dropped_frames(self):
+        """
+        Get the number of frames which were replaced by a newer frame before the render thread presented them
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+            The number of dropped frames
+        """
+        return self._dropped_frames
+
+
+    # MARK: get_skipped_frames()
+    def get_skipped_frames(self):
+        """
+        Get the number of shown frames which were neither uploaded nor presented because nothing changed
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+            The number of skipped frames
+        """
+        return self._skipped_frames
+
+
+    # MARK: set_skip_unchanged()
+    def set_skip_unchanged(self, skip_unchanged: str):
+        """
+        Set how show() detects a frame which did not change
+
+        Parameters
+        ----------
+        skip_unchanged : str
+            "identity" if it is the same array as the last one, "checksum" to compare a checksum of the pixels,
+            None to only use the version argument of show()
+
+        Returns
+        -------
+        None
+        """
+        if skip_unchanged != None and skip_unchanged not in SKIP_UNCHANGED_MODES:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: skip_unchanged must be None or one of " + ", ".join(SKIP_UNCHANGED_MODES) + NORMAL)
+            return
+        self._skip_unchanged = skip_unchanged
+
+
+    # MARK: get_skip_unchanged()
+    def get_skip_unchanged(self):
+        """
+        Get how show() detects a frame which did not change
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        str
+            "identity", "checksum" or None
+        """
+        return self._skip_unchanged
+
+
+    # MARK: set_scale_mode()
+    def set_scale_mode(self, scale_mode: str):
+        """
+        Set how the frame is scaled to the window
+
+        Parameters
+        ----------
+        scale_mode : str
+            "stretch" to fill the window, "fit" to letterbox the frame or "fill" to crop the frame
+
+        Returns
+        -------
+        None
+        """
+        if scale_mode not in SCALE_MODES:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: scale_mode must be one of " + ", ".join(SCALE_MODES) + NORMAL)
+            return
+        self._scale_mode = scale_mode
+        self._damaged = True
+
+
+    # MARK: get_scale_mode()
+    def get_scale_mode(self):
+        """
+        Get how the frame is scaled to the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        str
+            The scale mode of the window
+        """
+        return self._scale_mode
+
+
+    # MARK: set_interpolation()
+    def set_interpolation(self, interpolation: str):
+        """
+        Set the filter used when scaling the frame
+
+        Parameters
+        ----------
+        interpolation : str
+            "nearest" or "linear"
+
+        Returns
+        -------
+        None
+        """
+        if interpolation not in INTERPOLATIONS:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: interpolation must be one of " + ", ".join(INTERPOLATIONS) + NORMAL)
+            return
+        self._interpolation = interpolation
+        self._damaged = True
+
+
+    # MARK: get_interpolation()
+    def get_interpolation(self):
+        """
+        Get the filter used when scaling the frame
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        str
+            The interpolation of the window
+        """
+        return self._interpolation
+
+
+    # MARK: set_vsync()
+    def set_vsync(self, vsync: str):
+        """
+        Set the vsync mode of the window
+
+        Parameters
+        ----------
+        vsync : str
+            "off" to present at once, "on" to wait for the vertical blank or "adaptive"
+            to only wait when the frame is on time, falls back to "on" if not supported,
+            None to leave the swap interval of the driver as it is
+
+        Returns
+        -------
+        None
+        """
+        if vsync != None and vsync not in VSYNC_MODES:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: vsync must be one of " + ", ".join(VSYNC_MODES) + NORMAL)
+            return
+        self._vsync = vsync
+        self._vsync_changed = True
+
+
+    # MARK: get_vsync()
+    def get_vsync(self):
+        """
+        Get the vsync mode of the window
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        str
+            The vsync mode, None if the driver default is used
+        """
+        return self._vsync
+
+
+    # MARK: set_target_fps()
+    def set_target_fps(self, target_fps: float):
+        """
+        Set the maximum number of frames per second to present
+
+        Parameters
+        ----------
+        target_fps : float
+            The maximum number of frames per second, None for no limit
+
+        Returns
+        -------
+        None
+        """
+        if target_fps != None and (isinstance(target_fps, (int, float)) == False or target_fps <= 0):
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: target_fps must be a positive number or None" + NORMAL)
+            return
+        self._target_fps = target_fps
+        self._next_present_time = None
+
+
+    # MARK: get_target_fps()
+    def get_target_fps(self):
+        """
+        Get the maximum number of frames per second to present
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        float
+            The maximum number of frames per second, None for no limit
+        """
+        return self._target_fps
+
+
+    # MARK: get_present_fps()
+    def get_present_fps(self):
+        """
+        Get the measured number of presented frames per second over the last PRESENT_HISTORY frames
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        float
+            The presented frames per second
+        """
+        with self._present_times_lock:
+            present_times = tuple(self._present_times)
+        if len(present_times) < 2 or present_times[-1] == present_times[0]:
+            return 0.0
+        return (len(present_times) - 1) / (present_times[-1] - present_times[0])
+
+
+    # MARK: get_present_jitter()
+    def get_present_jitter(self):
+        """
+        Get the jitter of the time between presented frames over the last PRESENT_HISTORY frames
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        float
+            The standard deviation of the frame times in milliseconds
+        """
+        with self._present_times_lock:
+            present_times = tuple(self._present_times)
+        if len(present_times) < 3:
+            return 0.0
+        return float(numpy.std(numpy.diff(present_times))) * 1000
+
+
+    # MARK: set_profiling()
+    def set_profiling(self, state: bool):
+        """
+        Set if the time spent in every stage of show() should be recorded
+        Enabling the profiling again clears the recorded frames
+
+        Parameters
+        ----------
+        state : bool
+            If the profiling should be enabled
+
+        Returns
+        -------
+        None
+        """
+        self._profiler = _FrameProfiler() if state else None
+
+
+    # MARK: get_profiling()
+    def get_profiling(self):
+        """
+        Get if the time spent in every stage of show() is recorded
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+            If the profiling is enabled
+        """
+        return self._profiler != None
+
+
+    # MARK: get_stats()
+    def get_stats(self):
+        """
+        Get the timing statistics of the last PROFILER_CAPACITY frames, requires profiling to be enabled
+        The CPU stages are "prepare", "upload", "draw", "pace", "swap" and "events", "total" is their sum
+        and "gpu" is the GPU time of the upload and draw measured with GL timer queries
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            The count, mean, p50, p90, p99 and max in milliseconds for every stage
+        """
+        if self._profiler == None:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: profiling is not enabled" + NORMAL)
+            return {}
+        return self._profiler.get_stats()
+
+
+    # MARK: export_chrome_trace()
+    def export_chrome_trace(self, path: str):
+        """
+        Export the recorded frames as Chrome trace JSON, which can be opened in chrome://tracing or Perfetto
+
+        Parameters
+        ----------
+        path : str
+            The path of the .json file
+
+        Returns
+        -------
+        None
+        """
+        if self._profiler == None:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: profiling is not enabled" + NORMAL)
+            return
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self._profiler.get_trace_events(self._name), "displayTimeUnit": "ms"}, file)
+
+
+    # MARK: show()
+    def show(self, frame: numpy.ndarray, channel_order: str = None, dirty_rects=None, version=None,
+             colormap=None, vmin=None, vmax=None):
+        """
+        Show the frame in the window
+        uint8, uint16 and float32 frames with 1, 3 or 4 channels are uploaded without any conversion,
+        float32 frames are expected to be in the range 0 to 1, other dtypes like float64 are still cast to uint8
+        float32 frames were cast to uint8 as well before, float32 frames in the range 0 to 255 need astype(numpy.uint8) now
+        In threaded mode the frame is presented later by the render thread, so it must not be modified afterwards
+
+        Parameters
+        ----------
+        frame : numpy.ndarray or SharedFrameSource
+            The frame to show, or a shared frame source whose latest frame is uploaded straight from the shared memory
+            with its sequence number as the version, nothing is shown while the source has no frame yet
+        channel_order : str, optional
+            The order of the channels in the frame, "gray", "bgr", "rgb", "bgra" or "rgba",
+            defaults to "gray", "bgr" or "bgra" depending on the number of channels
+        dirty_rects : list, numpy.ndarray or str, optional
+            The rectangles (x, y, width, height) which changed since the last frame, only those are uploaded,
+            "auto" to find the changed tiles by comparing with the last frame, None to upload the whole frame
+        version : hashable, optional
+            Changes whenever the content of the frame changes, a frame with the same version as the last one is not
+            uploaded again and only redrawn if the window needs it, see skip_unchanged for the detection without it
+        colormap : str or numpy.ndarray, optional
+            Shows a single channel frame through a colormap, one of COLORMAPS like "turbo" or a lookup table of
+            256 bgr uint8 colors, the raw values are uploaded and mapped on the GPU
+        vmin : float or str, optional
+            The value which is mapped to the start of the colormap, "auto" for the 1st percentile of a subsample
+            of the frame, None for 0
+        vmax : float or str, optional
+            The value which is mapped to the end of the colormap, "auto" for the 99th percentile of a subsample
+            of the frame, None for the largest value of signed and unsigned integer dtypes and 1 for float frames
+
+        Returns
+        -------
+        None
+        """
+        prepared = self._prepare_frame(frame, channel_order, dirty_rects, version, colormap, vmin, vmax)
+        if prepared == None:
+            return None
+        return self._show(*prepared)
+
+
+    # MARK: _prepare_frame()
+    def _prepare_frame(self, frame, channel_order: str = None, dirty_rects=None, version=None,
+                       colormap=None, vmin=None, vmax=None):
+        """
+        Turn the arguments of show() into the frame, options and version which are presented
+
+        Parameters
+        ----------
+        frame : numpy.ndarray or SharedFrameSource
+            The frame to show
+        channel_order : str, optional
+            The order of the channels in the frame
+        dirty_rects : list, numpy.ndarray or str, optional
+            The rectangles which changed since the last frame
+        version : hashable, optional
+            The version of the frame
+        colormap : str or numpy.ndarray, optional
+            The colormap for single channel frames
+        vmin : float or str, optional
+            The value which is mapped to the start of the colormap
+        vmax : float or str, optional
+            The value which is mapped to the end of the colormap
+
+        Returns
+        -------
+        tuple
+            The frame, options and version, None if a shared frame source has no frame yet
+        """
+        if dirty_rects is not None and isinstance(dirty_rects, str) == False:
+            try:
+                # a list of rectangles or an (N, 4) array like the one draw_rects() takes
+                dirty_rects = [tuple(int(value) for value in rect) for rect in numpy.asarray(dirty_rects).reshape(-1, 4)]
+            except (TypeError, ValueError):
+                dirty_rects = "invalid"
+        if isinstance(dirty_rects, str) and dirty_rects != "auto":
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: dirty_rects must be a list or an array of (x, y, width, height) or \"auto\"" + NORMAL)
+            dirty_rects = None
+        if isinstance(frame, SharedFrameSource):
+            latest = frame.read()
+            if latest == None:
+                return None
+            # a frame torn by a producer which laps the ring is replaced on the next call, the sequence moved on
+            version = (frame.get_name(), latest[1])
+            frame = latest[0]
+        options = {"channel_order": channel_order, "dirty_rects": dirty_rects}
+        if colormap is not None:
+            frame = self._get_colormap_options(frame, colormap, vmin, vmax, options)
+        return frame, options, version
+
+
+    # MARK: _get_colormap_options()
+    def _get_colormap_options(self, frame: numpy.ndarray, colormap, vmin, vmax, options: dict):
+        """
+        Add the colormap and the value range of show() to the options of the frame
+
+        Parameters
+        ----------
+        frame : numpy.ndarray
+            The single channel frame
+        colormap : str or numpy.ndarray
+            The colormap, see show()
+        vmin : float or str
+            The value at the start of the colormap, see show()
+        vmax : float or str
+            The value at the end of the colormap, see show()
+        options : dict
+            The options to add to
+
+        Returns
+        -------
+        numpy.ndarray
+            The frame, converted to float32 if its dtype can not be uploaded as it is
+        """
+        key = _get_colormap_lut(colormap)
+        if key == None or frame.ndim not in (2, 3) or (frame.ndim == 3 and frame.shape[2] != 1):
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: colormap must be one of " + ", ".join(COLORMAPS) + " or a lookup table of 256 bgr uint8 colors,"
+                      " and the frame must have a single channel" + NORMAL)
+            return frame
+        # the default end of the colormap, taken before signed integers are converted to float32
+        maximum = float(numpy.iinfo(frame.dtype).max) if frame.dtype.kind in "iu" else 1.0
+        if frame.dtype.name not in TEXTURE_FORMATS:
+            frame = frame.astype(numpy.float32)
+        # integer textures are sampled normalized to 0 to 1, float textures with their values
+        scale = float(numpy.iinfo(frame.dtype).max) if frame.dtype.kind == "u" else 1.0
+
+        if isinstance(vmin, str) or isinstance(vmax, str):
+            # a strided view, only the few sampled values are copied by the percentile
+            step = max(1, int(math.sqrt(frame.shape[0] * frame.shape[1] / AUTO_RANGE_SAMPLES)))
+            sample = frame[::step, ::step]
+            percentile = numpy.nanpercentile if frame.dtype.kind == "f" else numpy.percentile
+            low, high = (float(value) for value in percentile(sample, AUTO_RANGE_PERCENTILES))
+            if math.isfinite(low) == False or math.isfinite(high) == False:
+                low, high = 0.0, maximum
+            vmin = low if isinstance(vmin, str) else vmin
+            vmax = high if isinstance(vmax, str) else vmax
+        low = 0.0 if vmin == None else float(vmin) / scale
+        high = (maximum if vmax == None else float(vmax)) / scale
+        if high == low:
+            high = low + max(abs(low), 1.0) * 1e-6
+
+        options["colormap"] = key
+        options["value_range"] = (low, high)
+        return frame
+
+
+    # MARK: show_yuv()
+    def show_yuv(self, frame, pixel_format: str = "nv12", color_space: str = "bt601", full_range: bool = False, version=None):
+        """
+        Show a YUV frame in the window, the planes are uploaded as they are and converted to RGB on the GPU
+
+        Parameters
+        ----------
+        frame : numpy.ndarray or tuple
+            The uint8 frame, either as one buffer of the shape (height * 3 / 2, width) for "nv12" and "i420"
+            and (height, width, 2) or (height, width * 2) for "yuyv", or as a tuple of the planes,
+            (y, uv) for "nv12" and (y, u, v) for "i420"
+        pixel_format : str, optional
+            "nv12", "i420" or "yuyv"
+        color_space : str, optional
+            "bt601" or "bt709"
+        full_range : bool, optional
+            If the values use the full range 0 to 255 instead of the limited range 16 to 235
+        version : hashable, optional
+            Changes whenever the content of the frame changes, see show()
+
+        Returns
+        -------
+        None
+        """
+        if pixel_format not in YUV_PIXEL_FORMATS or color_space not in YUV_COLOR_SPACES:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: pixel_format must be one of " + ", ".join(YUV_PIXEL_FORMATS) +
+                      " and color_space one of " + ", ".join(YUV_COLOR_SPACES) + NORMAL)
+            return
+        return self._show(frame, {"pixel_format": pixel_format, "color_space": color_space, "full_range": full_range}, version)
+
+
+    # MARK: submit()
+    def submit(self, frame: numpy.ndarray, channel_order: str = None, version=None):
+        """
+        Hand a frame over to run(), can be called from any thread
+        The waiting loop is woken up at once, a frame which is replaced before run() picks it up is dropped
+
+        Parameters
+        ----------
+        frame : numpy.ndarray
+            The frame to show, it must not be modified afterwards
+        channel_order : str, optional
+            The order of the channels in the frame, see show()
+        version : hashable, optional
+            Changes whenever the content of the frame changes, see show()
+
+        Returns
+        -------
+        None
+        """
+        with self._pending_lock:
+            if self._pending != None:
+                self._dropped_frames += 1
+            self._pending = (frame, {"channel_order": channel_order}, version)
+        if _glfw_initialized:
+            glfw.post_empty_event()
+
+
+    # MARK: run()
+    def run(self, frame_source=None, channel_order: str = None, timeout: float = None):
+        """
+        Show frames until the window is closed or stop() is called
+        Instead of polling like a show() loop, the loop sleeps in the event queue until an event arrives,
+        a frame is handed over with submit() or the timeout runs out, and while the window is minimized
+        the loop sleeps until the window is restored
+
+        Parameters
+        ----------
+        frame_source : callable or SharedFrameSource, optional
+            Called whenever the loop wakes up while no submitted frame is pending,
+            returns the next frame or None if there is no new frame, a SharedFrameSource is read without a copy
+        channel_order : str, optional
+            The order of the channels in the frames of the frame source, see show()
+        timeout : float, optional
+            The maximum time in seconds to sleep while no frame is pending, defaults to the frame time
+            of target_fps or 1/60 with a frame source, without a frame source the loop sleeps until it is woken up
+
+        Returns
+        -------
+        None
+        """
+        if timeout == None and frame_source != None:
+            timeout = 1 / self._target_fps if self._target_fps != None else IDLE_FRAME_TIME
+        self._run_stopped = False
+        source_version = 0
+        while self._run_stopped == False:
+            state = self._prepare_show()
+            if state == "closed":
+                # an undestroyable window was created again and stays open
+                if self._open != True:
+                    break
+                continue
+            if state == "minimized":
+                # restoring the window, submit() and stop() all post an event
+                self._wait_events(None)
+                continue
+
+            with self._pending_lock:
+                pending = self._pending
+                self._pending = None
+            if pending == None and frame_source != None:
+                frame = frame_source()
+                if frame is not None:
+                    source_version += 1
+                    pending = (frame, {"channel_order": channel_order}, ("source", source_version))
+            if pending != None:
+                self._run_frame = pending
+            elif self._damaged and self._run_frame != None:
+                # the last frame is presented again, without an upload if its texture is still there
+                pending = self._run_frame
+
+            if pending != None and self._present(*pending):
+                if self._headless == False:
+                    glfw.poll_events()
+                if self._profiler != None and self._threaded == False:
+                    self._profiler.mark(STAGE_EVENTS)
+            else:
+                self._wait_events(timeout)
+
+
+    # MARK: _wait_events()
+    def _wait_events(self, timeout: float):
+        """
+        Wait for events, for run() while no frame is pending
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum time to wait in seconds, None to wait until an event arrives
+
+        Returns
+        -------
+        None
+        """
+        if self._headless:
+            # a headless window has no events, it looks for submitted frames once per frame time
+            time.sleep(timeout if timeout != None else IDLE_FRAME_TIME)
+        elif timeout == None:
+            glfw.wait_events()
+        else:
+            glfw.wait_events_timeout(timeout)
+
+
+    # MARK: stop()
+    def stop(self):
+        """
+        Make run() return, can be called from any thread
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self._run_stopped = True
+        if _glfw_initialized:
+            glfw.post_empty_event()
+
+
+    # MARK: show_async()
+    async def show_async(self, frame: numpy.ndarray, channel_order: str = None, version=None):
+        """
+        Show the frame without blocking the asyncio event loop
+        The window is created and polled on the thread of the event loop, which has to be the thread GLFW is used on
+        everywhere else, on macOS the main thread, and the frames are drawn by the render thread of threaded mode,
+        which the window switches to, only one frame is shown at a time and a frame which is replaced by a newer one
+        before the render thread picks it up is dropped, so awaiting every call paces a producer to the display
+        and fire and forget calls always show the latest frame
+
+        Parameters
+        ----------
+        frame : numpy.ndarray or SharedFrameSource
+            The frame to show, it must not be modified until the call returns, see show()
+        channel_order : str, optional
+            The order of the channels in the frame, see show()
+        version : hashable, optional
+            Changes whenever the content of the frame changes, see show()
+
+        Returns
+        -------
+        numpy.ndarray
+            The composited bgr frame for headless windows, otherwise None, None if the frame was dropped
+        """
+        _check_async_thread()
+        loop = asyncio.get_running_loop()
+        if self._threaded == False:
+            # the window is created again with a render thread, so neither swap_buffers() nor the read back of a headless
+            # window block the event loop, the future gets the frame of a headless window once it was read back
+            if self._open == True:
+                self.close()
+            self._threaded = True
+        prepared = self._prepare_frame(frame, channel_order, version=version)
+        if prepared == None:
+            return None
+        state = self._prepare_show()
+        future = loop.create_future()
+        if state == "ready":
+            # set before the frame is handed over, so the render thread can not present it without resolving the future
+            with self._mailbox_condition:
+                dropped, self._mailbox_waiter = self._mailbox_waiter, (loop, future)
+            if dropped != None:
+                _set_future(dropped[1], None, None)
+            if self._present(*prepared) == False:
+                with self._mailbox_condition:
+                    if self._mailbox_waiter != None and self._mailbox_waiter[1] is future:
+                        self._mailbox_waiter = None
+                _set_future(future, self._captured_frame if self._headless else None, None)
+        else:
+            _set_future(future, None, None)
+        if self._open == True and self._headless == False and self._group == None:
+            glfw.poll_events()
+        return await future
+
+
+    # MARK: events()
+    async def events(self):
+        """
+        Iterate over the events of the window without blocking the asyncio event loop, ends when the window is closed
+        Every event is a dict with its "type" and values:
+        "close", "resize" with "size", "focus" with "focused", "iconify" with "minimized",
+        "key" with "key", "scancode", "action" and "mods", "mouse_button" with "button", "action", "mods" and "position",
+        "cursor" with "position" and "scroll" with "offset", where keys and buttons are glfw constants
+        and actions are "press", "release" or "repeat"
+        The events are polled on the thread of the event loop once per IDLE_FRAME_TIME and with every show_async()
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        async generator
+            The events
+        """
+        _check_async_thread()
+        if self._events == None:
+            self._events = collections.deque(maxlen=EVENT_QUEUE_SIZE)
+        opened = False
+        try:
+            while True:
+                if self._open == True and self._headless == False:
+                    if self._group == None:
+                        glfw.poll_events()
+                    if self._close_requested:
+                        # close the window like show() would, so the stream ends even while no frames are shown
+                        self._prepare_show()
+                while len(self._events) > 0:
+                    yield self._events.popleft()
+                opened = opened or self._open == True
+                if opened and self._open != True:
+                    return
+                await asyncio.sleep(IDLE_FRAME_TIME)
+        finally:
+            self._events = None
+
+
+    # MARK: close_async()
+    async def close_async(self):
+        """
+        Close the window from the asyncio event loop, the frame which is still awaited returns None
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        _check_async_thread()
+        self.close()
+
+
+    # MARK: _emit_event()
+    def _emit_event(self, event_type: str, **values):
+        """
+        Queue an event for events(), called by the GLFW callbacks, ignored while nobody iterates over the events
+
+        Parameters
+        ----------
+        event_type : str
+            The type of the event
+        values : any
+            The values of the event
+
+        Returns
+        -------
+        None
+        """
+        events = self._events
+        if events != None:
+            events.append({"type": event_type, **values})
+
+
+    # MARK: start_recording()
+    def start_recording(self, path: str, fps: float = 30, codec: str = "mp4v"):
+        """
+        Record what is presented in the window, with scaling, layers and overlays, to a video file
+        The frames are read back asynchronously through pixel buffer objects and encoded by a background thread,
+        frames which the encoder can not keep up with are dropped, see get_recording_dropped_frames()
+
+        Parameters
+        ----------
+        path : str
+            The path of the video file
+        fps : float, optional
+            The frame rate of the video
+        codec : str, optional
+            The four character code of the codec for cv2.VideoWriter
+
+        Returns
+        -------
+        None
+        """
+        if self._recording_queue != None:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: the window is already being recorded" + NORMAL)
+            return
+        self._recorded_frames = 0
+        self._recording_dropped_frames = 0
+        recording_queue = queue.Queue(maxsize=RECORDING_QUEUE_SIZE)
+        self._recording_thread = threading.Thread(target=self._encode_loop, args=(recording_queue, path, fps, codec), daemon=True)
+        self._recording_thread.start()
+        self._recording_queue = recording_queue
+        # the current content is recorded even if it does not change
+        self._damaged = True
+
+
+    # MARK: stop_recording()
+    def stop_recording(self):
+        """
+        Stop the recording and wait until the encoder has written all frames
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        if self._recording_queue == None:
+            return
+        if self._render_thread == None and self._open == True:
+            # the last presented frames are still being read back
+            _make_context_current(self._window)
+            self._collect_readback(wait=True)
+        recording_queue = self._recording_queue
+        self._recording_queue = None
+        recording_queue.put(None)
+        self._recording_thread.join()
+        self._recording_thread = None
+
+
+    # MARK: get_recorded_frames()
+    def get_recorded_frames(self):
+        """
+        Get the number of frames which were written to the video of the current or last recording
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+            The number of recorded frames, without repeated frames
+        """
+        return self._recorded_frames
+
+
+    # MARK: get_recording_dropped_frames()
+    def get_recording_dropped_frames(self):
+        """
+        Get the number of presented frames which are missing in the current or last recording,
+        because the read back or the encoder could not keep up
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+            The number of dropped frames
+        """
+        return self._recording_dropped_frames
+
+
+    # MARK: capture()
+    def capture(self):
+        """
+        Get the last presented frame as it is shown in the window, read back like the frames of a recording
+        From the first call on every presented frame is read back, so later calls do not wait for the GPU
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        numpy.ndarray
+            The bgr frame in the size of the framebuffer, None if nothing was presented yet
+        """
+        if self._headless:
+            # every frame of a headless window is read already
+            return self._captured_frame
+        self._capture_enabled = True
+        if self._open != True:
+            return self._captured_frame
+        if self._captured_frame is None and len(self._readback_pending) == 0 and self._last_submitted != None:
+            # nothing was read back yet, so the last frame is drawn again
+            self._damaged = True
+            self._present(*self._last_submitted)
+
+        if self._threaded:
+            with self._mailbox_condition:
+                self._capture_requested = True
+                self._mailbox_condition.notify()
+            with self._capture_condition:
+                self._capture_condition.wait_for(lambda: self._capture_requested == False, timeout=CAPTURE_TIMEOUT)
+        else:
+            _make_context_current(self._window)
+            self._collect_readback(wait=True)
+        return self._captured_frame
+
+
+    # MARK: show_tiled()
+    def show_tiled(self, image: numpy.ndarray, channel_order: str = None, tile_size: int = TILE_SIZE, version=None):
+        """
+        Show an image of any size, also larger than the maximum texture size, in a zoomable and pannable view
+        The image is split into tiles and only the tiles which are visible at the current zoom are uploaded,
+        zoomed out views read a strided sample of the image and average it into a coarser tile level,
+        and the uploaded tiles are cached, so numpy.memmap images are only read where they are looked at
+        Scroll to zoom at the cursor and drag with the left mouse button to pan, see also set_view()
+
+        Parameters
+        ----------
+        image : numpy.ndarray
+            The image to show, with 1, 3 or 4 channels
+        channel_order : str, optional
+            The order of the channels in the image, see show()
+        tile_size : int, optional
+            The size of the tiles in pixels
+        version : hashable, optional
+            Changes whenever the content of the image changes, the cached tiles are then uploaded again
+
+        Returns
+        -------
+        None
+        """
+        if numpy.ndim(image) not in (2, 3) or image.shape[0] == 0 or image.shape[1] == 0:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: show_tiled() needs an image with a height, a width and optionally channels" + NORMAL)
+            return
+        return self._show(image, {"channel_order": channel_order, "tile_size": max(TEXTURE_BUCKET, int(tile_size)), "version": version}, version)
+
+
+    # MARK: set_view()
+    def set_view(self, center: tuple = None, zoom: float = None):
+        """
+        Set the view of show_tiled()
+
+        Parameters
+        ----------
+        center : tuple, optional
+            The image pixel (x, y) in the center of the window, None to fit the whole image into the window
+        zoom : float, optional
+            The number of window pixels per image pixel, None to keep the zoom
+
+        Returns
+        -------
+        None
+        """
+        if center == None or self._view == None:
+            self._view = None
+        else:
+            self._view = (center[0], center[1], self._view[2] if zoom == None else min(max(zoom, 1e-6), TILE_MAX_ZOOM))
+        self._damaged = True
+        if _glfw_initialized:
+            glfw.post_empty_event()
+
+
+    # MARK: get_view()
+    def get_view(self):
+        """
+        Get the view of show_tiled()
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        tuple
+            The image pixel (x, y) in the center of the window and the number of window pixels per image pixel,
+            None if the view was not set up yet
+        """
+        if self._view == None:
+            return None
+        return (self._view[0], self._view[1]), self._view[2]
+
+
+    # MARK: set_layer()
+    def set_layer(self, name: str, frame: numpy.ndarray = None, position: tuple = None, scale: float = None,
+                  opacity: float = None, blend_mode: str = None, z: float = None, channel_order: str = None):
+        """
+        Create or update a layer which is composited on top of the frame on the GPU
+        Only the given properties are changed, the frame of a layer is only uploaded again when a new one is set,
+        so a static frame uploads once while a layer on top of it changes every frame
+        The layers are drawn with the next shown frame, in threaded mode the frame must not be modified afterwards
+
+        Parameters
+        ----------
+        name : str
+            The name of the layer
+        frame : numpy.ndarray, optional
+            The new frame of the layer, bgra frames are blended with their alpha channel
+        position : tuple, optional
+            The position (x, y) of the top left corner of the layer in pixels of the shown frame, defaults to (0, 0)
+        scale : float, optional
+            The size of a pixel of the layer in pixels of the shown frame, defaults to 1
+        opacity : float, optional
+            The opacity of the layer from 0 to 1, defaults to 1
+        blend_mode : str, optional
+            "normal", "add", "multiply" or "screen", defaults to "normal"
+        z : float, optional
+            Layers with a higher z are drawn on top of layers with a lower z, defaults to 0
+        channel_order : str, optional
+            The order of the channels in the frame, see show()
+
+        Returns
+        -------
+        None
+        """
+        if blend_mode != None and blend_mode not in BLEND_MODES:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: blend_mode must be one of " + ", ".join(BLEND_MODES) + NORMAL)
+            return
+        with self._layers_lock:
+            layer = self._layers.get(name)
+            if layer == None:
+                layer = self._layers[name] = _Layer()
+            if frame is not None:
+                layer.frame = frame
+                layer.channel_order = channel_order
+                layer.changed = True
+            if position != None:
+                layer.position = position
+            if scale != None:
+                layer.scale = scale
+            if opacity != None:
+                layer.opacity = min(max(opacity, 0.0), 1.0)
+            if blend_mode != None:
+                layer.blend_mode = blend_mode
+            if z != None:
+                layer.z = z
+        self._damaged = True
+        if _glfw_initialized:
+            # wakes up run() so the layer is drawn without a new frame
+            glfw.post_empty_event()
+
+
+    # MARK: remove_layer()
+    def remove_layer(self, name: str):
+        """
+        Remove a layer
+
+        Parameters
+        ----------
+        name : str
+            The name of the layer
+
+        Returns
+        -------
+        None
+        """
+        with self._layers_lock:
+            layer = self._layers.pop(name, None)
+            if layer == None:
+                return
+            # the texture is deleted by the thread which owns the context
+            if layer.texture != None:
+                self._released_textures.append(layer.texture.id)
+        self._damaged = True
+        if _glfw_initialized:
+            glfw.post_empty_event()
+
+
+    # MARK: get_layers()
+    def get_layers(self):
+        """
+        Get the names of the layers in the order they are drawn
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        list
+            The names of the layers, sorted by z
+        """
+        with self._layers_lock:
+            return [name for name, layer in sorted(self._layers.items(), key=lambda item: item[1].z)]
+
+
+    # MARK: draw_rects()
+    def draw_rects(self, rects, colors=(0, 255, 0), thickness: float = 1):
+        """
+        Draw rectangles on top of the frame on the GPU
+        Overlays stay until clear_overlays() is called and are drawn with every frame, all overlays together in one draw call,
+        so overlays which change with every frame, like detections, need clear_overlays() before the ones of the next frame
+        are drawn, otherwise they pile up
+
+        Parameters
+        ----------
+        rects : numpy.ndarray
+            The (count, 4) rectangles (x, y, width, height) in pixels of the frame
+        colors : tuple or numpy.ndarray, optional
+            One (b, g, r) or (b, g, r, a) color from 0 to 255 for all rectangles, or one color per rectangle
+        thickness : float, optional
+            The thickness of the outline in pixels of the frame, 0 or less to fill the rectangles
+
+        Returns
+        -------
+        None
+        """
+        rects = numpy.asarray(rects, dtype=numpy.float32).reshape(-1, 4)
+        colors = _get_overlay_colors(colors, len(rects))
+        x0, y0 = rects[:, 0], rects[:, 1]
+        x1, y1 = x0 + rects[:, 2], y0 + rects[:, 3]
+        if thickness <= 0:
+            boxes = [(x0, y0, x1, y1)]
+        else:
+            # the outline is centered on the edges like with cv2.rectangle()
+            half = thickness / 2
+            boxes = [(x0 - half, y0 - half, x1 + half, y0 + half), (x0 - half, y1 - half, x1 + half, y1 + half),
+                     (x0 - half, y0 + half, x0 + half, y1 - half), (x1 - half, y0 + half, x1 + half, y1 - half)]
+        left, top, right, bottom = (numpy.concatenate(values) for values in zip(*boxes))
+        corners = tuple(numpy.stack(corner, axis=1) for corner in ((left, top), (right, top), (left, bottom), (right, bottom)))
+        self._add_overlay(_get_overlay_vertices(corners, numpy.concatenate([colors] * len(boxes))))
+
+
+    # MARK: draw_lines()
+    def draw_lines(self, lines, colors=(0, 255, 0), thickness: float = 1):
+        """
+        Draw lines on top of the frame on the GPU, they stay until clear_overlays() is called, see draw_rects()
+
+        Parameters
+        ----------
+        lines : numpy.ndarray
+            The (count, 4) lines (x0, y0, x1, y1) in pixels of the frame
+        colors : tuple or numpy.ndarray, optional
+            One (b, g, r) or (b, g, r, a) color from 0 to 255 for all lines, or one color per line
+        thickness : float, optional
+            The thickness of the lines in pixels of the frame
+
+        Returns
+        -------
+        None
+        """
+        lines = numpy.asarray(lines, dtype=numpy.float32).reshape(-1, 4)
+        colors = _get_overlay_colors(colors, len(lines))
+        start, end = lines[:, 0:2], lines[:, 2:4]
+        direction = end - start
+        length = numpy.linalg.norm(direction, axis=1, keepdims=True)
+        normal = numpy.stack((-direction[:, 1], direction[:, 0]), axis=1) / numpy.maximum(length, 1e-6) * (thickness / 2)
+        self._add_overlay(_get_overlay_vertices((start - normal, end - normal, start + normal, end + normal), colors))
+
+
+    # MARK: draw_points()
+    def draw_points(self, points, colors=(0, 255, 0), size: float = 3):
+        """
+        Draw square points on top of the frame on the GPU, they stay until clear_overlays() is called, see draw_rects()
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            The (count, 2) points (x, y) in pixels of the frame
+        colors : tuple or numpy.ndarray, optional
+            One (b, g, r) or (b, g, r, a) color from 0 to 255 for all points, or one color per point
+        size : float, optional
+            The size of the points in pixels of the frame
+
+        Returns
+        -------
+        None
+        """
+        points = numpy.asarray(points, dtype=numpy.float32).reshape(-1, 2)
+        colors = _get_overlay_colors(colors, len(points))
+        half = size / 2
+        self._add_overlay(_get_overlay_vertices((points + (-half, -half), points + (half, -half),
+                                                 points + (-half, half), points + (half, half)), colors))
+
+
+    # MARK: draw_text()
+    def draw_text(self, texts, positions, colors=(0, 255, 0), scale: float = 1.0):
+        """
+        Draw text on top of the frame on the GPU with glyphs from a cached atlas,
+        it stays until clear_overlays() is called, see draw_rects()
+
+        Parameters
+        ----------
+        texts : str or list
+            The text or a list of texts
+        positions : tuple or numpy.ndarray
+            The position (x, y) of the bottom left corner of the text in pixels of the frame like with cv2.putText(),
+            or one position per text
+        colors : tuple or numpy.ndarray, optional
+            One (b, g, r) or (b, g, r, a) color from 0 to 255 for all texts, or one color per text
+        scale : float, optional
+            The font scale like with cv2.putText()
+
+        Returns
+        -------
+        None
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+        positions = numpy.asarray(positions, dtype=numpy.float32).reshape(-1, 2)
+        colors = _get_overlay_colors(colors, len(texts))
+        atlas, rectangles, advances, ascent, height = _get_glyph_atlas()
+
+        indices = [numpy.array([GLYPH_CHARACTERS.find(character) if character in GLYPH_CHARACTERS else GLYPH_CHARACTERS.index("?")
+                                for character in text], dtype=numpy.int64) for text in texts]
+        counts = [len(text_indices) for text_indices in indices]
+        indices = numpy.concatenate(indices) if len(indices) > 0 else numpy.zeros(0, dtype=numpy.int64)
+        if len(indices) == 0:
+            return
+        # every glyph starts where the previous glyph of its text ended
+        starts = numpy.repeat(numpy.cumsum([0] + counts[:-1]), counts)
+        offsets = numpy.cumsum(advances[indices]) - advances[indices]
+        offsets = offsets - offsets[starts]
+        origins = numpy.broadcast_to(positions, (len(texts), 2))[numpy.repeat(numpy.arange(len(texts)), counts)]
+
+        left = origins[:, 0] + (offsets - GLYPH_PADDING) * scale
+        right = left + (advances[indices] + 2 * GLYPH_PADDING) * scale
+        top = origins[:, 1] - ascent * scale
+        bottom = top + height * scale
+        corners = tuple(numpy.stack(corner, axis=1) for corner in ((left, top), (right, top), (left, bottom), (right, bottom)))
+        self._add_overlay(_get_overlay_vertices(corners, colors[numpy.repeat(numpy.arange(len(texts)), counts)], rectangles[indices]))
+
+
+    # MARK: clear_overlays()
+    def clear_overlays(self):
+        """
+        Remove all rectangles, lines, points and text drawn with the draw functions
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        with self._overlays_lock:
+            self._overlays = []
+            self._overlays_changed = True
+        self._damaged = True
+
+
+    # MARK: _add_overlay()
+    def _add_overlay(self, vertices: numpy.ndarray):
+        """
+        Add vertices to the overlays and make sure they are drawn
+
+        Parameters
+        ----------
+        vertices : numpy.ndarray
+            The vertices from _get_overlay_vertices()
+
+        Returns
+        -------
+        None
+        """
+        with self._overlays_lock:
+            # a new list, so the render thread can keep using the old one
+            self._overlays = self._overlays + [vertices]
+            self._overlays_changed = True
+        self._damaged = True
+        if _glfw_initialized:
+            glfw.post_empty_event()
+
+
+    # MARK: _show()
+    def _show(self, frame, options: dict, version=None):
+        """
+        Show the frame with the options of show() or show_yuv()
+        An unchanged frame is not uploaded again, and not even redrawn unless the window was resized, exposed or restored
+
+        Parameters
+        ----------
+        frame : numpy.ndarray or tuple
+            The frame to show
+        options : dict
+            The options of the frame
+        version : hashable, optional
+            The version of the frame
+
+        Returns
+        -------
+        numpy.ndarray
+            The composited bgr frame for headless windows, otherwise None
+        """
+        state = self._prepare_show()
+        if state == "closed":
+            return None
+        rendered = state == "ready" and self._present(frame, options, version)
+        if self._headless:
+            return self._captured_frame
+
+        # the events of grouped windows are polled once per tick by the group, show() never waits for events,
+        # a loop which should sleep while nothing changes uses run() instead
+        if self._group == None:
+            glfw.poll_events()
+            profiler = self._profiler
+            if profiler != None and rendered and self._threaded == False:
+                profiler.mark(STAGE_EVENTS)
+
+
+    # MARK: _present()
+    def _present(self, frame, options: dict, version=None):
+        """
+        Submit the frame unless it did not change and the window does not have to be redrawn
+
+        Parameters
+        ----------
+        frame : numpy.ndarray or tuple
+            The frame to show
+        options : dict
+            The options of the frame
+        version : hashable, optional
+            The version of the frame
+
+        Returns
+        -------
+        bool
+            True if the frame was submitted
+        """
+        submitted = True
+        damaged = self._damaged
+        # cleared first, so damage which happens while the frame is rendered is kept for the next one
+        self._damaged = False
+        if self._is_unchanged(frame, options, version) == False:
+            self._submit(frame, options)
+        elif damaged:
+            self._submit(frame, dict(options, skip_upload=True))
+        else:
+            self._skipped_frames += 1
+            submitted = False
+        return submitted
+
+
+    # MARK: _is_unchanged()
+    def _is_unchanged(self, frame, options: dict, version=None):
+        """
+        Check if the frame and its options are the same as the last shown ones and remember them
+
+        Parameters
+        ----------
+        frame : numpy.ndarray or tuple
+            The frame to show
+        options : dict
+            The options of the frame
+        version : hashable, optional
+            The version of the frame
+
+        Returns
+        -------
+        bool
+            True if the frame does not have to be uploaded again
+        """
+        planes = frame if isinstance(frame, tuple) else (frame,)
+        if version != None:
+            key = ("version", version)
+        elif self._skip_unchanged == "identity":
+            # the last frame is kept alive, so the ids can not be reused by other arrays
+            key = ("identity",) + tuple(id(plane) for plane in planes)
+        elif self._skip_unchanged == "checksum":
+            key = ("checksum",)
+            for plane in planes:
+                plane = numpy.asarray(plane)
+                data = plane if plane.flags.c_contiguous else numpy.ascontiguousarray(plane)
+                key += (plane.shape, plane.dtype.str, zlib.adler32(data.reshape(-1).view(numpy.uint8)))
+        else:
+            self._content_key = None
+            self._content_frame = None
+            return False
+
+        key = (key, tuple((name, value) for name, value in options.items() if name != "dirty_rects"))
+        unchanged = key == self._content_key
+        self._content_key = key
+        self._content_frame = frame
+        return unchanged
+
+
+    # MARK: _prepare_show()
+    def _prepare_show(self):
+        """
+        Create, reopen or close the window as needed before a frame is shown
+        Only the state cached from the callbacks is used, so no frame waits for a query to the window system
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        str
+            "ready" if the frame can be shown, "minimized" if the window is minimized
+            and "closed" if the window is closed
+        """
+        if self._open == False:
+            self.create_window()
+
+        if self._open == False and self._undestroyable == False:
+            return "closed"
+
+        if self._headless:
+            return "ready" if self._open == True else "closed"
+
+        if self._close_requested:
+            if self._open == True:
+                self.close()
+                self._open = "user_closed"
+            if self._undestroyable:
+                self.create_window()
+            return "closed"
+
+        if self._minimized:
+            return "minimized"
+        return "ready"
+
+
+    # MARK: _submit()
+    def _submit(self, frame, options: dict):
+        """
+        Render the frame, or hand it over to the render thread in threaded mode
+
+        Parameters
+        ----------
+        frame : numpy.ndarray or tuple
+            The frame to show
+        options : dict
+            The options of the frame
+
+        Returns
+        -------
+        None
+        """
+        self._last_submitted = (frame, options)
+        if self._threaded:
+            with self._mailbox_condition:
+                if self._mailbox != None and options.get("skip_upload"):
+                    # the pending frame has the same content and is presented anyway
+                    return
+                if self._mailbox != None:
+                    self._dropped_frames += 1
+                    # the regions which changed in the dropped frame still have to be uploaded
+                    dirty_rects = options.get("dirty_rects")
+                    if isinstance(dirty_rects, list):
+                        dropped_rects = self._mailbox[1].get("dirty_rects")
+                        options = dict(options, dirty_rects=dirty_rects + dropped_rects if isinstance(dropped_rects, list) else None)
+                self._mailbox = (frame, options)
+                self._mailbox_condition.notify()
+        else:
+            _make_context_current(self._window)
+            self._render(frame, options)
+
+
+    # MARK: _render()
+    def _render(self, frame, options: dict):
+        """
+        Upload the frame, draw it and present it
+        Must be called with the context of the window current
+
+        Parameters
+        ----------
+        frame : numpy.ndarray or tuple
+            The frame to show
+        options : dict
+            The options of the frame
+
+        Returns
+        -------
+        None
+        """
+        profiler = self._profiler
+        if profiler != None:
+            profiler.begin_frame()
+
+        yuv = "pixel_format" in options
+        tiled = "tile_size" in options
+        upload = options.get("skip_upload") != True and tiled == False
+        if upload and yuv:
+            planes = self._get_yuv_planes(frame, options["pixel_format"])
+            if planes == None:
+                return
+        elif upload:
+            upload_format = self._get_upload_format(frame, options["channel_order"])
+            if upload_format == None:
+                return
+
+        width, height = self._framebuffer_size
+        if self._headless:
+            self._bind_headless_framebuffer(width, height)
+        gl.glViewport(0, 0, width, height)
+        gl.glClearColor(0.0, 0.0, 0.0, 1.0)
+        gl.glClear(gl.GL_COLOR_BUFFER_BIT)
+
+        if profiler != None:
+            profiler.mark(STAGE_PREPARE)
+            gpu_query = profiler.begin_gpu()
+
+        # the textures keep the native resolution of the frame, the quad does the scaling
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+        if upload and yuv:
+            self._content_size = self._upload_yuv(planes)
+        elif upload:
+            self._content_size = frame.shape[1], frame.shape[0]
+            self._upload_image(self._texture, frame, upload_format, options.get("dirty_rects"))
+        elif tiled:
+            self._content_size = frame.shape[1], frame.shape[0]
+            tiles = self._upload_tiles(frame, options)
+        frame_width, frame_height = self._content_size
+        layers = self._upload_layers()
+
+        if profiler != None:
+            profiler.mark(STAGE_UPLOAD)
+
+        if tiled:
+            x, y, u0, v0, u1, v1 = self._get_view_quad(frame_width, frame_height, width, height)
+        else:
+            x, y, u0, v0, u1, v1 = self._get_quad(frame_width, frame_height, width, height)
+        # the quad goes from the bottom left to the top right, the first row of the frame is at the top
+        if tiled:
+            self._draw_tiles(tiles, frame_width, frame_height, (u0, v0, u1, v1))
+        elif yuv:
+            self._draw_yuv((-x, -y, x, y), (u0, v1, u1, v0), frame_width, frame_height, options)
+        else:
+            texture_scale_u, texture_scale_v = self._texture.get_texture_scale()
+            self._draw_texture(self._texture, (-x, -y, x, y),
+                               (u0 * texture_scale_u, v1 * texture_scale_v, u1 * texture_scale_u, v0 * texture_scale_v),
+                               colormap=options.get("colormap"), value_range=options.get("value_range"))
+        if len(layers) > 0:
+            self._draw_layers(layers, frame_width, frame_height, (x, y, u0, v0, u1, v1))
+        self._draw_overlays(frame_width, frame_height, (x, y, u0, v0, u1, v1))
+        if self._recording_queue != None or self._capture_enabled:
+            self._read_back()
+
+        if profiler != None:
+            if gpu_query:
+                profiler.end_gpu()
+            profiler.mark(STAGE_DRAW)
+
+        if self._vsync_changed and self._headless == False:
+            self._apply_vsync()
+        if self._target_fps != None:
+            self._wait_for_next_present()
+
+        if profiler != None:
+            profiler.mark(STAGE_PACE)
+
+        if self._headless:
+            self._read_headless_framebuffer(width, height)
+        else:
+            glfw.swap_buffers(self._window)
+        self._presented_frames += 1
+        with self._present_times_lock:
+            self._present_times.append(time.perf_counter())
+
+        if profiler != None:
+            profiler.mark(STAGE_SWAP)
+
+
+    # MARK: _upload_image()
+    def _upload_image(self, texture: _Texture, frame: numpy.ndarray, upload_format: tuple, dirty_rects=None):
+        """
+        Upload the frame into the texture, through the pixel buffer objects if enabled
+        Only the dirty rectangles are uploaded if the texture still holds the previous frame of the same size and format
+
+        Parameters
+        ----------
+        texture : _Texture
+            The texture to upload to
+        frame : numpy.ndarray
+            The frame to upload
+        upload_format : tuple
+            The upload format from _get_upload_format()
+        dirty_rects : list or str, optional
+            The changed rectangles (x, y, width, height), "auto" to find them, None to upload the whole frame
+
+        Returns
+        -------
+        None
+        """
+        dtype, internal_format, gl_format, gl_type, swizzle = upload_format
+        frame_height, frame_width = frame.shape[:2]
+        content = (frame_width, frame_height, gl_format, gl_type)
+
+        gl.glBindTexture(gl.GL_TEXTURE_2D, texture.id)
+        reallocated = texture.reserve(frame_width, frame_height, internal_format)
+        texture.set_swizzle(swizzle)
+
+        if dirty_rects == "auto":
+            dirty_rects = self._find_dirty_rects(frame)
+        if dirty_rects != None and reallocated == False and texture.content == content and frame.dtype == dtype:
+            self._upload_rects(frame, dirty_rects, gl_format, gl_type)
+            return
+        texture.content = content
+
+        if self._pbo_upload == False or self._upload_pbo(frame, dtype, gl_format, gl_type) == False:
+            row_length = self._get_row_length(frame, dtype)
+            if row_length == None:
+                frame = numpy.ascontiguousarray(frame, dtype=dtype)
+                row_length = frame_width
+            elif frame.flags.c_contiguous == False:
+                # the padded rows are skipped by GL_UNPACK_ROW_LENGTH instead of being copied
+                self._copies_avoided += 1
+            if row_length != frame_width:
+                gl.glPixelStorei(gl.GL_UNPACK_ROW_LENGTH, row_length)
+            gl.glTexSubImage2D(
+                gl.GL_TEXTURE_2D,
+                0, 0, 0,
+                frame_width, frame_height,
+                gl_format,
+                gl_type,
+                ctypes.c_void_p(frame.ctypes.data)
+            )
+            if row_length != frame_width:
+                gl.glPixelStorei(gl.GL_UNPACK_ROW_LENGTH, 0)
+            # the array is passed as is, so the old tobytes() copy is skipped
+            self._copies_avoided += 1
+        self._uploaded_bytes += frame.size * dtype.itemsize
+
+
+    # MARK: _upload_rects()
+    def _upload_rects(self, frame: numpy.ndarray, rects: list, gl_format: int, gl_type: int):
+        """
+        Upload rectangles of the frame into the bound texture, straight from the frame without cropping copies
+
+        Parameters
+        ----------
+        frame : numpy.ndarray
+            The frame, its dtype must match the texture
+        rects : list
+            The rectangles (x, y, width, height) to upload, clipped to the frame
+        gl_format : int
+            The GL format of the pixels
+        gl_type : int
+            The GL type of the pixels
+
+        Returns
+        -------
+        None
+        """
+        frame_height, frame_width = frame.shape[:2]
+        row_length = self._get_row_length(frame, frame.dtype)
+        if row_length == None:
+            frame = numpy.ascontiguousarray(frame)
+            row_length = frame_width
+        pixel_size = frame.itemsize * (1 if frame.ndim == 2 else frame.shape[2])
+        pointer = ctypes.c_void_p(frame.ctypes.data)
+
+        gl.glPixelStorei(gl.GL_UNPACK_ROW_LENGTH, row_length)
+        for x, y, width, height in rects:
+            x0, y0 = max(0, x), max(0, y)
+            x1, y1 = min(frame_width, x + width), min(frame_height, y + height)
+            if x1 <= x0 or y1 <= y0:
+                continue
+            gl.glPixelStorei(gl.GL_UNPACK_SKIP_PIXELS, x0)
+            gl.glPixelStorei(gl.GL_UNPACK_SKIP_ROWS, y0)
+            gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, x0, y0, x1 - x0, y1 - y0, gl_format, gl_type, pointer)
+            self._uploaded_bytes += (x1 - x0) * (y1 - y0) * pixel_size
+        gl.glPixelStorei(gl.GL_UNPACK_ROW_LENGTH, 0)
+        gl.glPixelStorei(gl.GL_UNPACK_SKIP_PIXELS, 0)
+        gl.glPixelStorei(gl.GL_UNPACK_SKIP_ROWS, 0)
+
+
+    # MARK: _find_dirty_rects()
+    def _find_dirty_rects(self, frame: numpy.ndarray):
+        """
+        Find the tiles which changed since the last frame with a vectorized comparison
+        Neighbouring changed tiles in a row of tiles are merged into one rectangle
+
+        Parameters
+        ----------
+        frame : numpy.ndarray
+            The new frame
+
+        Returns
+        -------
+        list
+            The changed rectangles (x, y, width, height), None if the whole frame should be uploaded
+        """
+        previous = self._previous_frame
+        if previous is None or previous.shape != frame.shape or previous.dtype != frame.dtype:
+            self._previous_frame = numpy.array(frame)
+            return None
+
+        changed = frame != previous
+        if changed.ndim == 3:
+            changed = changed.any(axis=2)
+        frame_height, frame_width = changed.shape
+        tiles = numpy.logical_or.reduceat(changed, numpy.arange(0, frame_height, DIRTY_TILE_SIZE), axis=0)
+        tiles = numpy.logical_or.reduceat(tiles, numpy.arange(0, frame_width, DIRTY_TILE_SIZE), axis=1)
+        if tiles.mean() > DIRTY_FULL_UPLOAD_FRACTION:
+            numpy.copyto(previous, frame)
+            return None
+
+        rects = []
+        # the starts and ends of the runs of changed tiles in every row of tiles
+        edges = numpy.diff(numpy.pad(tiles.astype(numpy.int8), ((0, 0), (1, 1))), axis=1)
+        for row, start in zip(*numpy.nonzero(edges == 1)):
+            end = start + numpy.argmax(edges[row, start:] == -1)
+            x, y = int(start) * DIRTY_TILE_SIZE, int(row) * DIRTY_TILE_SIZE
+            width = min(frame_width, int(end) * DIRTY_TILE_SIZE) - x
+            height = min(frame_height, y + DIRTY_TILE_SIZE) - y
+            previous[y:y + height, x:x + width] = frame[y:y + height, x:x + width]
+            rects.append((x, y, width, height))
+        return rects
+
+
+    # MARK: _get_row_length()
+    def _get_row_length(self, frame: numpy.ndarray, dtype: numpy.dtype):
+        """
+        Get the row length in pixels for GL_UNPACK_ROW_LENGTH, so frames with padded rows can be uploaded without a copy
+
+        Parameters
+        ----------
+        frame : numpy.ndarray
+            The frame
+        dtype : numpy.dtype
+            The dtype the frame is uploaded as
+
+        Returns
+        -------
+        int
+            The distance between two rows in pixels, None if the frame has to be made contiguous first
+        """
+        if frame.dtype != dtype:
+            return None
+        pixel_size = frame.itemsize * (1 if frame.ndim == 2 else frame.shape[2])
+        if frame.ndim == 3 and frame.strides[2] != frame.itemsize:
+            return None
+        if frame.shape[1] > 1 and frame.strides[1] != pixel_size:
+            return None
+        if frame.shape[0] == 1:
+            return frame.shape[1]
+        if frame.strides[0] < pixel_size * frame.shape[1] or frame.strides[0] % pixel_size != 0:
+            return None
+        return frame.strides[0] // pixel_size
+
+
+    # MARK: _upload_yuv()
+    def _upload_yuv(self, planes: list):
+        """
+        Upload the planes of a YUV frame into the plane textures
+
+        Parameters
+        ----------
+        planes : list
+            The planes from _get_yuv_planes()
+
+        Returns
+        -------
+        tuple
+            The size (width, height) of the frame in pixels
+        """
+        while len(self._plane_textures) < len(planes):
+            self._plane_textures.append(_Texture())
+
+        frame_width, frame_height = planes[0][0].shape[1], planes[0][0].shape[0]
+        for texture, (plane, internal_format, gl_format) in zip(self._plane_textures, planes):
+            plane_height, plane_width = plane.shape[:2]
+            gl.glBindTexture(gl.GL_TEXTURE_2D, texture.id)
+            texture.reserve(plane_width, plane_height, getattr(gl, internal_format))
+            texture.set_swizzle((gl.GL_RED, gl.GL_GREEN, gl.GL_BLUE, gl.GL_ALPHA))
+            gl.glTexSubImage2D(
+                gl.GL_TEXTURE_2D,
+                0, 0, 0,
+                plane_width, plane_height,
+                getattr(gl, gl_format),
+                gl.GL_UNSIGNED_BYTE,
+                numpy.ascontiguousarray(plane)
+            )
+            self._uploaded_bytes += plane.size
+        if planes[0][2] == "GL_RGBA":
+            frame_width *= 2
+        return frame_width, frame_height
+
+
+    # MARK: _draw_yuv()
+    def _draw_yuv(self, rect: tuple, content_rect: tuple, frame_width: int, frame_height: int, options: dict):
+        """
+        Draw the uploaded YUV frame and convert it to RGB in the fragment shader
+
+        Parameters
+        ----------
+        rect : tuple
+            The rectangle (x0, y0, x1, y1) in normalized device coordinates, from the bottom left to the top right
+        content_rect : tuple
+            The coordinates (u0, v0, u1, v1) of the frame in the range 0 to 1 which are mapped to the corners of the rectangle
+        frame_width : int
+            The width of the frame in pixels
+        frame_height : int
+            The height of the frame in pixels
+        options : dict
+            The options of show_yuv()
+
+        Returns
+        -------
+        None
+        """
+        program = self._get_program("yuv")
+        gl.glUseProgram(program.id)
+        gl.glBindVertexArray(self._quad_vao)
+        uniforms = program.uniforms
+        gl.glUniform4f(uniforms["u_rect"], *rect)
+        gl.glUniform4f(uniforms["u_texture_rect"], *content_rect)
+
+        plane_count = {"nv12": 2, "i420": 3, "yuyv": 1}[options["pixel_format"]]
+        # packed yuyv texels hold two pixels, so they are always fetched exactly
+        gl_filter = gl.GL_NEAREST if self._interpolation == "nearest" or plane_count == 1 else gl.GL_LINEAR
+        scales = numpy.ones((3, 2), dtype=numpy.float32)
+        limits = numpy.ones((3, 2), dtype=numpy.float32)
+        for index, texture in enumerate(self._plane_textures[:plane_count]):
+            gl.glActiveTexture(gl.GL_TEXTURE0 + index)
+            gl.glBindTexture(gl.GL_TEXTURE_2D, texture.id)
+            texture.set_filter(gl_filter)
+            gl.glUniform1i(uniforms["u_plane" + str(index)], index)
+            scales[index] = texture.get_texture_scale()
+            limits[index] = texture.get_texture_limit()
+        gl.glActiveTexture(gl.GL_TEXTURE0)
+
+        matrix, offset = _get_yuv_matrix(options["color_space"], options["full_range"])
+        gl.glUniform2fv(uniforms["u_plane_scale"], 3, scales)
+        gl.glUniform2fv(uniforms["u_plane_limit"], 3, limits)
+        gl.glUniform1i(uniforms["u_pixel_format"], YUV_PIXEL_FORMATS.index(options["pixel_format"]))
+        gl.glUniform2f(uniforms["u_frame_size"], frame_width, frame_height)
+        gl.glUniformMatrix3fv(uniforms["u_matrix"], 1, gl.GL_TRUE, matrix)
+        gl.glUniform3f(uniforms["u_offset"], *offset)
+        gl.glDrawArrays(gl.GL_TRIANGLE_STRIP, 0, 4)
+
+
+    # MARK: _draw_texture()
+    def _draw_texture(self, texture: _Texture, rect: tuple, texture_rect: tuple, opacity: float = 1.0, blend_mode: str = None,
+                      colormap=None, value_range: tuple = None):
+        """
+        Draw a part of the texture into a rectangle of the framebuffer
+
+        Parameters
+        ----------
+        texture : _Texture
+            The texture to draw
+        rect : tuple
+            The rectangle (x0, y0, x1, y1) in normalized device coordinates, from the bottom left to the top right
+        texture_rect : tuple
+            The texture coordinates (u0, v0, u1, v1) which are mapped to the corners of the rectangle
+        opacity : float, optional
+            The opacity the alpha of the texture is multiplied with
+        blend_mode : str, optional
+            One of BLEND_MODES, the blend function has to be set up by the caller, None to draw the texture opaque
+        colormap : hashable, optional
+            The key of the lookup table in _colormap_luts the red channel is mapped through, None to draw the colors
+        value_range : tuple, optional
+            The sampled values (low, high) which are mapped to the start and the end of the colormap
+
+        Returns
+        -------
+        None
+        """
+        program = self._get_program("image")
+        gl.glUseProgram(program.id)
+        gl.glBindVertexArray(self._quad_vao)
+        gl.glUniform4f(program.uniforms["u_rect"], *rect)
+        gl.glUniform4f(program.uniforms["u_texture_rect"], *texture_rect)
+        gl.glUniform2f(program.uniforms["u_texture_limit"], *texture.get_texture_limit())
+        gl.glUniform1f(program.uniforms["u_opacity"], opacity)
+        gl.glUniform1i(program.uniforms["u_blend_mode"], -1 if blend_mode == None else list(BLEND_MODES).index(blend_mode))
+        gl.glUniform1i(program.uniforms["u_colormapped"], 0 if colormap == None else 1)
+        if colormap != None:
+            colormap_texture = self._get_colormap_texture(colormap)
+            gl.glUniform1i(program.uniforms["u_colormap"], 1)
+            gl.glUniform2f(program.uniforms["u_value_range"], *value_range)
+            gl.glActiveTexture(gl.GL_TEXTURE1)
+            gl.glBindTexture(gl.GL_TEXTURE_2D, colormap_texture)
+            gl.glActiveTexture(gl.GL_TEXTURE0)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, texture.id)
+        texture.set_filter(gl.GL_NEAREST if self._interpolation == "nearest" else gl.GL_LINEAR)
+        gl.glDrawArrays(gl.GL_TRIANGLE_STRIP, 0, 4)
+
+
+    # MARK: _get_colormap_texture()
+    def _get_colormap_texture(self, colormap):
+        """
+        Get the texture of a colormap lookup table, uploaded on first use
+
+        Parameters
+        ----------
+        colormap : hashable
+            The key of the lookup table in _colormap_luts
+
+        Returns
+        -------
+        int
+            The id of the texture
+        """
+        texture = self._colormap_textures.get(colormap)
+        if texture == None:
+            texture = gl.glGenTextures(1)
+            gl.glBindTexture(gl.GL_TEXTURE_2D, texture)
+            gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGB8, COLORMAP_SIZE, 1, 0, gl.GL_BGR, gl.GL_UNSIGNED_BYTE, _colormap_luts[colormap])
+            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
+            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
+            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE)
+            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
+            self._colormap_textures[colormap] = texture
+        return texture
+
+
+    # MARK: _upload_layers()
+    def _upload_layers(self):
+        """
+        Upload the layers whose frame changed since they were drawn the last time
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        list
+            The layers which can be drawn, sorted by z
+        """
+        with self._layers_lock:
+            layers = sorted(self._layers.values(), key=lambda layer: layer.z)
+            changed = [(layer, layer.frame, layer.channel_order) for layer in layers if layer.changed]
+            for layer in layers:
+                layer.changed = False
+            released, self._released_textures = self._released_textures, []
+
+        if len(released) > 0:
+            gl.glDeleteTextures(released)
+
+        for layer, frame, channel_order in changed:
+            upload_format = self._get_upload_format(frame, channel_order)
+            if upload_format == None:
+                continue
+            if layer.texture == None:
+                layer.texture = _Texture()
+            self._upload_image(layer.texture, frame, upload_format)
+            layer.size = frame.shape[1], frame.shape[0]
+        return [layer for layer in layers if layer.texture != None]
+
+
+    # MARK: _draw_layers()
+    def _draw_layers(self, layers: list, frame_width: int, frame_height: int, quad: tuple):
+        """
+        Composite the layers on top of the drawn frame, clipped to the frame
+
+        Parameters
+        ----------
+        layers : list
+            The layers to draw, sorted by z
+        frame_width : int
+            The width of the frame in pixels
+        frame_height : int
+            The height of the frame in pixels
+        quad : tuple
+            The quad of the frame from _get_quad()
+
+        Returns
+        -------
+        None
+        """
+        x, y, u0, v0, u1, v1 = quad
+        width, height = self._framebuffer_size
+        gl.glEnable(gl.GL_SCISSOR_TEST)
+        gl.glScissor(round((1 - x) / 2 * width), round((1 - y) / 2 * height), round(x * width), round(y * height))
+        gl.glEnable(gl.GL_BLEND)
+
+        for layer in layers:
+            layer_width, layer_height = layer.size
+            # the position and size of the layer in frame pixels mapped to normalized device coordinates
+            left = -x + (layer.position[0] / frame_width - u0) / (u1 - u0) * 2 * x
+            right = -x + ((layer.position[0] + layer_width * layer.scale) / frame_width - u0) / (u1 - u0) * 2 * x
+            top = y - (layer.position[1] / frame_height - v0) / (v1 - v0) * 2 * y
+            bottom = y - ((layer.position[1] + layer_height * layer.scale) / frame_height - v0) / (v1 - v0) * 2 * y
+            texture_scale_u, texture_scale_v = layer.texture.get_texture_scale()
+            source, destination = BLEND_MODES[layer.blend_mode]
+            gl.glBlendFunc(getattr(gl, source), getattr(gl, destination))
+            self._draw_texture(layer.texture, (left, bottom, right, top), (0.0, texture_scale_v, texture_scale_u, 0.0),
+                               layer.opacity, layer.blend_mode)
+
+        gl.glDisable(gl.GL_BLEND)
+        gl.glDisable(gl.GL_SCISSOR_TEST)
+
+
+    # MARK: _draw_overlays()
+    def _draw_overlays(self, frame_width: int, frame_height: int, quad: tuple):
+        """
+        Draw the overlay shapes and text on top of the frame and its layers in a single draw call
+        The vertex buffer is only filled again when the overlays changed
+
+        Parameters
+        ----------
+        frame_width : int
+            The width of the frame in pixels
+        frame_height : int
+            The height of the frame in pixels
+        quad : tuple
+            The quad of the frame from _get_quad()
+
+        Returns
+        -------
+        None
+        """
+        with self._overlays_lock:
+            changed = self._overlays_changed
+            self._overlays_changed = False
+            overlays = self._overlays if changed else None
+        if changed == False and self._overlay_vertex_count == 0:
+            return
+
+        if self._overlay_vao == None:
+            self._overlay_vao = gl.glGenVertexArrays(1)
+            gl.glBindVertexArray(self._overlay_vao)
+            self._overlay_vbo = gl.glGenBuffers(1)
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._overlay_vbo)
+            stride = OVERLAY_VERTEX_SIZE * 4
+            for location, (size, offset) in enumerate(((2, 0), (2, 2), (4, 4))):
+                gl.glEnableVertexAttribArray(location)
+                gl.glVertexAttribPointer(location, size, gl.GL_FLOAT, gl.GL_FALSE, stride, ctypes.c_void_p(offset * 4))
+        gl.glBindVertexArray(self._overlay_vao)
+
+        if changed:
+            vertices = numpy.concatenate(overlays) if len(overlays) > 0 else numpy.zeros((0, OVERLAY_VERTEX_SIZE), dtype=numpy.float32)
+            self._overlay_vertex_count = len(vertices)
+            if len(vertices) > 0:
+                gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._overlay_vbo)
+                gl.glBufferData(gl.GL_ARRAY_BUFFER, vertices.nbytes, vertices, gl.GL_STREAM_DRAW)
+                self._uploaded_bytes += vertices.nbytes
+        if self._overlay_vertex_count == 0:
+            return
+
+        if self._glyph_texture == None and _glyph_atlas != None:
+            atlas = _glyph_atlas[0]
+            self._glyph_texture = gl.glGenTextures(1)
+            gl.glBindTexture(gl.GL_TEXTURE_2D, self._glyph_texture)
+            for parameter, value in ((gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR), (gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR),
+                                     (gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE), (gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)):
+                gl.glTexParameteri(gl.GL_TEXTURE_2D, parameter, value)
+            gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_R8, atlas.shape[1], atlas.shape[0], 0, gl.GL_RED, gl.GL_UNSIGNED_BYTE, atlas)
+
+        x, y, u0, v0, u1, v1 = quad
+        width, height = self._framebuffer_size
+        program = self._get_program("overlay")
+        gl.glUseProgram(program.id)
+        # frame pixel -> normalized device coordinate, the first row of the frame is at the top
+        scale_x = 2 * x / (frame_width * (u1 - u0))
+        scale_y = -2 * y / (frame_height * (v1 - v0))
+        gl.glUniform4f(program.uniforms["u_transform"], scale_x, scale_y, -x - u0 * frame_width * scale_x, y - v0 * frame_height * scale_y)
+        gl.glUniform1i(program.uniforms["u_atlas"], 0)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self._glyph_texture if self._glyph_texture != None else 0)
+
+        gl.glEnable(gl.GL_SCISSOR_TEST)
+        gl.glScissor(round((1 - x) / 2 * width), round((1 - y) / 2 * height), round(x * width), round(y * height))
+        gl.glEnable(gl.GL_BLEND)
+        gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE_MINUS_SRC_ALPHA)
+        gl.glDrawArrays(gl.GL_TRIANGLES, 0, self._overlay_vertex_count)
+        gl.glDisable(gl.GL_BLEND)
+        gl.glDisable(gl.GL_SCISSOR_TEST)
+
+
+    # MARK: _upload_tiles()
+    def _upload_tiles(self, image: numpy.ndarray, options: dict):
+        """
+        Upload the visible tiles of the pyramid level which matches the zoom, up to TILE_UPLOAD_BUDGET per frame
+        A tile of level n reads every 2^(n - TILE_FILTER_LEVELS)-th pixel of its part of the image and averages blocks
+        of 2^TILE_FILTER_LEVELS x 2^TILE_FILTER_LEVELS samples, so the pixels read per frame are bounded by the budget
+        and the tile size, not by the size of the image
+
+        Parameters
+        ----------
+        image : numpy.ndarray
+            The image of show_tiled()
+        options : dict
+            The options of show_tiled()
+
+        Returns
+        -------
+        list
+            The tile textures and the image rectangles (x0, y0, x1, y1) they cover, coarser fallback tiles first
+        """
+        if image is not self._tiles_image or options["version"] != self._tiles_version:
+            if self._tiles_image is None or image.shape[:2] != self._tiles_image.shape[:2]:
+                self._view = None
+            self._release_tiles()
+            self._tiles_image = image
+            self._tiles_version = options["version"]
+        if self._max_texture_size == None:
+            self._max_texture_size = int(gl.glGetIntegerv(gl.GL_MAX_TEXTURE_SIZE))
+
+        image_height, image_width = image.shape[:2]
+        tile_size = min(options["tile_size"], self._max_texture_size)
+        width, height = self._framebuffer_size
+        left, top, right, bottom = self._get_view_rect(image_width, image_height, width, height)
+        zoom = self._view[2]
+        max_level = max(0, math.ceil(math.log2(max(image_width, image_height) / tile_size)))
+        level = min(max_level, max(0, math.floor(math.log2(1 / zoom)))) if zoom > 0 else max_level
+
+        budget = TILE_UPLOAD_BUDGET
+        missing = False
+        tiles = []
+        fallbacks = {}
+        span = tile_size << level
+        for row in range(max(0, int(top // span)), min(-(-image_height // span), int(bottom // span) + 1)):
+            for column in range(max(0, int(left // span)), min(-(-image_width // span), int(right // span) + 1)):
+                texture, uploaded = self._get_tile(image, options, level, column, row, tile_size, budget > 0)
+                budget -= uploaded
+                if texture != None:
+                    # tiles of an unsupported dtype stay empty
+                    if texture.allocations > 0:
+                        tiles.append((texture, self._get_tile_rect(level, column, row, tile_size, image_width, image_height)))
+                    continue
+                missing = True
+                # a cached tile of a coarser level covers the missing tile until it is uploaded
+                for coarser_level in range(level + 1, max_level + 1):
+                    shift = coarser_level - level
+                    key = (coarser_level, column >> shift, row >> shift)
+                    if key in self._tiles:
+                        if key not in fallbacks:
+                            self._tiles.move_to_end(key)
+                            fallbacks[key] = (self._tiles[key], self._get_tile_rect(*key, tile_size, image_width, image_height))
+                        break
+
+        while len(self._tiles) > TILE_CACHE_SIZE:
+            key, texture = self._tiles.popitem(last=False)
+            gl.glDeleteTextures([texture.id])
+        if missing:
+            # the next frame uploads the remaining tiles, run() is woken up for it
+            self._damaged = True
+            if _glfw_initialized:
+                glfw.post_empty_event()
+        return list(fallbacks.values()) + tiles
+
+
+    # MARK: _get_tile()
+    def _get_tile(self, image: numpy.ndarray, options: dict, level: int, column: int, row: int, tile_size: int, upload: bool):
+        """
+        Get the texture of a tile from the cache, or upload it
+
+        Parameters
+        ----------
+        image : numpy.ndarray
+            The image of show_tiled()
+        options : dict
+            The options of show_tiled()
+        level : int
+            The pyramid level of the tile
+        column : int
+            The column of the tile
+        row : int
+            The row of the tile
+        tile_size : int
+            The size of a tile in pixels
+        upload : bool
+            If a missing tile may be uploaded
+
+        Returns
+        -------
+        tuple
+            The texture, None if it is not cached and may not be uploaded, and if it was uploaded
+        """
+        key = (level, column, row)
+        texture = self._tiles.get(key)
+        if texture != None:
+            self._tiles.move_to_end(key)
+            return texture, False
+        if upload == False:
+            return None, False
+
+        span = tile_size << level
+        # a box filtered strided sample instead of every 2^n-th pixel, which would alias fine details into the coarser levels
+        factor = 1 << min(level, TILE_FILTER_LEVELS)
+        step = (1 << level) // factor
+        tile = _box_filter(image[row * span:(row + 1) * span:step, column * span:(column + 1) * span:step], factor)
+        # the storage has exactly the size of the tile, so the mipmaps do not average in uninitialized padding
+        texture = _Texture(bucket=1)
+        upload_format = self._get_upload_format(tile, options["channel_order"])
+        if upload_format != None:
+            self._upload_image(texture, tile, upload_format)
+            texture.generate_mipmaps()
+        self._tiles[key] = texture
+        return texture, True
+
+
+    # MARK: _get_tile_rect()
+    def _get_tile_rect(self, level: int, column: int, row: int, tile_size: int, image_width: int, image_height: int):
+        """
+        Get the part of the image which is covered by a tile
+
+        Parameters
+        ----------
+        level : int
+            The pyramid level of the tile
+        column : int
+            The column of the tile
+        row : int
+            The row of the tile
+        tile_size : int
+            The size of a tile in pixels
+        image_width : int
+            The width of the image
+        image_height : int
+            The height of the image
+
+        Returns
+        -------
+        tuple
+            The image rectangle (x0, y0, x1, y1)
+        """
+        span = tile_size << level
+        return (column * span, row * span, min(image_width, (column + 1) * span), min(image_height, (row + 1) * span))
+
+
+    # MARK: _draw_tiles()
+    def _draw_tiles(self, tiles: list, image_width: int, image_height: int, view: tuple):
+        """
+        Draw the uploaded tiles at their place in the view
+
+        Parameters
+        ----------
+        tiles : list
+            The tiles from _upload_tiles()
+        image_width : int
+            The width of the image
+        image_height : int
+            The height of the image
+        view : tuple
+            The visible part (u0, v0, u1, v1) of the image in the range 0 to 1
+
+        Returns
+        -------
+        None
+        """
+        u0, v0, u1, v1 = view
+        for texture, (x0, y0, x1, y1) in tiles:
+            # image pixel -> normalized device coordinate, the first row of the image is at the top
+            left = (x0 / image_width - u0) / (u1 - u0) * 2 - 1
+            right = (x1 / image_width - u0) / (u1 - u0) * 2 - 1
+            top = 1 - (y0 / image_height - v0) / (v1 - v0) * 2
+            bottom = 1 - (y1 / image_height - v0) / (v1 - v0) * 2
+            texture_scale_u, texture_scale_v = texture.get_texture_scale()
+            self._draw_texture(texture, (left, bottom, right, top), (0.0, texture_scale_v, texture_scale_u, 0.0))
+
+
+    # MARK: _release_tiles()
+    def _release_tiles(self):
+        """
+        Delete all tile textures, must be called with the context of the window current
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        if len(self._tiles) > 0:
+            gl.glDeleteTextures([texture.id for texture in self._tiles.values()])
+        self._tiles = collections.OrderedDict()
+
+
+    # MARK: _get_view_rect()
+    def _get_view_rect(self, image_width: int, image_height: int, width: int, height: int):
+        """
+        Get the visible part of the tiled image, the view is fitted to the window first if it is not set
+
+        Parameters
+        ----------
+        image_width : int
+            The width of the image
+        image_height : int
+            The height of the image
+        width : int
+            The width of the framebuffer
+        height : int
+            The height of the framebuffer
+
+        Returns
+        -------
+        tuple
+            The image rectangle (left, top, right, bottom) in pixels
+        """
+        if self._view == None:
+            self._view = (image_width / 2, image_height / 2, min(width / image_width, height / image_height))
+        center_x, center_y, zoom = self._view
+        return (center_x - width / (2 * zoom), center_y - height / (2 * zoom),
+                center_x + width / (2 * zoom), center_y + height / (2 * zoom))
+
+
+    # MARK: _get_view_quad()
+    def _get_view_quad(self, image_width: int, image_height: int, width: int, height: int):
+        """
+        Get the quad of the tiled image in the form of _get_quad(), so layers and overlays follow zoom and pan
+
+        Parameters
+        ----------
+        image_width : int
+            The width of the image
+        image_height : int
+            The height of the image
+        width : int
+            The width of the framebuffer
+        height : int
+            The height of the framebuffer
+
+        Returns
+        -------
+        tuple
+            The half extent of the quad and the visible part of the image, see _get_quad()
+        """
+        left, top, right, bottom = self._get_view_rect(image_width, image_height, width, height)
+        return 1.0, 1.0, left / image_width, top / image_height, right / image_width, bottom / image_height
+
+
+    # MARK: _get_program()
+    def _get_program(self, name: str):
+        """
+        Get a shader program from PROGRAMS, compiled on first use
+        Windows of a group share the programs of the group
+        A current GL context is required
+
+        Parameters
+        ----------
+        name : str
+            The name of the program
+
+        Returns
+        -------
+        _Program
+            The program
+        """
+        # an EGL context of a headless window can not share with the group
+        shared = self._group != None and isinstance(self._window, _EGLContext) == False
+        programs = self._group._programs if shared else self._programs
+        program = programs.get(name)
+        if program == None:
+            program = _Program(*PROGRAMS[name])
+            programs[name] = program
+        return program
+
+
+    # MARK: _render_loop()
+    def _render_loop(self):
+        """
+        Present the latest frame from the mailbox until the window is closed, runs on the render thread
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        _make_context_current(self._window)
+        while True:
+            with self._mailbox_condition:
+                while (self._mailbox == None and self._render_running and
+                       self._capture_requested == False and len(self._readback_pending) == 0):
+                    self._mailbox_condition.wait()
+                if self._render_running == False:
+                    break
+                mailbox = self._mailbox
+                self._mailbox = None
+                waiter = None
+                if mailbox != None:
+                    waiter, self._mailbox_waiter = self._mailbox_waiter, None
+            if mailbox != None:
+                try:
+                    self._render(*mailbox)
+                except Exception as exception:
+                    if waiter == None:
+                        raise
+                    _resolve_waiter(waiter, None, exception)
+                else:
+                    if waiter != None:
+                        _resolve_waiter(waiter, self._captured_frame if self._headless else None)
+                continue
+            # no new frame, so there is time to wait for the pending read backs
+            self._collect_readback(wait=True)
+            if self._capture_requested:
+                with self._capture_condition:
+                    self._capture_requested = False
+                    self._capture_condition.notify_all()
+        _make_context_current(None)
+
+
+    # MARK: _bind_headless_framebuffer()
+    def _bind_headless_framebuffer(self, width: int, height: int):
+        """
+        Bind the framebuffer object of a headless window, its storage is reallocated when the size changed
+
+        Parameters
+        ----------
+        width : int
+            The width of the framebuffer
+        height : int
+            The height of the framebuffer
+
+        Returns
+        -------
+        None
+        """
+        gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, self._headless_framebuffer)
+        if self._headless_renderbuffer_size != (width, height):
+            gl.glBindRenderbuffer(gl.GL_RENDERBUFFER, self._headless_renderbuffer)
+            gl.glRenderbufferStorage(gl.GL_RENDERBUFFER, gl.GL_RGBA8, width, height)
+            gl.glFramebufferRenderbuffer(gl.GL_FRAMEBUFFER, gl.GL_COLOR_ATTACHMENT0, gl.GL_RENDERBUFFER, self._headless_renderbuffer)
+            self._headless_renderbuffer_size = (width, height)
+
+
+    # MARK: _read_headless_framebuffer()
+    def _read_headless_framebuffer(self, width: int, height: int):
+        """
+        Read the composited frame of a headless window, which show() returns
+
+        Parameters
+        ----------
+        width : int
+            The width of the framebuffer
+        height : int
+            The height of the framebuffer
+
+        Returns
+        -------
+        None
+        """
+        frame = numpy.empty((height, width, 3), dtype=numpy.uint8)
+        gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, 1)
+        gl.glReadPixels(0, 0, width, height, gl.GL_BGR, gl.GL_UNSIGNED_BYTE, frame)
+        # the rows are read from the bottom up
+        with self._capture_condition:
+            self._captured_frame = frame[::-1]
+
+
+    # MARK: _read_back()
+    def _read_back(self):
+        """
+        Start reading the drawn frame back into the next pixel buffer object
+        The copy runs asynchronously and is picked up by _collect_readback() once its fence is signaled,
+        if all buffers are still busy the frame is not read back instead of stalling the render loop
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self._collect_readback(wait=False)
+        if len(self._readback_pbo_ids) == 0:
+            self._readback_pbo_ids = [int(pbo_id) for pbo_id in numpy.atleast_1d(gl.glGenBuffers(READBACK_PBO_COUNT))]
+            self._readback_pbo_sizes = [0] * READBACK_PBO_COUNT
+            self._readback_index = 0
+        if len(self._readback_pending) == len(self._readback_pbo_ids):
+            if self._recording_queue != None:
+                self._recording_dropped_frames += 1
+            return
+
+        width, height = self._framebuffer_size
+        size = width * height * 3
+        index = self._readback_index
+        self._readback_index = (index + 1) % len(self._readback_pbo_ids)
+        gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, self._readback_pbo_ids[index])
+        if self._readback_pbo_sizes[index] != size:
+            gl.glBufferData(gl.GL_PIXEL_PACK_BUFFER, size, None, gl.GL_STREAM_READ)
+            self._readback_pbo_sizes[index] = size
+        gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, 1)
+        gl.glReadPixels(0, 0, width, height, gl.GL_BGR, gl.GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+        fence = gl.glFenceSync(gl.GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+        gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, 0)
+        self._readback_pending.append((self._readback_pbo_ids[index], fence, width, height, time.perf_counter()))
+
+
+    # MARK: _collect_readback()
+    def _collect_readback(self, wait: bool):
+        """
+        Copy the finished read backs out of their pixel buffer objects, in the order they were started
+
+        Parameters
+        ----------
+        wait : bool
+            If the pending read backs should be waited for, otherwise only finished ones are collected
+
+        Returns
+        -------
+        None
+        """
+        while len(self._readback_pending) > 0:
+            pbo_id, fence, width, height, timestamp = self._readback_pending[0]
+            # the timeout is in nanoseconds
+            status = gl.glClientWaitSync(fence, gl.GL_SYNC_FLUSH_COMMANDS_BIT, int(CAPTURE_TIMEOUT * 1e9) if wait else 0)
+            if status not in (gl.GL_ALREADY_SIGNALED, gl.GL_CONDITION_SATISFIED):
+                break
+            self._readback_pending.popleft()
+            gl.glDeleteSync(fence)
+
+            size = width * height * 3
+            gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, pbo_id)
+            pointer = gl.glMapBufferRange(gl.GL_PIXEL_PACK_BUFFER, 0, size, gl.GL_MAP_READ_BIT)
+            if pointer:
+                address = ctypes.cast(pointer, ctypes.c_void_p).value
+                mapped = numpy.ctypeslib.as_array((ctypes.c_ubyte * size).from_address(address)).reshape(height, width, 3)
+                # the rows are read from the bottom up
+                frame = mapped[::-1].copy()
+                gl.glUnmapBuffer(gl.GL_PIXEL_PACK_BUFFER)
+            gl.glBindBuffer(gl.GL_PIXEL_PACK_BUFFER, 0)
+            if pointer:
+                self._deliver_frame(frame, timestamp)
+
+
+    # MARK: _deliver_frame()
+    def _deliver_frame(self, frame: numpy.ndarray, timestamp: float):
+        """
+        Hand a read back frame to capture() and to the encoder thread
+
+        Parameters
+        ----------
+        frame : numpy.ndarray
+            The read back bgr frame
+        timestamp : float
+            The time.perf_counter() time the frame was drawn at
+
+        Returns
+        -------
+        None
         """
-        Initialize a new window
-        The window will be shown when calling create_window() or when showing the first frame with show()
+        with self._capture_condition:
+            self._captured_frame = frame
+        recording_queue = self._recording_queue
+        if recording_queue != None:
+            try:
+                recording_queue.put_nowait((timestamp, frame))
+            except queue.Full:
+                self._recording_dropped_frames += 1
+
+
+    # MARK: _encode_loop()
+    def _encode_loop(self, recording_queue: queue.Queue, path: str, fps: float, codec: str):
+        """
+        Write the read back frames to the video file until None is received, runs on the encoder thread
+        The frames are placed at their time, so frames which are shown longer, like skipped unchanged ones,
+        are repeated and the video plays at the speed it was shown with
 
         Parameters
         ----------
-        name : str
-            The name of the window
-        size : tuple
-            The size of the window
-        position : tuple
-            The position of the window
-        title_bar_color : tuple, optional
-            The color of the title bar
-        border_color : tuple, optional
-            The color of the window border
-        resizable : bool, optional
-            If the window should be resizable
-        topmost : bool, optional
-            If the window should be always on top
-        foreground : bool, optional
-            If the window should be in the foreground on creation
-        minimized : bool, optional
-            If the window should be minimized on creation
-        undestroyable : bool, optional
-            If the window should be undestroyable
-        icon : str, optional
-            The path to the .ico icon
-        no_warnings : bool, optional
-            If warnings should be printed
+        recording_queue : queue.Queue
+            The queue of (timestamp, frame) items
+        path : str
+            The path of the video file
+        fps : float
+            The frame rate of the video
+        codec : str
+            The four character code of the codec
+
+        Returns
+        -------
+        None
+        """
+        writer = None
+        start = None
+        written = 0
+        previous = None
+        while True:
+            item = recording_queue.get()
+            if item == None:
+                break
+            timestamp, frame = item
+            if writer == None:
+                writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*codec), fps, (frame.shape[1], frame.shape[0]))
+                size = frame.shape[1], frame.shape[0]
+                start = timestamp
+                if writer.isOpened() == False and self._no_warnings != True:
+                    print(RED + f"SimpleWindow: could not open {path} for recording with the codec {codec}" + NORMAL)
+            if writer.isOpened() == False:
+                continue
+            if (frame.shape[1], frame.shape[0]) != size:
+                # the window was resized, the video keeps the size it was started with
+                frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+            slot = int((timestamp - start) * fps)
+            while previous is not None and written < slot:
+                writer.write(previous)
+                written += 1
+            if written <= slot:
+                writer.write(frame)
+                written += 1
+                self._recorded_frames += 1
+            previous = frame
+        if writer != None:
+            writer.release()
+
+
+    # MARK: _upload_pbo()
+    def _upload_pbo(self, frame: numpy.ndarray, dtype: numpy.dtype, gl_format: int, gl_type: int):
         """
-        glfw.init()
+        Upload the frame to the bound texture through the next pixel buffer object
+        The frame is written straight into the mapped buffer, the transfer to the texture
+        then runs asynchronously while the next frame is being produced
 
-        self._name = name
-        self._size = size
-        self._position = position
-        self._title_bar_color = title_bar_color
-        self._border_color = border_color
-        self._resizable = resizable
-        self._topmost = topmost
-        self._foreground = foreground
-        self._minimized = minimized            
-        self._undestroyable = undestroyable
-        self._icon = icon
-        self._no_warnings = no_warnings
+        Parameters
+        ----------
+        frame : numpy.ndarray
+            The frame to upload
+        dtype : numpy.dtype
+            The dtype the frame is uploaded as
+        gl_format : int
+            The GL format of the pixels
+        gl_type : int
+            The GL type of the pixels
 
-        self._open = False
-        self._hwnd = None
-        self._window = None
-        self._texture_id = None
+        Returns
+        -------
+        bool
+            If the frame was uploaded, False if the buffer could not be mapped
+        """
+        height, width = frame.shape[:2]
+        size = frame.size * dtype.itemsize
+        pbo_id = self._pbo_ids[self._pbo_index]
+        self._pbo_index = (self._pbo_index + 1) % len(self._pbo_ids)
+
+        gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, pbo_id)
+        if size != self._pbo_size:
+            for other_pbo_id in self._pbo_ids:
+                gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, other_pbo_id)
+                gl.glBufferData(gl.GL_PIXEL_UNPACK_BUFFER, size, None, gl.GL_STREAM_DRAW)
+            gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, pbo_id)
+            self._pbo_size = size
+
+        pointer = gl.glMapBufferRange(gl.GL_PIXEL_UNPACK_BUFFER, 0, size, gl.GL_MAP_WRITE_BIT | gl.GL_MAP_INVALIDATE_BUFFER_BIT)
+        if not pointer:
+            gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0)
+            return False
+
+        address = ctypes.cast(pointer, ctypes.c_void_p).value
+        mapped = numpy.ctypeslib.as_array((ctypes.c_ubyte * size).from_address(address)).view(dtype).reshape(frame.shape)
+        # copyto() handles strides and the dtype cast itself, so a non contiguous
+        # or converted frame also skips the ascontiguousarray() copy
+        if frame.flags.c_contiguous == False or frame.dtype != dtype:
+            self._copies_avoided += 1
+        numpy.copyto(mapped, frame, casting="unsafe")
+        gl.glUnmapBuffer(gl.GL_PIXEL_UNPACK_BUFFER)
+
+        gl.glTexSubImage2D(
+            gl.GL_TEXTURE_2D,
+            0, 0, 0,
+            width, height,
+            gl_format,
+            gl_type,
+            ctypes.c_void_p(0)
+        )
+        gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0)
+        # the tobytes() copy is skipped as well
+        self._copies_avoided += 1
+        return True
 
 
-    # MARK: create_window()
-    def create_window(self):
+    # MARK: _apply_vsync()
+    def _apply_vsync(self):
         """
-        Create the window
+        Apply the vsync mode to the current context
 
         Parameters
         ----------
@@ -92,150 +5524,350 @@ class Window:
         -------
         None
         """
-        if self._size[0] == None:
-            self._size = 150, self._size[1]
-        if self._size[1] == None:
-            self._size = self._size[0], 50
+        if self._vsync == "adaptive":
+            if glfw.extension_supported("WGL_EXT_swap_control_tear") or glfw.extension_supported("GLX_EXT_swap_control_tear"):
+                glfw.swap_interval(-1)
+            else:
+                if self._no_warnings != True:
+                    print(RED + "SimpleWindow: adaptive vsync is not supported, using vsync on" + NORMAL)
+                glfw.swap_interval(1)
+        elif self._vsync != None:
+            glfw.swap_interval(1 if self._vsync == "on" else 0)
+        self._vsync_changed = False
 
-        if self._position[0] == None:
-            self._position = 0, self._position[1]
-        if self._position[1] == None:
-            self._position = self._position[0], 0
 
-        # some windows magic so that the icon is also shown int the taskbar
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("Python.Pip.Modules.SimpleWindow.PyPI.GitHub.OleFranz")
+    # MARK: _wait_for_next_present()
+    def _wait_for_next_present(self):
+        """
+        Wait until the next frame may be presented to keep the target fps
+        Sleeps for most of the time and spins for the last PACER_SPIN_TIME seconds to hit the deadline precisely
 
-        self._window = glfw.create_window(self._size[0], self._size[1], self._name, None, None)
-        glfw.make_context_current(self._window)
-        glfw.set_window_size_limits(self._window, 150, 50, glfw.DONT_CARE, glfw.DONT_CARE)
-        glfw.set_window_pos(self._window, self._position[0], self._position[1])
+        Parameters
+        ----------
+        None
 
-        self._hwnd = glfw.get_win32_window(self._window)
-        self._open = True
+        Returns
+        -------
+        None
+        """
+        interval = 1 / self._target_fps
+        now = time.perf_counter()
+        deadline = self._next_present_time
+        # start over instead of catching up when more than one frame behind
+        if deadline == None or now - deadline > interval:
+            deadline = now
+        if deadline - now > PACER_SPIN_TIME:
+            time.sleep(deadline - now - PACER_SPIN_TIME)
+        while time.perf_counter() < deadline:
+            pass
+        self._next_present_time = deadline + interval
+
+
+    # MARK: _get_upload_format()
+    def _get_upload_format(self, frame: numpy.ndarray, channel_order: str):
+        """
+        Get how the frame is uploaded to the texture, picked from its dtype and channel count
 
-        if None not in self._title_bar_color:
-            self.set_title_bar_color(self._title_bar_color)
-        if None not in self._border_color:
-            self.set_border_color(self._border_color)
-        if self._resizable == False:
-            glfw.set_window_attrib(self._window, glfw.RESIZABLE, glfw.FALSE)
-        if self._topmost:
-            glfw.set_window_attrib(self._window, glfw.FLOATING, glfw.TRUE)
-        if self._foreground:
-            self.set_foreground(state=True)
-        if self._minimized:
-            self.set_minimized(state=True)
-        if self._icon != "":
-            self.set_icon(self._icon)
+        Parameters
+        ----------
+        frame : numpy.ndarray
+            The frame to upload
+        channel_order : str
+            The order of the channels in the frame, None for the default order
 
-        self._texture_id = gl.glGenTextures(1)
-        gl.glBindTexture(gl.GL_TEXTURE_2D, self._texture_id)
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE)
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
+        Returns
+        -------
+        tuple
+            The dtype to upload as, the GL internal format, the GL format, the GL type and the texture swizzle,
+            None if the frame can not be shown
+        """
+        channels = 1 if frame.ndim == 2 else frame.shape[2] if frame.ndim == 3 else 0
+        if channel_order == None:
+            channel_order = DEFAULT_CHANNEL_ORDERS.get(channels)
+        if channel_order not in CHANNEL_ORDERS or CHANNEL_ORDERS[channel_order][0] != channels:
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: frame must have the shape (height, width) or (height, width, channels) with 1, 3 or 4 channels matching channel_order" + NORMAL)
+            return None
+
+        dtype = frame.dtype
+        if dtype.name not in TEXTURE_FORMATS:
+            # cast like every frame was before uint16 and float32 were uploaded as they are, so a float64 frame keeps 0 to 255
+            dtype = numpy.dtype(numpy.uint8)
+        gl_type, internal_formats = TEXTURE_FORMATS[dtype.name]
+
+        if channels == 1:
+            swizzle = (gl.GL_RED, gl.GL_RED, gl.GL_RED, gl.GL_ONE)
+        else:
+            swizzle = (gl.GL_RED, gl.GL_GREEN, gl.GL_BLUE, gl.GL_ALPHA)
+        return (dtype,
+                getattr(gl, internal_formats[channels]),
+                getattr(gl, CHANNEL_ORDERS[channel_order][1]),
+                getattr(gl, gl_type),
+                swizzle)
+
+
+    # MARK: _get_yuv_planes()
+    def _get_yuv_planes(self, frame, pixel_format: str):
+        """
+        Split a YUV frame into its planes, as views without copying the data
 
-        gl.glTexImage2D(
-            gl.GL_TEXTURE_2D,
-            0,
-            gl.GL_RGB8,
-            self._size[0],
-            self._size[1],
-            0,
-            gl.GL_BGR,
-            gl.GL_UNSIGNED_BYTE,
-            None
-        )
+        Parameters
+        ----------
+        frame : numpy.ndarray or tuple
+            The frame or the tuple of planes, see show_yuv()
+        pixel_format : str
+            "nv12", "i420" or "yuyv"
+
+        Returns
+        -------
+        list
+            The planes as (array, GL internal format name, GL format name), None if the frame is not valid
+        """
+        planes = None
+        if isinstance(frame, (tuple, list)):
+            if pixel_format == "nv12" and len(frame) == 2:
+                y, uv = frame
+                planes = [(y, "GL_R8", "GL_RED"), (uv.reshape(y.shape[0] // 2, y.shape[1] // 2, 2), "GL_RG8", "GL_RG")]
+            elif pixel_format == "i420" and len(frame) == 3:
+                planes = [(frame[0], "GL_R8", "GL_RED"), (frame[1], "GL_R8", "GL_RED"), (frame[2], "GL_R8", "GL_RED")]
+        elif pixel_format == "yuyv" and frame.ndim in (2, 3):
+            planes = [(frame.reshape(frame.shape[0], -1, 4), "GL_RGBA8", "GL_RGBA")]
+        elif frame.ndim == 2 and frame.shape[0] % 3 == 0:
+            height, width = frame.shape[0] * 2 // 3, frame.shape[1]
+            y = frame[:height]
+            if pixel_format == "nv12":
+                planes = [(y, "GL_R8", "GL_RED"), (frame[height:].reshape(height // 2, width // 2, 2), "GL_RG8", "GL_RG")]
+            else:
+                chroma = numpy.ascontiguousarray(frame[height:]).reshape(-1)
+                size = height // 2 * width // 2
+                planes = [(y, "GL_R8", "GL_RED"),
+                          (chroma[:size].reshape(height // 2, width // 2), "GL_R8", "GL_RED"),
+                          (chroma[size:].reshape(height // 2, width // 2), "GL_R8", "GL_RED")]
 
+        if planes == None or any(plane.dtype != numpy.uint8 for plane, _, _ in planes):
+            if self._no_warnings != True:
+                print(RED + "SimpleWindow: frame does not match pixel_format " + pixel_format + ", see show_yuv()" + NORMAL)
+            return None
+        return planes
 
-    # MARK: close()
-    def close(self):
+
+    # MARK: _get_quad()
+    def _get_quad(self, frame_width: int, frame_height: int, width: int, height: int):
         """
-        Close the window
+        Get the quad which maps the frame to the window for the current scale mode
+
+        Parameters
+        ----------
+        frame_width : int
+            The width of the frame
+        frame_height : int
+            The height of the frame
+        width : int
+            The width of the framebuffer
+        height : int
+            The height of the framebuffer
+
+        Returns
+        -------
+        tuple
+            The half extents (x, y) of the quad in normalized device coordinates
+            and the visible texture coordinates (u0, v0, u1, v1)
+        """
+        x, y = 1.0, 1.0
+        u0, v0, u1, v1 = 0.0, 0.0, 1.0, 1.0
+        if self._scale_mode == "stretch" or width <= 0 or height <= 0:
+            return x, y, u0, v0, u1, v1
+
+        ratio = (frame_width / frame_height) / (width / height)
+        if self._scale_mode == "fit":
+            if ratio > 1:
+                y = 1 / ratio
+            else:
+                x = ratio
+        else:
+            if ratio > 1:
+                u0 = (1 - 1 / ratio) / 2
+                u1 = 1 - u0
+            else:
+                v0 = (1 - ratio) / 2
+                v1 = 1 - v0
+        return x, y, u0, v0, u1, v1
+
+
+    # MARK: _on_window_size()
+    def _on_window_size(self, window, width: int, height: int):
+        """
+        GLFW callback which keeps the cached window size up to date
 
         Parameters
         ----------
+        window : glfw window
+            The window which was resized
+        width : int
+            The new width of the window
+        height : int
+            The new height of the window
+
+        Returns
+        -------
         None
+        """
+        self._size = (width, height)
+
+
+    # MARK: _on_window_pos()
+    def _on_window_pos(self, window, x: int, y: int):
+        """
+        GLFW callback which keeps the cached window position up to date
+
+        Parameters
+        ----------
+        window : glfw window
+            The window which was moved
+        x : int
+            The new x position of the window
+        y : int
+            The new y position of the window
 
         Returns
         -------
-        None"""
-        if self._open:
-            glfw.destroy_window(self._window)
-            self._open = False
+        None
+        """
+        self._position = (x, y)
 
 
-    # MARK: set_name()
-    def set_name(self, name: str):
+    # MARK: _on_framebuffer_size()
+    def _on_framebuffer_size(self, window, width: int, height: int):
         """
-        Set the name of the window
+        GLFW callback which keeps the cached framebuffer size up to date
 
         Parameters
         ----------
-        name : str
-            The name of the window
+        window : glfw window
+            The window which was resized
+        width : int
+            The new width of the framebuffer
+        height : int
+            The new height of the framebuffer
 
         Returns
         -------
         None
         """
-        glfw.set_window_title(self._window, name)
-        self._name = name
+        self._framebuffer_size = (width, height)
+        self._damaged = True
+        self._emit_event("resize", size=(width, height))
 
 
-    # MARK: get_name()
-    def get_name(self):
+    # MARK: _on_refresh()
+    def _on_refresh(self, window):
         """
-        Get the name of the window
+        GLFW callback for when the content of the window was lost and has to be drawn again
 
         Parameters
         ----------
+        window : glfw window
+            The window which has to be redrawn
+
+        Returns
+        -------
         None
+        """
+        self._damaged = True
+
+
+    # MARK: _on_scroll()
+    def _on_scroll(self, window, x_offset: float, y_offset: float):
+        """
+        GLFW callback which zooms the tiled view at the cursor
+
+        Parameters
+        ----------
+        window : glfw window
+            The window which was scrolled
+        x_offset : float
+            The horizontal scroll offset
+        y_offset : float
+            The vertical scroll offset
 
         Returns
         -------
-        str
-            The name of the window
+        None
         """
-        return self._name
+        self._emit_event("scroll", offset=(x_offset, y_offset))
+        if self._view == None or self._tiles_image is None:
+            return
+        cursor_x, cursor_y = self._get_framebuffer_cursor()
+        width, height = self._framebuffer_size
+        center_x, center_y, zoom = self._view
+        image_height, image_width = self._tiles_image.shape[:2]
+        minimum_zoom = min(width / image_width, height / image_height) / 4
+        new_zoom = min(max(zoom * TILE_ZOOM_STEP ** y_offset, minimum_zoom), TILE_MAX_ZOOM)
+        # the image pixel under the cursor stays under the cursor
+        offset_x, offset_y = cursor_x - width / 2, cursor_y - height / 2
+        self._view = (center_x + offset_x / zoom - offset_x / new_zoom, center_y + offset_y / zoom - offset_y / new_zoom, new_zoom)
+        self._damaged = True
+
+
+    # MARK: _on_mouse_button()
+    def _on_mouse_button(self, window, button: int, action: int, mods: int):
+        """
+        GLFW callback which starts and ends panning the tiled view with the left mouse button
 
+        Parameters
+        ----------
+        window : glfw window
+            The window which was clicked
+        button : int
+            The mouse button
+        action : int
+            glfw.PRESS or glfw.RELEASE
+        mods : int
+            The modifier keys
 
-    # MARK: set_size()
-    def set_size(self, size: tuple):
+        Returns
+        -------
+        None
         """
-        Set the size of the window
+        self._emit_event("mouse_button", button=button, action=INPUT_ACTIONS[action], mods=mods,
+                         position=glfw.get_cursor_pos(window))
+        if button == glfw.MOUSE_BUTTON_LEFT:
+            self._drag_position = self._get_framebuffer_cursor() if action == glfw.PRESS else None
+
+
+    # MARK: _on_cursor_pos()
+    def _on_cursor_pos(self, window, x: float, y: float):
+        """
+        GLFW callback which pans the tiled view while the left mouse button is held
 
         Parameters
         ----------
-        size : tuple
-            The size of the window
+        window : glfw window
+            The window the cursor moved over
+        x : float
+            The x position of the cursor
+        y : float
+            The y position of the cursor
 
         Returns
         -------
         None
         """
-        if size != self._size and self._open:
-            if len(size) != 2 or isinstance(size[0], (int, type(None))) == False or isinstance(size[1], (int, type(None))) == False:
-                if self._no_warnings != True:
-                    print(RED + "SimpleWindow: size must be a tuple of (int, int)" + NORMAL)
-                return
-        if size[0] == None:
-            size = (self._size[0], size[1])
-        if size[1] == None:
-            size = (size[0], self._size[1])
-        if None in size:
-            if self._no_warnings != True:
-                print(RED + "SimpleWindow: size not valid, found None value" + NORMAL)
+        self._emit_event("cursor", position=(x, y))
+        if self._drag_position == None or self._view == None or self._tiles_image is None:
             return
-        size = max(150, round(size[0])), max(50, round(size[1]))
-        glfw.set_window_size(self._window, size[0], size[1])
-        self._size = size
+        position = self._get_framebuffer_cursor()
+        center_x, center_y, zoom = self._view
+        self._view = (center_x - (position[0] - self._drag_position[0]) / zoom,
+                      center_y - (position[1] - self._drag_position[1]) / zoom, zoom)
+        self._drag_position = position
+        self._damaged = True
 
 
-    # MARK: get_size()
-    def get_size(self):
+    # MARK: _get_framebuffer_cursor()
+    def _get_framebuffer_cursor(self):
         """
-        Get the size of the window
+        Get the cursor position in framebuffer pixels, which differ from screen coordinates on scaled displays
 
         Parameters
         ----------
@@ -244,130 +5876,178 @@ class Window:
         Returns
         -------
         tuple
-            The size of the window
+            The cursor position (x, y)
         """
-        if self._open:
-            return glfw.get_window_size(self._window)
-        return self._size
+        cursor_x, cursor_y = glfw.get_cursor_pos(self._window)
+        window_width, window_height = self._size
+        width, height = self._framebuffer_size
+        return cursor_x * width / max(window_width, 1), cursor_y * height / max(window_height, 1)
 
 
-    # MARK: set_position()
-    def set_position(self, position: tuple):
+    # MARK: _on_iconify()
+    def _on_iconify(self, window, iconified: int):
         """
-        Set the position of the window
+        GLFW callback for when the window was minimized or restored
 
         Parameters
         ----------
-        position : tuple
-            The position of the window
+        window : glfw window
+            The window which was minimized or restored
+        iconified : int
+            1 if the window was minimized, 0 if it was restored
 
         Returns
         -------
         None
         """
-        if position != self._position and self._open:
-            if len(position) != 2 or isinstance(position[0], (int, type(None))) == False or isinstance(position[1], (int, type(None))) == False:
-                if self._no_warnings != True:
-                    print(RED + "SimpleWindow: position must be a tuple of (int, int)" + NORMAL)
-                return
-        if position[0] == None:
-            position = (self._position[0], position[1])
-        if position[1] == None:
-            position = (position[0], self._position[1])
-        if None in position:
-            if self._no_warnings != True:
-                print(RED + "SimpleWindow: position not valid, found None value" + NORMAL)
-            return
-        glfw.set_window_pos(self._window, position[0], position[1])
-        self._position = position
+        self._minimized = iconified != 0
+        if iconified == 0:
+            self._damaged = True
+        self._emit_event("iconify", minimized=self._minimized)
+
+
+    # MARK: _on_close()
+    def _on_close(self, window):
+        """
+        GLFW callback for when the user asked to close the window, the window is closed by the next shown frame
+
+        Parameters
+        ----------
+        window : glfw window
+            The window which should be closed
+
+        Returns
+        -------
+        None
+        """
+        self._close_requested = True
+        self._emit_event("close")
+
+
+    # MARK: _on_focus()
+    def _on_focus(self, window, focused: int):
+        """
+        GLFW callback for when the window gained or lost the input focus
+
+        Parameters
+        ----------
+        window : glfw window
+            The window whose focus changed
+        focused : int
+            1 if the window gained the focus, 0 if it lost it
+
+        Returns
+        -------
+        None
+        """
+        self._foreground = focused != 0
+        self._emit_event("focus", focused=self._foreground)
 
 
-    # MARK: get_position()
-    def get_position(self):
+    # MARK: _on_key()
+    def _on_key(self, window, key: int, scancode: int, action: int, mods: int):
         """
-        Get the position of the window
+        GLFW callback for key presses, repeats and releases
 
         Parameters
         ----------
-        None
+        window : glfw window
+            The window which has the focus
+        key : int
+            The glfw key constant
+        scancode : int
+            The platform specific scancode
+        action : int
+            glfw.PRESS, glfw.RELEASE or glfw.REPEAT
+        mods : int
+            The modifier keys
 
         Returns
         -------
-        tuple
-            The position of the window
+        None
         """
-        if self._open:
-            return glfw.get_window_pos(self._window)
-        return self._position
+        self._emit_event("key", key=key, scancode=scancode, action=INPUT_ACTIONS[action], mods=mods)
 
 
-    # MARK: set_title_bar_color()
-    def set_title_bar_color(self, color: tuple):
+class WindowGroup:
+    # MARK: __init__()
+    def __init__(self, vsync: str = None, no_warnings: bool = False):
         """
-        Set the title bar color of the window
+        Initialize a group of windows which are driven together
+        The windows share their GL objects, show_all() presents a frame in every window
+        and the events of all windows are polled once per tick
 
         Parameters
         ----------
-        color : tuple
-            The color of the title bar, must be a tuple of (int, int, int)
+        vsync : str, optional
+            The vsync mode of the first window, "off", "on" or "adaptive", all other windows
+            present without waiting so a tick only waits for one vertical blank, None to keep the window settings
+        no_warnings : bool, optional
+            Whether to suppress the warnings of the group
 
         Returns
         -------
         None
         """
-        if self._open:
-            if len(color) != 3 or isinstance(color[0], int) == False or isinstance(color[1], int) == False or isinstance(color[2], int) == False:
-                if self._no_warnings != True:
-                    print(RED + "SimpleWindow: title_bar_color must be a tuple of (int, int, int)" + NORMAL)
-                return
-            windll.dwmapi.DwmSetWindowAttribute(self._hwnd, 35, byref(c_int((max(0, min(255, round(color[0]))) << 16) | (max(0, min(255, round(color[1]))) << 8) | max(0, min(255, round(color[2]))))), sizeof(c_int))
-        self._title_bar_color = color
+        self._vsync = vsync if vsync in VSYNC_MODES else None
+        self._no_warnings = no_warnings
+        self._windows = []
+        self._share_window = None
+        self._programs = {}
 
 
-    # MARK: get_title_bar_color()
-    def get_title_bar_color(self):
+    # MARK: add()
+    def add(self, window: Window):
         """
-        Get the title bar color of the window
+        Add a window to the group, must be called before the window is created
 
         Parameters
         ----------
-        None
+        window : Window
+            The window to add
 
         Returns
         -------
-        tuple
-            The title bar color of the window
+        Window
+            The added window
         """
-        return self._title_bar_color
-
-
-    # MARK: set_border_color()
-    def set_border_color(self, color: tuple):
+        if window._group != None:
+            if window._no_warnings != True:
+                print(RED + "SimpleWindow: window is already in a group" + NORMAL)
+            return window
+        if window._open == True and window._no_warnings != True:
+            print(RED + "SimpleWindow: window is already open, it will only share GL objects after it was reopened" + NORMAL)
+        window._group = self
+        if self._vsync != None:
+            window.set_vsync(self._vsync if len(self._windows) == 0 else "off")
+        self._windows.append(window)
+        return window
+
+
+    # MARK: remove()
+    def remove(self, window: Window):
         """
-        Set the border color of the window
+        Remove a window from the group, the window is closed since its GL objects belong to the group
 
         Parameters
         ----------
-        color : tuple
-            The color of the border, must be a tuple of (int, int, int)
+        window : Window
+            The window to remove
 
         Returns
         -------
         None
         """
-        if self._open:
-            if len(color) != 3 or isinstance(color[0], int) == False or isinstance(color[1], int) == False or isinstance(color[2], int) == False:
-                if self._no_warnings != True:
-                    print(RED + "SimpleWindow: border_color must be a tuple of (int, int, int)" + NORMAL)
-                return
-            windll.dwmapi.DwmSetWindowAttribute(self._hwnd, 34, byref(c_int((max(0, min(255, round(color[0]))) << 16) | (max(0, min(255, round(color[1]))) << 8) | max(0, min(255, round(color[2]))))), sizeof(c_int))
-        self._border_color = color
+        if window in self._windows:
+            window.close()
+            window._group = None
+            self._windows.remove(window)
 
 
-    # MARK: get_border_color()
-    def get_border_color(self):
+    # MARK: get_windows()
+    def get_windows(self):
         """
-        Get the border color of the window
+        Get the windows of the group
 
         Parameters
         ----------
@@ -375,34 +6055,50 @@ class Window:
 
         Returns
         -------
-        tuple
-            The border color of the window
+        list
+            The windows of the group
         """
-        return self._border_color
+        return list(self._windows)
 
 
-    # MARK: set_resizable()
-    def set_resizable(self, state: bool):
+    # MARK: show_all()
+    def show_all(self, frames: dict, channel_order: str = None):
         """
-        Set the resizable state of the window
+        Show a frame in each of the given windows and poll the events of all windows once
 
         Parameters
         ----------
-        state : bool
-            If the window should be resizable
+        frames : dict
+            The frames to show, keyed by the Window or by its name, a frame can also be a dict with the arguments
+            of Window.show() like {"frame": frame, "version": 3, "colormap": "turbo"} to pass them for that window
+        channel_order : str, optional
+            The order of the channels in the frames which do not set their own, see Window.show()
 
         Returns
         -------
         None
         """
-        glfw.set_window_attrib(self._window, glfw.RESIZABLE, glfw.TRUE if state else glfw.FALSE)
-        self._resizable = state
-
-
-    # MARK: get_resizable()
-    def get_resizable(self):
+        windows = {window.get_name(): window for window in self._windows}
+        for key, frame in frames.items():
+            window = windows.get(key) if isinstance(key, str) else key
+            if window == None or window._group is not self:
+                if self._no_warnings != True and (window == None or window._no_warnings != True):
+                    print(RED + f"SimpleWindow: {key} is not a window of this group" + NORMAL)
+                continue
+            arguments = dict(frame) if isinstance(frame, dict) else {"frame": frame}
+            arguments.setdefault("channel_order", channel_order)
+            prepared = window._prepare_frame(**arguments)
+            if prepared != None and window._prepare_show() == "ready":
+                window._present(*prepared)
+        glfw.poll_events()
+
+
+    # MARK: batch()
+    @contextlib.contextmanager
+    def batch(self):
         """
-        Get the resizable state of the window
+        Collect the changes of the setters of all windows and apply them together when the with block ends,
+        see Window.batch()
 
         Parameters
         ----------
@@ -410,35 +6106,35 @@ class Window:
 
         Returns
         -------
-        bool
-            If the window is resizable
+        context manager
+            Use with a with statement
         """
-        return self._resizable
+        with contextlib.ExitStack() as stack:
+            for window in self._windows:
+                stack.enter_context(window.batch())
+            yield self
 
 
-    # MARK: set_topmost()
-    def set_topmost(self, state: bool):
+    # MARK: poll_events()
+    def poll_events(self):
         """
-        Set the window to be always on top of other windows
+        Poll the events of all windows, needed when the windows are shown with Window.show() instead of show_all()
 
         Parameters
         ----------
-        state : bool
-            If the window should be always on top of other windows
+        None
 
         Returns
         -------
         None
         """
-        if self._window != None:
-            glfw.set_window_attrib(self._window, glfw.FLOATING, glfw.TRUE if state else glfw.FALSE)
-        self._topmost = state
+        glfw.poll_events()
 
 
-    # MARK: get_topmost()
-    def get_topmost(self):
+    # MARK: close()
+    def close(self):
         """
-        Get the topmost state of the window
+        Close all windows of the group and release the shared GL objects
 
         Parameters
         ----------
@@ -446,38 +6142,156 @@ class Window:
 
         Returns
         -------
-        bool
-            If the window is on top of other windows
+        None
         """
-        return self._topmost
+        for window in self._windows:
+            window.close()
+        if self._share_window != None:
+            if getattr(_current_context, "window", None) is self._share_window:
+                _current_context.window = None
+            glfw.destroy_window(self._share_window)
+            self._share_window = None
+            self._programs = {}
+
+
+    # MARK: _get_share_window()
+    def _get_share_window(self):
+        """
+        Get the hidden window whose context owns the GL objects shared by the group, created on first use
 
+        Parameters
+        ----------
+        None
 
-    # MARK: set_foreground()
-    def set_foreground(self, state: bool):
+        Returns
+        -------
+        glfw window
+            The hidden window
         """
-        Set the window to be in the foreground
+        if self._share_window == None:
+            _init_glfw()
+            self._share_window = _create_context_window(1, 1, "SimpleWindow", visible=False)
+        return self._share_window
+
+
+
+class SharedFrameSource:
+    # MARK: __init__()
+    def __init__(self, name: str = None, shape: tuple = None, dtype="uint8", slots: int = SHARED_FRAME_SLOTS):
+        """
+        Create or attach to a ring of frames in shared memory, to show frames which are produced in another process
+        The producer writes frames with write(), the consumer passes the source to Window.show() or Window.run()
+        which upload the latest complete frame straight from the shared memory
+        Neither side takes a lock, the sequence number of a slot is invalidated while the slot is written,
+        so the latest complete frame can always be found and a slow consumer simply skips frames
 
         Parameters
         ----------
-        state : bool
-            If the window should be in the foreground
+        name : str, optional
+            The name of the shared memory, to attach to a source which was created by another process
+            or to create a source with that name, None to create a source with a generated name, see get_name()
+        shape : tuple, optional
+            The shape of the frames, creates a new source, None to attach to an existing one
+        dtype : numpy.dtype, optional
+            The dtype of the frames, only used when a source is created
+        slots : int, optional
+            The number of frames in the ring, only used when a source is created,
+            with more slots the consumer has more time to upload a frame before the producer writes its slot again
 
         Returns
         -------
         None
         """
-        if self._open:
-            if state:
-                win32gui.SetWindowPos(self._hwnd, win32con.HWND_TOPMOST if self._topmost else win32con.HWND_TOP, self.get_size()[0], self.get_size()[1], 0, 0, win32con.SWP_NOMOVE | win32con.SWP_NOSIZE)
+        if shape == None and name == None:
+            raise ValueError("SimpleWindow: either the name of an existing source or the shape of a new one is needed")
+        self._owner = shape != None
+        if self._owner:
+            shape = tuple(int(value) for value in shape)
+            dtype = numpy.dtype(dtype)
+            if len(shape) == 0 or len(shape) > SHARED_FRAME_MAX_DIMENSIONS or int(slots) < 1:
+                raise ValueError("SimpleWindow: a shared frame needs 1 to " + str(SHARED_FRAME_MAX_DIMENSIONS) +
+                                 " dimensions and the ring at least one slot")
+            slots = int(slots)
+            frames_offset = self._get_frames_offset(slots)
+            size = frames_offset + slots * int(numpy.prod(shape)) * dtype.itemsize
+            self._memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            if sys.version_info >= (3, 13):
+                self._memory = shared_memory.SharedMemory(name=name, track=False)
             else:
-                win32gui.SetWindowPos(self._hwnd, win32con.HWND_BOTTOM, self.get_size()[0], self.get_size()[1], 0, 0, win32con.SWP_NOMOVE | win32con.SWP_NOSIZE)
-        self._foreground = state
+                # before Python 3.13 every attaching process registers the memory and its resource tracker unlinks it
+                # on exit, so the registration is taken back, the tracker knows posix names with their leading slash,
+                # a child process shares the tracker of its parent, so this can also take back the one of the creator
+                self._memory = shared_memory.SharedMemory(name=name)
+                if os.name == "posix":
+                    resource_tracker.unregister("/" + self._memory.name, "shared_memory")
+
+        # numpy.frombuffer() keeps the buffer exported as long as a view exists, unlike numpy.ndarray(buffer=...),
+        # so closing the shared memory under a view raises an error instead of unmapping memory which is still used
+        self._header = numpy.frombuffer(self._memory.buf, dtype=numpy.int64, count=SHARED_FRAME_DTYPE_OFFSET // 8)
+        dtype_bytes = numpy.frombuffer(self._memory.buf, dtype=numpy.uint8,
+                                       count=SHARED_FRAME_DTYPE_SIZE, offset=SHARED_FRAME_DTYPE_OFFSET)
+        if self._owner:
+            self._header[:] = 0
+            self._header[0] = SHARED_FRAME_MAGIC
+            self._header[1] = slots
+            self._header[2] = len(shape)
+            self._header[3:3 + len(shape)] = shape
+            self._header[7] = -1
+            dtype_bytes[:] = 0
+            dtype_bytes[:len(dtype.str)] = numpy.frombuffer(dtype.str.encode("ascii"), dtype=numpy.uint8)
+        else:
+            if self._header[0] != SHARED_FRAME_MAGIC:
+                self._header = None
+                del dtype_bytes
+                self._memory.close()
+                raise ValueError("SimpleWindow: the shared memory " + str(name) + " does not hold a SharedFrameSource")
+            slots = int(self._header[1])
+            shape = tuple(int(value) for value in self._header[3:3 + int(self._header[2])])
+            dtype = numpy.dtype(dtype_bytes.tobytes().rstrip(b"\0").decode("ascii"))
+            frames_offset = self._get_frames_offset(slots)
+        del dtype_bytes
+
+        self._slots = slots
+        self._shape = shape
+        self._dtype = dtype
+        self._sequences = numpy.frombuffer(self._memory.buf, dtype=numpy.int64,
+                                           count=slots, offset=SHARED_FRAME_HEADER_SIZE)
+        self._timestamps = numpy.frombuffer(self._memory.buf, dtype=numpy.float64,
+                                            count=slots, offset=SHARED_FRAME_HEADER_SIZE + slots * 8)
+        self._frames = numpy.frombuffer(self._memory.buf, dtype=dtype, count=slots * int(numpy.prod(shape)),
+                                        offset=frames_offset).reshape((slots,) + shape)
+        if self._owner:
+            self._sequences[:] = -1
+            self._timestamps[:] = 0
+        self._writing = None
+        self._last_read = -1
+
+
+    # MARK: _get_frames_offset()
+    @staticmethod
+    def _get_frames_offset(slots: int):
+        """
+        Get the offset of the first frame in the shared memory, behind the header and the slot table
 
+        Parameters
+        ----------
+        slots : int
+            The number of slots
 
-    # MARK: get_foreground()
-    def get_foreground(self):
+        Returns
+        -------
+        int
+            The offset in bytes
+        """
+        offset = SHARED_FRAME_HEADER_SIZE + slots * 16
+        return (offset + SHARED_FRAME_ALIGNMENT - 1) // SHARED_FRAME_ALIGNMENT * SHARED_FRAME_ALIGNMENT
+
+
+    # MARK: get_name()
+    def get_name(self):
         """
-        Get the foreground state of the window
+        Get the name of the shared memory, to attach to the source from another process
 
         Parameters
         ----------
@@ -485,37 +6299,33 @@ class Window:
 
         Returns
         -------
-        bool
-            If the window is in the foreground
+        str
+            The name of the shared memory
         """
-        if self._open:
-            self._foreground = self._hwnd == win32gui.GetForegroundWindow()
-        return self._foreground
+        return self._memory.name
 
 
-    # MARK: set_minimized()
-    def set_minimized(self, state: bool):
+    # MARK: get_shape()
+    def get_shape(self):
         """
-        Set the window to be minimized
+        Get the shape of the frames
 
         Parameters
         ----------
-        state : bool
-            If the window should be minimized
+        None
 
         Returns
         -------
-        None
+        tuple
+            The shape of the frames
         """
-        if self._open:
-            win32gui.ShowWindow(self._hwnd, win32con.SW_MINIMIZE if state else win32con.SW_RESTORE)
-        self._minimized = state
+        return self._shape
 
 
-    # MARK: get_minimized()
-    def get_minimized(self):
+    # MARK: get_dtype()
+    def get_dtype(self):
         """
-        Get the minimized state of the window
+        Get the dtype of the frames
 
         Parameters
         ----------
@@ -523,36 +6333,34 @@ class Window:
 
         Returns
         -------
-        bool
-            If the window is minimized
+        numpy.dtype
+            The dtype of the frames
         """
-        if self._open:
-            self._minimized = int(win32gui.IsIconic(self._hwnd)) == 1
-        return self._minimized
+        return self._dtype
 
 
-    # MARK: set_undestroyable()
-    def set_undestroyable(self, state: bool):
+    # MARK: get_slots()
+    def get_slots(self):
         """
-        Set the window to be undestroyable
-        Undestroyable windows will automatically reopen when the user closes the window
+        Get the number of frames in the ring
 
         Parameters
         ----------
-        state : bool
-            If the window should be undestroyable
+        None
 
         Returns
         -------
-        None
+        int
+            The number of slots
         """
-        self._undestroyable = state
+        return self._slots
 
 
-    # MARK: get_undestroyable()
-    def get_undestroyable(self):
+    # MARK: get_write_buffer()
+    def get_write_buffer(self):
         """
-        Get the undestroyable state of the window
+        Get the next slot of the ring to render or capture a frame into it without a copy, publish() makes it visible
+        Only one process may write to a source
 
         Parameters
         ----------
@@ -560,103 +6368,123 @@ class Window:
 
         Returns
         -------
-        bool
-            If the window is undestroyable
+        numpy.ndarray
+            The frame of the next slot, its content is undefined
         """
-        return self._undestroyable
+        if self._writing == None:
+            sequence = int(self._header[7]) + 1
+            slot = sequence % self._slots
+            # readers skip the slot from now on until publish() stores its new sequence
+            self._sequences[slot] = -1
+            self._writing = sequence
+        return self._frames[self._writing % self._slots]
 
 
-    # MARK: set_icon()
-    def set_icon(self, icon: str):
+    # MARK: publish()
+    def publish(self, timestamp: float = None):
         """
-        Set the window icon of the window
+        Make the frame written into the buffer from get_write_buffer() the latest frame
 
         Parameters
         ----------
-        icon : str
-            The path to the .ico icon
+        timestamp : float, optional
+            The time the frame was captured at, defaults to time.perf_counter() which is comparable across processes
 
         Returns
         -------
-        None
+        int
+            The sequence number of the frame, None if get_write_buffer() was not called
         """
-        if self._open:
-            if isinstance(icon, str) == False:
-                if self._no_warnings != True:
-                    print(RED + "SimpleWindow: icon must be a string, the path to the .ico file" + NORMAL)
-                return
-            if os.path.exists(icon) == False:
-                if self._no_warnings != True:
-                    print(RED + "SimpleWindow: invalid icon path" + NORMAL)
-                return
-            if icon.endswith(".ico") == False:
-                if self._no_warnings != True:
-                    print(RED + "SimpleWindow: icon must be an .ico file" + NORMAL)
-                return
-            icon_handle = win32gui.LoadImage(None, icon, win32con.IMAGE_ICON, 0, 0, win32con.LR_LOADFROMFILE | win32con.LR_DEFAULTSIZE)
-            win32gui.SendMessage(self._hwnd, win32con.WM_SETICON, win32con.ICON_SMALL, icon_handle)
-            win32gui.SendMessage(self._hwnd, win32con.WM_SETICON, win32con.ICON_BIG, icon_handle)
-        self._icon = icon
-
-
-    # MARK: get_icon()
-    def get_icon(self):
+        if self._writing == None:
+            return None
+        sequence = self._writing
+        slot = sequence % self._slots
+        self._timestamps[slot] = time.perf_counter() if timestamp == None else timestamp
+        self._sequences[slot] = sequence
+        self._header[7] = sequence
+        self._writing = None
+        return sequence
+
+
+    # MARK: write()
+    def write(self, frame: numpy.ndarray, timestamp: float = None):
         """
-        Get the icon path of the window
+        Copy a frame into the next slot of the ring and make it the latest frame
+        Only one process may write to a source
 
         Parameters
         ----------
-        None
+        frame : numpy.ndarray
+            The frame, with the shape of the source, it is converted to the dtype of the source
+        timestamp : float, optional
+            The time the frame was captured at, see publish()
 
         Returns
         -------
-        str
-            The path to the .ico icon
+        int
+            The sequence number of the frame
         """
-        return self._icon
+        numpy.copyto(self.get_write_buffer(), frame, casting="unsafe")
+        return self.publish(timestamp)
 
 
-    # MARK: set_open()
-    def set_open(self, state: bool):
+    # MARK: read()
+    def read(self, out: numpy.ndarray = None):
         """
-        Set the open state of the window
+        Get the latest complete frame, as a view of the shared memory or copied into out
+        The view is not protected from the producer, it writes the slot again after slots - 1 newer frames
+        and a view which is used after that shows a torn frame, see is_valid() to check a frame after using it
+        A copy into out is checked after the copy and only returned when the producer did not touch the slot meanwhile
 
         Parameters
         ----------
-        state : bool
-            If the window should be open
+        out : numpy.ndarray, optional
+            An array with the shape and dtype of the source to copy the frame into, None to get a view
 
         Returns
         -------
-        None
+        tuple
+            The frame, its sequence number and its timestamp, None if no frame was published yet
+            or the producer lapped the ring during every attempt
         """
-        if state and self._open != True:
-            self.create_window()
-        elif state == False and self._open:
-            self.close()
-
-
-    # MARK: get_open()
-    def get_open(self):
+        for _ in range(self._slots + 1):
+            sequence = int(self._header[7])
+            if sequence < 0:
+                return None
+            slot = sequence % self._slots
+            if self._sequences[slot] != sequence:
+                # the producer lapped the ring since the header was read
+                continue
+            timestamp = float(self._timestamps[slot])
+            if out is not None:
+                numpy.copyto(out, self._frames[slot])
+            if self._sequences[slot] == sequence:
+                return (self._frames[slot] if out is None else out), sequence, timestamp
+        return None
+
+
+    # MARK: is_valid()
+    def is_valid(self, sequence: int):
         """
-        Get the open state of the window
+        Check if a frame from read() was not overwritten yet
 
         Parameters
         ----------
-        None
+        sequence : int
+            The sequence number of the frame
 
         Returns
         -------
         bool
-            If the window is open
+            If the slot still holds the frame
         """
-        return self._open == True
+        return int(self._sequences[sequence % self._slots]) == sequence
 
 
-    # MARK: get_handle()
-    def get_handle(self):
+    # MARK: __call__()
+    def __call__(self):
         """
-        Get the handle (HWND) of the window
+        Get the latest frame if it is newer than the one returned by the last call, the frame source of Window.run()
 
         Parameters
         ----------
@@ -664,93 +6492,59 @@ class Window:
 
         Returns
         -------
-        int
-            The handle of the window
+        numpy.ndarray
+            The frame as a view of the shared memory, None if there is no new frame
         """
-        return self._hwnd
+        latest = self.read()
+        if latest == None or latest[1] == self._last_read:
+            return None
+        self._last_read = latest[1]
+        return latest[0]
 
 
-    # MARK: show()
-    def show(self, frame: numpy.ndarray):
+    # MARK: close()
+    def close(self):
         """
-        Show the frame in the window
+        Detach from the shared memory
+        The shared memory can only be detached once nothing references it anymore, so the callers must drop
+        the frames returned by read(), get_write_buffer() and __call__(), close the windows which showed them
+        and remove the layers which show them first
 
         Parameters
         ----------
-        frame : numpy.ndarray
-            The frame to show
+        None
 
         Returns
         -------
         None
         """
-        if self._open == False:
-            self.create_window()
-
-        if self._open == False and self._undestroyable == False:
-            return
-
-        if glfw.window_should_close(self._window):
-            if self._open == True:
-                self.close()
-                self._open = "user_closed"
-            if self._undestroyable:
-                self.create_window()
-            return
-
-        self._minimized = self.get_minimized()
-
-        if self._minimized:
-            glfw.poll_events()
-            return
-
-        glfw.make_context_current(self._window)
-
-        width, height = glfw.get_framebuffer_size(self._window)
-        if (width != gl.glGetTexLevelParameteriv(gl.GL_TEXTURE_2D, 0, gl.GL_TEXTURE_WIDTH) or
-            height != gl.glGetTexLevelParameteriv(gl.GL_TEXTURE_2D, 0, gl.GL_TEXTURE_HEIGHT)):
-            gl.glTexImage2D(
-                gl.GL_TEXTURE_2D,
-                0,
-                gl.GL_RGB8,
-                width,
-                height,
-                0,
-                gl.GL_BGR,
-                gl.GL_UNSIGNED_BYTE,
-                None
-            )
-
-        gl.glViewport(0, 0, width, height)
-        gl.glClearColor(0.0, 0.0, 0.0, 1.0)
-        gl.glClear(gl.GL_COLOR_BUFFER_BIT)
-
-        if len(frame.shape) == 2 or frame.shape[2] == 1:
-            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-        if frame.shape[0] != height or frame.shape[1] != width:
-            frame = cv2.resize(frame, (width, height))
-
-        frame = numpy.ascontiguousarray(frame, dtype=numpy.uint8)
-        gl.glBindTexture(gl.GL_TEXTURE_2D, self._texture_id)
-        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
-        gl.glTexSubImage2D(
-            gl.GL_TEXTURE_2D,
-            0, 0, 0,
-            width, height,
-            gl.GL_BGR,
-            gl.GL_UNSIGNED_BYTE,
-            frame.tobytes()
-        )
-
-        gl.glEnable(gl.GL_TEXTURE_2D)
-        gl.glBegin(gl.GL_QUADS)
-        gl.glTexCoord2f(0.0, 1.0); gl.glVertex2f(-1.0, -1.0)
-        gl.glTexCoord2f(1.0, 1.0); gl.glVertex2f( 1.0, -1.0)
-        gl.glTexCoord2f(1.0, 0.0); gl.glVertex2f( 1.0,  1.0)
-        gl.glTexCoord2f(0.0, 0.0); gl.glVertex2f(-1.0,  1.0)
-        gl.glEnd()
-        gl.glDisable(gl.GL_TEXTURE_2D)
+        # the views of the source hold the buffer of the shared memory, they are released before it is closed
+        self._header = None
+        self._sequences = None
+        self._timestamps = None
+        self._frames = None
+        try:
+            self._memory.close()
+        except BufferError as error:
+            raise RuntimeError("SimpleWindow: the shared memory " + str(self._memory.name) + " is still referenced, "
+                               "drop the frames read from the source and close the windows which showed them first") from error
+
+
+    # MARK: unlink()
+    def unlink(self):
+        """
+        Free the shared memory once every process detached, called by the process which created the source
 
-        glfw.swap_buffers(self._window)
+        Parameters
+        ----------
+        None
 
-        glfw.poll_events()
\ No newline at end of file
+        Returns
+        -------
+        None
+        """
+        if sys.version_info < (3, 13) and os.name == "posix":
+            # a child process which attached took the registration back from the tracker it shares with this process,
+            # registering again is a no-op otherwise and keeps unlink() from unregistering a name the tracker forgot
+            resource_tracker.register("/" + self._memory.name, "shared_memory")
+        self._memory.unlink()
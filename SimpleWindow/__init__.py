@@ -1 +1 @@
-from .SimpleWindow import Window
\ No newline at end of file
+from .SimpleWindow import Window, WindowGroup, SharedFrameSource
\ No newline at end of file
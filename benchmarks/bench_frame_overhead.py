@@ -0,0 +1,84 @@
+"""
+Microbenchmark for the per frame geometry bookkeeping in Window.show()
+
+Compares the old approach, which queried the texture size with two
+glGetTexLevelParameteriv() calls and the framebuffer size with
+glfw.get_framebuffer_size() on every frame and reallocated the texture on every
+size change, with the cached geometry and the bucketed texture storage.
+
+Usage: python benchmarks/bench_frame_overhead.py [--frames N]
+"""
+import argparse
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SimpleWindow.SimpleWindow import Window
+import OpenGL.GL as gl
+import numpy
+import glfw
+
+
+def bench_queries(window, frames):
+    gl.glBindTexture(gl.GL_TEXTURE_2D, window._texture.id)
+    start = time.perf_counter()
+    for _ in range(frames):
+        width, height = glfw.get_framebuffer_size(window._window)
+        gl.glGetTexLevelParameteriv(gl.GL_TEXTURE_2D, 0, gl.GL_TEXTURE_WIDTH)
+        gl.glGetTexLevelParameteriv(gl.GL_TEXTURE_2D, 0, gl.GL_TEXTURE_HEIGHT)
+    return (time.perf_counter() - start) / frames
+
+
+def bench_cached(window, frames):
+    gl.glBindTexture(gl.GL_TEXTURE_2D, window._texture.id)
+    frame_width, frame_height = window._texture.size
+    start = time.perf_counter()
+    for _ in range(frames):
+        width, height = window._framebuffer_size
+        window._texture.reserve(frame_width, frame_height, gl.GL_RGB8)
+    return (time.perf_counter() - start) / frames
+
+
+def bench_drag_resize(window, sizes):
+    gl.glBindTexture(gl.GL_TEXTURE_2D, window._texture.id)
+    start = time.perf_counter()
+    for width, height in sizes:
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGB8, width, height, 0, gl.GL_BGR, gl.GL_UNSIGNED_BYTE, None)
+    gl.glFinish()
+    legacy_time = time.perf_counter() - start
+    legacy_allocations = len(sizes)
+
+    window._texture.capacity = (0, 0)
+    allocations = window._texture.allocations
+    start = time.perf_counter()
+    for width, height in sizes:
+        window._texture.reserve(width, height, gl.GL_RGB8)
+    gl.glFinish()
+    cached_time = time.perf_counter() - start
+    return legacy_time, legacy_allocations, cached_time, window._texture.allocations - allocations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=10000)
+    args = parser.parse_args()
+
+    window = Window(name="bench_frame_overhead", size=(640, 360), foreground=False, no_warnings=True)
+    window.show(numpy.zeros((360, 640, 3), dtype=numpy.uint8))
+
+    queries = bench_queries(window, args.frames)
+    cached = bench_cached(window, args.frames)
+    print(f"per frame geometry overhead: before {queries * 1e6:8.2f} us, after {cached * 1e6:8.2f} us")
+
+    sizes = [(640 + i, 360 + i * 9 // 16) for i in range(0, 320, 2)]
+    legacy_time, legacy_allocations, cached_time, cached_allocations = bench_drag_resize(window, sizes)
+    print(f"drag resize over {len(sizes)} sizes: before {legacy_allocations:4d} allocations in {legacy_time * 1e3:8.2f} ms, "
+          f"after {cached_allocations:4d} allocations in {cached_time * 1e3:8.2f} ms")
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Benchmark suite for the Window.show() pipeline
+
+Measures the frames per second and the per frame latency of show() across
+resolutions, dtypes and channel counts, with the frame size matching the
+window (resize off) or differing from it (resize on), and with several windows
+at once. The results are written as JSON and can be compared against a stored
+baseline, the run fails if a case got slower than the threshold allows.
+
+On Linux run it through benchmarks/run_headless.sh, which uses Xvfb and Mesa's
+llvmpipe software renderer so the numbers do not depend on a GPU.
+
+Usage: python benchmarks/bench_show.py [--quick] [--output results.json]
+                                       [--baseline baseline.json] [--threshold 0.15]
+"""
+import argparse
+import platform
+import time
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SimpleWindow.SimpleWindow import Window
+import OpenGL.GL as gl
+import numpy
+
+
+RESOLUTIONS = {
+    "vga": (640, 480),
+    "hd": (1280, 720),
+    "fhd": (1920, 1080),
+    "4k": (3840, 2160),
+}
+# name: (dtype, channels)
+FORMATS = {
+    "gray_u8": (numpy.uint8, 1),
+    "bgr_u8": (numpy.uint8, 3),
+    "bgra_u8": (numpy.uint8, 4),
+    "gray_u16": (numpy.uint16, 1),
+    "bgr_u16": (numpy.uint16, 3),
+    "gray_f32": (numpy.float32, 1),
+    "bgr_f32": (numpy.float32, 3),
+}
+WINDOW_COUNTS = (1, 4)
+RESIZED_WINDOW_SIZE = (800, 600)
+
+
+def make_frames(resolution, dtype, channels, count=2):
+    width, height = resolution
+    shape = (height, width) if channels == 1 else (height, width, channels)
+    random = numpy.random.default_rng(0)
+    frames = []
+    for _ in range(count):
+        if numpy.dtype(dtype).kind == "f":
+            frames.append(random.random(shape, dtype=numpy.float32))
+        else:
+            frames.append(random.integers(0, numpy.iinfo(dtype).max, shape, dtype=dtype))
+    return frames
+
+
+def run_case(resolution, dtype, channels, resize, window_count, frames, warmup):
+    window_size = RESIZED_WINDOW_SIZE if resize else resolution
+    windows = [Window(name=f"bench_show {index}", size=window_size, position=(index * 40, index * 40),
+                      foreground=False, vsync="off", no_warnings=True) for index in range(window_count)]
+    images = make_frames(resolution, dtype, channels)
+
+    for index in range(warmup):
+        for window in windows:
+            window.show(images[index % len(images)])
+    gl.glFinish()
+
+    latencies = numpy.zeros(frames)
+    start = time.perf_counter()
+    for index in range(frames):
+        frame_start = time.perf_counter()
+        for window in windows:
+            window.show(images[index % len(images)])
+        latencies[index] = time.perf_counter() - frame_start
+    gl.glFinish()
+    total = time.perf_counter() - start
+
+    for window in windows:
+        window.close()
+
+    p50, p90, p99 = numpy.percentile(latencies * 1000, (50, 90, 99))
+    return {"fps": frames / total, "mean_ms": float(latencies.mean() * 1000),
+            "p50_ms": float(p50), "p90_ms": float(p90), "p99_ms": float(p99)}
+
+
+def get_cases(quick):
+    resolutions = ("vga", "fhd") if quick else tuple(RESOLUTIONS)
+    formats = ("gray_u8", "bgr_u8", "gray_f32") if quick else tuple(FORMATS)
+    for resolution in resolutions:
+        for format_name in formats:
+            for resize in (False, True):
+                yield f"{resolution}/{format_name}/{'resize' if resize else 'native'}/1", resolution, format_name, resize, 1
+    for window_count in WINDOW_COUNTS[1:]:
+        yield f"vga/bgr_u8/native/{window_count}", "vga", "bgr_u8", False, window_count
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["fps"] / baseline[name]["fps"]
+        status = "REGRESSION" if ratio < 1 - threshold else "ok"
+        print(f"{name:32s} {baseline[name]['fps']:9.1f} -> {result['fps']:9.1f} fps ({(ratio - 1) * 100:+6.1f} %) {status}")
+        if status != "ok":
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="only run a small subset of the cases")
+    parser.add_argument("--frames", type=int, default=200, help="measured frames per case")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured frames per case")
+    parser.add_argument("--output", default="bench_output.json", help="where to write the results")
+    parser.add_argument("--baseline", help="results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed relative fps loss before failing")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this string")
+    args = parser.parse_args()
+
+    results = {}
+    renderer = None
+    for name, resolution, format_name, resize, window_count in get_cases(args.quick):
+        if args.filter not in name:
+            continue
+        dtype, channels = FORMATS[format_name]
+        results[name] = run_case(RESOLUTIONS[resolution], dtype, channels, resize, window_count, args.frames, args.warmup)
+        print(f"{name:32s} {results[name]['fps']:9.1f} fps  p50 {results[name]['p50_ms']:7.2f} ms  p99 {results[name]['p99_ms']:7.2f} ms")
+        if renderer == None:
+            # the windows of the case are closed, so query with a fresh one
+            window = Window(name="bench_show renderer", foreground=False, no_warnings=True)
+            window.show(numpy.zeros((50, 150, 3), dtype=numpy.uint8))
+            renderer = gl.glGetString(gl.GL_RENDERER)
+            renderer = renderer.decode() if isinstance(renderer, bytes) else str(renderer)
+            window.close()
+
+    output = {"meta": {"platform": platform.platform(), "python": platform.python_version(), "renderer": renderer,
+                       "frames": args.frames}, "results": results}
+    with open(args.output, "w") as file:
+        json.dump(output, file, indent=4)
+    print(f"results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} case(s) regressed by more than {args.threshold * 100:.0f} %")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark for the window system queries made per frame
+
+Counts the calls into GLFW and the platform backend which ask the window
+system for its state, in a loop which shows a frame and reads the size,
+position, minimized and foreground state like a typical application does.
+Before, show() queried the close and minimized state on every frame and every
+getter made its own query (IsIconic and GetForegroundWindow on Windows), now
+everything is read from the state cached by the window callbacks.
+
+The before numbers come from the module of an earlier revision when --baseline
+points at a checkout of it, e.g. made with `git worktree add ../baseline <rev>`,
+the baseline only runs on Windows. Without it the before numbers are simulated
+by replaying the queries the baseline made on the current module.
+
+Usage: python benchmarks/bench_state_queries.py [--frames N] [--baseline PATH]
+"""
+import importlib.util
+import argparse
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SimpleWindow import SimpleWindow
+import numpy
+
+# the GLFW functions which ask the window system, get_window_attrib is counted through the backend
+GLFW_QUERIES = ("window_should_close", "get_window_size", "get_window_pos", "get_framebuffer_size", "get_cursor_pos")
+BACKEND_QUERIES = ("get_minimized", "get_foreground")
+# the baseline asked Windows directly instead of going through a backend
+WIN32_QUERIES = ("IsIconic", "GetForegroundWindow")
+
+
+class CountingProxy:
+    def __init__(self, target, names, counts):
+        self._target = target
+        self._names = names
+        self._counts = counts
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if name in self._names:
+            def counted(*args, **kwargs):
+                self._counts[name] = self._counts.get(name, 0) + 1
+                return value(*args, **kwargs)
+            return counted
+        return value
+
+
+def load_baseline(path):
+    spec = importlib.util.spec_from_file_location("baseline_SimpleWindow", os.path.join(path, "SimpleWindow", "SimpleWindow.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_queries(window):
+    glfw, backend = SimpleWindow.glfw, window._backend
+    # show() checked the close and minimized state before every frame
+    glfw.window_should_close(window._window)
+    backend.get_minimized(window._window, window._hwnd)
+    # get_size(), get_position(), get_minimized() and get_foreground() each queried the window
+    glfw.get_window_size(window._window)
+    glfw.get_window_pos(window._window)
+    backend.get_minimized(window._window, window._hwnd)
+    backend.get_foreground(window._window, window._hwnd)
+
+
+def cached_queries(window):
+    window.get_size()
+    window.get_position()
+    window.get_minimized()
+    window.get_foreground()
+
+
+def bench_loop(window, frame, frames, queries, counts):
+    counts.clear()
+    for _ in range(frames):
+        window.show(frame)
+        queries(window)
+    return sum(counts.values()) / frames, dict(counts)
+
+
+def bench_time(window, frames, queries):
+    start = time.perf_counter()
+    for _ in range(frames):
+        queries(window)
+    return (time.perf_counter() - start) / frames
+
+
+def bench_baseline(path, frame, frames):
+    baseline = load_baseline(path)
+    window = baseline.Window(name="bench_state_queries", size=(640, 360), foreground=False, no_warnings=True)
+    window.show(frame)
+
+    counts = {}
+    glfw, win32gui = baseline.glfw, baseline.win32gui
+    baseline.glfw = CountingProxy(glfw, GLFW_QUERIES, counts)
+    baseline.win32gui = CountingProxy(win32gui, WIN32_QUERIES, counts)
+    count, calls = bench_loop(window, frame, frames, cached_queries, counts)
+
+    baseline.glfw, baseline.win32gui = glfw, win32gui
+    seconds = bench_time(window, frames * 10, cached_queries)
+    window.close()
+    # the baseline left its hints for the legacy OpenGL context it draws with
+    glfw.default_window_hints()
+    return count, calls, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--baseline", help="checkout of the revision to compare against, simulated if not given")
+    args = parser.parse_args()
+
+    frame = numpy.zeros((360, 640, 3), dtype=numpy.uint8)
+    if args.baseline:
+        before = f"before ({args.baseline})"
+        legacy_count, legacy_calls, legacy_time = bench_baseline(args.baseline, frame, args.frames)
+
+    window = SimpleWindow.Window(name="bench_state_queries", size=(640, 360), foreground=False, no_warnings=True)
+    window.show(frame)
+
+    counts = {}
+    glfw, backend = SimpleWindow.glfw, window._backend
+    SimpleWindow.glfw = CountingProxy(glfw, GLFW_QUERIES, counts)
+    window._backend = CountingProxy(backend, BACKEND_QUERIES, counts)
+
+    if not args.baseline:
+        before = "before (simulated)"
+        legacy_count, legacy_calls = bench_loop(window, frame, args.frames, legacy_queries, counts)
+    cached_count, cached_calls = bench_loop(window, frame, args.frames, cached_queries, counts)
+    print(f"window system queries per frame: {before} {legacy_count:5.2f}, after {cached_count:5.2f}")
+    print(f"  {before}: {', '.join(f'{name} {count / args.frames:.2f}' for name, count in sorted(legacy_calls.items()))}")
+    print(f"  after: {', '.join(f'{name} {count / args.frames:.2f}' for name, count in sorted(cached_calls.items())) or 'none'}")
+
+    SimpleWindow.glfw, window._backend = glfw, backend
+    if not args.baseline:
+        legacy_time = bench_time(window, args.frames * 10, legacy_queries)
+    cached_time = bench_time(window, args.frames * 10, cached_queries)
+    print(f"state queries per frame: {before} {legacy_time * 1e6:8.2f} us, after {cached_time * 1e6:8.2f} us")
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark for driving many windows with a WindowGroup
+
+For a growing number of windows, compares showing a frame in every window with
+Window.show(), which polls the events and switches the GL context once per
+window, against WindowGroup.show_all(), which polls the events once per tick.
+Reports the time per tick and the number of event polls and context switches.
+
+Usage: python benchmarks/bench_window_group.py [--ticks N] [--windows 1 2 4 8 16]
+"""
+import argparse
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SimpleWindow import SimpleWindow
+from SimpleWindow.SimpleWindow import Window, WindowGroup
+import numpy
+
+
+class CallCounter:
+    def __init__(self, function):
+        self.function = function
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.function(*args, **kwargs)
+
+
+def count_calls():
+    glfw = SimpleWindow.glfw
+    counters = {}
+    for name in ("poll_events", "make_context_current"):
+        counters[name] = CallCounter(getattr(glfw, name))
+        setattr(glfw, name, counters[name])
+    return counters
+
+
+def make_windows(count):
+    return [Window(name=f"bench_window_group {index}", size=(320, 240), position=(index % 4 * 330, index // 4 * 280),
+                   foreground=False, vsync="off", no_warnings=True) for index in range(count)]
+
+
+def run(count, ticks, grouped, counters):
+    frame = numpy.random.default_rng(0).integers(0, 255, (240, 320, 3), dtype=numpy.uint8)
+    windows = make_windows(count)
+    group = None
+    if grouped:
+        group = WindowGroup()
+        for window in windows:
+            group.add(window)
+        group.show_all({window: frame for window in windows})
+    else:
+        for window in windows:
+            window.show(frame)
+
+    for counter in counters.values():
+        counter.calls = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if grouped:
+            group.show_all({window: frame for window in windows})
+        else:
+            for window in windows:
+                window.show(frame)
+    elapsed = time.perf_counter() - start
+    calls = {name: counter.calls / ticks for name, counter in counters.items()}
+
+    if grouped:
+        group.close()
+    else:
+        for window in windows:
+            window.close()
+    return elapsed / ticks, calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--windows", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    counters = count_calls()
+    print(f"{'windows':>7s} {'mode':>10s} {'ms/tick':>9s} {'polls/tick':>11s} {'switches/tick':>14s}")
+    for count in args.windows:
+        for grouped in (False, True):
+            tick_time, calls = run(count, args.ticks, grouped, counters)
+            print(f"{count:7d} {'group' if grouped else 'separate':>10s} {tick_time * 1000:9.3f} "
+                  f"{calls['poll_events']:11.1f} {calls['make_context_current']:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
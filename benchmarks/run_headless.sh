@@ -0,0 +1,6 @@
+#!/bin/sh
+# Run the show() benchmark suite on a virtual X server with Mesa's llvmpipe software renderer
+# Requires xvfb (xvfb-run) and the Mesa drivers, all arguments are passed on to bench_show.py
+cd "$(dirname "$0")/.." || exit 1
+LIBGL_ALWAYS_SOFTWARE=1 GALLIUM_DRIVER=llvmpipe exec xvfb-run --auto-servernum --server-args="-screen 0 1920x1080x24" \
+    python benchmarks/bench_show.py "$@"
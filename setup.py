@@ -14,6 +14,6 @@ setup(
         "numpy",
         "opencv-python",
         'PyOpenGL',
-        "pywin32",
+        "pywin32; sys_platform == 'win32'",
     ],
 )
\ No newline at end of file
@@ -0,0 +1,15 @@
+import numpy
+import pytest
+
+from SimpleWindow import Window
+
+
+@pytest.fixture
+def window(request):
+    window = Window(name=request.node.name, size=(64, 48), headless=True, no_warnings=True)
+    try:
+        window.show(numpy.zeros((48, 64, 3), dtype=numpy.uint8))
+    except Exception as exception:
+        pytest.skip("no headless OpenGL context available: " + str(exception))
+    yield window
+    window.close()
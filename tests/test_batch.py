@@ -0,0 +1,52 @@
+import pytest
+
+from SimpleWindow import Window
+
+
+@pytest.fixture
+def applied(monkeypatch):
+    window = Window(name="test_batch", size=(640, 360), position=(10, 20), headless=True, no_warnings=True)
+    applied = []
+    apply_properties = window._apply_properties
+
+    def record(names):
+        if window._batch_depth == 0:
+            applied.append(list(names))
+        apply_properties(names)
+
+    monkeypatch.setattr(window, "_apply_properties", record)
+    return window, applied
+
+
+def test_batch_applies_the_changes_together(applied):
+    window, applied = applied
+
+    with window.batch():
+        window.set_size((800, 600))
+        window.set_position((0, 0))
+        window.set_name("renamed")
+        window.set_name("test_batch")
+
+    assert applied == [["size", "position"]]
+    assert window.get_size() == (800, 600)
+
+
+def test_nested_batches_apply_when_the_outermost_ends(applied):
+    window, applied = applied
+
+    with window.batch():
+        with window.batch():
+            window.set_topmost(True)
+        assert applied == []
+
+    assert applied == [["topmost"]]
+
+
+def test_configure_skips_unchanged_and_unknown_properties(applied):
+    window, applied = applied
+
+    window.configure(size=(640, 360), position=(10, 20), vsync=window.get_vsync(), bogus=1)
+    window.configure(size=(320, 180), scale_mode="fit")
+
+    assert applied == [[], ["size"]]
+    assert window.get_scale_mode() == "fit"
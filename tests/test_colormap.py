@@ -0,0 +1,26 @@
+import numpy
+import pytest
+
+# a lookup table which maps the colormap position to the same gray value
+GRAY = numpy.repeat(numpy.arange(256, dtype=numpy.uint8), 3).reshape(256, 3)
+
+
+@pytest.mark.parametrize("dtype", [numpy.uint8, numpy.uint16, numpy.int16, numpy.int32])
+def test_default_range_ends_at_the_largest_integer(window, dtype):
+    frame = numpy.full((48, 64), numpy.iinfo(dtype).max // 2, dtype=dtype)
+    frame[:, 32:] = numpy.iinfo(dtype).max
+
+    result = window.show(frame, colormap=GRAY)
+
+    assert numpy.all(numpy.abs(result[:, :32].astype(int) - 128) <= 1)
+    assert numpy.all(result[:, 32:] == 255)
+
+
+def test_default_range_of_float_frames(window):
+    frame = numpy.full((48, 64), 0.5, dtype=numpy.float32)
+    frame[:, 32:] = 1.0
+
+    result = window.show(frame, colormap=GRAY)
+
+    assert numpy.all(numpy.abs(result[:, :32].astype(int) - 128) <= 1)
+    assert numpy.all(result[:, 32:] == 255)
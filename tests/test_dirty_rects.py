@@ -0,0 +1,67 @@
+import numpy
+
+from SimpleWindow import Window
+
+
+def test_dirty_rects_as_array(window):
+    frame = numpy.zeros((48, 64, 3), dtype=numpy.uint8)
+    frame[8:24, 16:48] = 200
+    uploaded_bytes = window.get_uploaded_bytes()
+
+    result = window.show(frame, dirty_rects=numpy.array([[16, 8, 32, 16]]))
+
+    assert numpy.array_equal(result, frame)
+    assert window.get_uploaded_bytes() - uploaded_bytes == 32 * 16 * 3
+
+
+def test_invalid_dirty_rects_upload_the_whole_frame(window):
+    frame = numpy.full((48, 64, 3), 100, dtype=numpy.uint8)
+
+    result = window.show(frame, dirty_rects=numpy.array([1, 2, 3]))
+
+    assert numpy.array_equal(result, frame)
+
+
+def test_auto_dirty_rects_find_the_changed_tiles():
+    window = Window(name="test_auto_dirty_rects", headless=True, no_warnings=True)
+    frame = numpy.zeros((200, 300, 3), dtype=numpy.uint8)
+    assert window._find_dirty_rects(frame) == None
+
+    frame = frame.copy()
+    frame[70, 70] = 1
+    # the neighbouring changed tiles of a row are merged, the tile at the edge is cut to the frame
+    frame[130, 200:300] = 1
+
+    assert window._find_dirty_rects(frame) == [(64, 64, 64, 64), (192, 128, 108, 64)]
+    assert window._find_dirty_rects(frame) == []
+
+
+def test_auto_dirty_rects_upload_everything_when_most_tiles_changed():
+    window = Window(name="test_auto_dirty_rects", headless=True, no_warnings=True)
+    window._find_dirty_rects(numpy.zeros((128, 128), dtype=numpy.uint8))
+
+    assert window._find_dirty_rects(numpy.ones((128, 128), dtype=numpy.uint8)) == None
+
+
+def test_auto_dirty_rects_upload_only_the_changed_tiles(window):
+    frame = numpy.zeros((48, 64, 3), dtype=numpy.uint8)
+    window.show(frame, dirty_rects="auto")
+    frame = frame.copy()
+    frame[10, 10] = 255
+    uploaded_bytes = window.get_uploaded_bytes()
+
+    result = window.show(frame, dirty_rects="auto")
+
+    assert numpy.array_equal(result, frame)
+    # the frame is a single tile, which is uploaded as a whole
+    assert window.get_uploaded_bytes() - uploaded_bytes == frame.nbytes
+
+    frame = numpy.zeros((256, 256, 3), dtype=numpy.uint8)
+    window.show(frame, dirty_rects="auto")
+    frame = frame.copy()
+    frame[100, 100] = 255
+    uploaded_bytes = window.get_uploaded_bytes()
+
+    window.show(frame, dirty_rects="auto")
+
+    assert window.get_uploaded_bytes() - uploaded_bytes == 64 * 64 * 3
@@ -0,0 +1,53 @@
+import struct
+
+import cv2
+import numpy
+
+from SimpleWindow.SimpleWindow import _load_icon
+
+
+def write_icon(path, entries):
+    offset = 6 + 16 * len(entries)
+    directory, images = b"", b""
+    for width, height, bits, data in entries:
+        directory += struct.pack("<BBBBHHII", width % 256, height % 256, 0, 0, 1, bits, len(data), offset + len(images))
+        images += data
+    path.write_bytes(struct.pack("<HHH", 0, 1, len(entries)) + directory + images)
+    return str(path)
+
+
+def bitmap(image):
+    height, width = image.shape[:2]
+    header = struct.pack("<IiiHHIIiiII", 40, width, height * 2, 1, 32, 0, 0, 0, 0, 0, 0)
+    return header + image[::-1].tobytes() + bytes((width + 31) // 32 * 4 * height)
+
+
+def gradient():
+    image = numpy.zeros((16, 24, 4), dtype=numpy.uint8)
+    image[:, :, 0] = numpy.arange(24) * 10
+    image[:, :, 1] = numpy.arange(16)[:, None] * 10
+    image[:, :, 3] = numpy.arange(24) * 5
+    return image
+
+
+def test_largest_png_image(tmp_path):
+    image = gradient()
+    png = cv2.imencode(".png", image)[1].tobytes()
+    path = write_icon(tmp_path / "icon.ico", [(8, 8, 32, bitmap(image[:8, :8].copy())), (24, 16, 32, png)])
+
+    assert numpy.array_equal(_load_icon(path), image)
+
+
+def test_bitmap_with_alpha(tmp_path):
+    image = gradient()
+    path = write_icon(tmp_path / "icon.ico", [(24, 16, 32, bitmap(image))])
+
+    assert numpy.array_equal(_load_icon(path), image)
+
+
+def test_invalid_icon(tmp_path):
+    path = tmp_path / "icon.ico"
+    path.write_bytes(b"no icon")
+
+    assert _load_icon(str(path)) is None
+    assert _load_icon(str(tmp_path / "missing.ico")) is None
@@ -0,0 +1,57 @@
+import json
+
+import numpy
+
+from SimpleWindow import SimpleWindow
+
+
+def test_ring_keeps_the_latest_frames_in_order():
+    profiler = SimpleWindow._FrameProfiler(capacity=4)
+    for _ in range(6):
+        profiler.begin_frame()
+        profiler.mark(SimpleWindow.STAGE_PREPARE)
+
+    assert list(profiler.get_rows()) == [2, 3, 0, 1]
+    stats = profiler.get_stats()
+    assert stats["prepare"]["count"] == 4
+    assert stats["upload"]["count"] == 0
+    assert stats["gpu"]["count"] == 0
+
+
+def test_gpu_results_of_reused_rows_are_dropped(window):
+    SimpleWindow._make_context_current(window._window)
+    profiler = SimpleWindow._FrameProfiler(capacity=2)
+    profiler.begin_frame()
+    assert profiler.begin_gpu()
+    profiler.end_gpu()
+    # the row of the frame is taken by a newer frame before the result is read
+    profiler.begin_frame()
+    profiler.begin_frame()
+    SimpleWindow.gl.glFinish()
+
+    profiler.collect_gpu()
+
+    assert len(profiler.gpu_pending) == 0
+    assert numpy.all(numpy.isnan(profiler.gpu_durations))
+
+    assert profiler.begin_gpu()
+    profiler.end_gpu()
+    SimpleWindow.gl.glFinish()
+    profiler.collect_gpu()
+
+    assert numpy.isfinite(profiler.gpu_durations[profiler.row])
+
+
+def test_profiling_a_window_records_every_frame(window, tmp_path):
+    window.set_profiling(True)
+    for value in range(10):
+        window.show(numpy.full((48, 64, 3), value, dtype=numpy.uint8))
+
+    stats = window.get_stats()
+    path = tmp_path / "trace.json"
+    window.export_chrome_trace(str(path))
+
+    assert stats["upload"]["count"] == 10
+    assert stats["total"]["count"] == 10
+    trace = json.loads(path.read_text())
+    assert sum(event["name"] == "upload" for event in trace["traceEvents"]) == 10
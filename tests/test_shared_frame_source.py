@@ -0,0 +1,103 @@
+import numpy
+import pytest
+
+import SimpleWindow
+
+
+@pytest.fixture
+def source():
+    source = SimpleWindow.SharedFrameSource(shape=(4, 6, 3), dtype="uint8", slots=2)
+    yield source
+    source.close()
+    source.unlink()
+
+
+def test_read_before_the_first_frame(source):
+    assert source.read() is None
+    assert source() is None
+
+
+def test_read_returns_the_latest_frame(source):
+    source.write(numpy.full((4, 6, 3), 1), timestamp=1.0)
+    source.write(numpy.full((4, 6, 3), 2), timestamp=2.0)
+
+    frame, sequence, timestamp = source.read()
+
+    assert numpy.all(frame == 2)
+    assert sequence == 1
+    assert timestamp == 2.0
+    del frame
+
+
+def test_is_valid_after_the_ring_was_lapped(source):
+    first = source.write(numpy.full((4, 6, 3), 1))
+
+    assert source.is_valid(first)
+
+    source.write(numpy.full((4, 6, 3), 2))
+    source.write(numpy.full((4, 6, 3), 3))
+
+    assert not source.is_valid(first)
+
+
+def test_read_into_out_copies_the_frame(source):
+    source.write(numpy.full((4, 6, 3), 5))
+    out = numpy.zeros((4, 6, 3), dtype=numpy.uint8)
+
+    frame, sequence, _ = source.read(out=out)
+    source.write(numpy.full((4, 6, 3), 6))
+    source.write(numpy.full((4, 6, 3), 7))
+
+    assert frame is out
+    assert numpy.all(out == 5)
+    assert not source.is_valid(sequence)
+
+
+def test_call_returns_only_new_frames(source):
+    source.write(numpy.full((4, 6, 3), 1))
+
+    assert numpy.all(source() == 1)
+    assert source() is None
+
+    source.write(numpy.full((4, 6, 3), 2))
+
+    assert numpy.all(source() == 2)
+
+
+def test_attach_by_name(source):
+    consumer = SimpleWindow.SharedFrameSource(name=source.get_name())
+    source.write(numpy.full((4, 6, 3), 9))
+
+    frame, _, _ = consumer.read()
+
+    assert consumer.get_shape() == (4, 6, 3)
+    assert consumer.get_dtype() == numpy.uint8
+    assert consumer.get_slots() == 2
+    assert numpy.all(frame == 9)
+    del frame
+    consumer.close()
+
+
+def test_close_while_a_view_is_held():
+    source = SimpleWindow.SharedFrameSource(shape=(4, 6, 3))
+    source.write(numpy.zeros((4, 6, 3)))
+    frame, _, _ = source.read()
+
+    with pytest.raises(RuntimeError):
+        source.close()
+
+    del frame
+    source.close()
+    source.unlink()
+
+
+def test_close_after_the_window_was_closed(window):
+    source = SimpleWindow.SharedFrameSource(shape=(48, 64, 3))
+    source.write(numpy.full((48, 64, 3), 7))
+
+    result = window.show(source)
+    window.close()
+
+    assert numpy.all(result == 7)
+    source.close()
+    source.unlink()
@@ -0,0 +1,54 @@
+import numpy
+
+
+def test_same_version_is_not_uploaded_again(window):
+    frame = numpy.full((48, 64, 3), 10, dtype=numpy.uint8)
+    window.show(frame, version=1)
+    uploaded_bytes = window.get_uploaded_bytes()
+
+    result = window.show(numpy.full((48, 64, 3), 20, dtype=numpy.uint8), version=1)
+
+    assert window.get_uploaded_bytes() == uploaded_bytes
+    assert window.get_skipped_frames() == 1
+    assert numpy.all(result == 10)
+
+    result = window.show(numpy.full((48, 64, 3), 20, dtype=numpy.uint8), version=2)
+
+    assert numpy.all(result == 20)
+
+
+def test_identity_skips_the_same_array(window):
+    window.set_skip_unchanged("identity")
+    frame = numpy.full((48, 64, 3), 10, dtype=numpy.uint8)
+    window.show(frame)
+    window.show(frame)
+
+    assert window.get_skipped_frames() == 1
+
+    window.show(frame.copy())
+
+    assert window.get_skipped_frames() == 1
+
+
+def test_checksum_skips_equal_content(window):
+    window.set_skip_unchanged("checksum")
+    window.show(numpy.full((48, 64, 3), 10, dtype=numpy.uint8))
+    window.show(numpy.full((48, 64, 3), 10, dtype=numpy.uint8))
+
+    assert window.get_skipped_frames() == 1
+
+    result = window.show(numpy.full((48, 64, 3), 11, dtype=numpy.uint8))
+
+    assert window.get_skipped_frames() == 1
+    assert numpy.all(result == 11)
+
+
+def test_changed_options_are_uploaded_again(window):
+    frame = numpy.zeros((48, 64, 3), dtype=numpy.uint8)
+    frame[..., 2] = 255
+    window.show(frame, version=1)
+
+    result = window.show(frame, channel_order="rgb", version=1)
+
+    assert window.get_skipped_frames() == 0
+    assert numpy.all(result[..., 0] == 255)
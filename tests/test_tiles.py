@@ -0,0 +1,36 @@
+import numpy
+
+from SimpleWindow import SimpleWindow
+
+
+def test_box_filter_averages_blocks_and_pads_the_edges():
+    image = numpy.arange(5 * 7 * 3, dtype=numpy.uint8).reshape(5, 7, 3)
+    padded = numpy.pad(image, ((0, 1), (0, 1), (0, 0)), mode="edge").astype(numpy.float64)
+
+    result = SimpleWindow._box_filter(image, 2)
+
+    assert result.dtype == numpy.uint8
+    assert numpy.array_equal(result, numpy.rint(padded.reshape(3, 2, 4, 2, 3).mean(axis=(1, 3))))
+
+
+def test_box_filter_in_chunks_matches_one_pass(monkeypatch):
+    image = numpy.random.default_rng(0).random((33, 17)).astype(numpy.float32)
+    expected = SimpleWindow._box_filter(image, 4)
+    monkeypatch.setattr(SimpleWindow, "TILE_FILTER_CHUNK", 16)
+
+    result = SimpleWindow._box_filter(image, 4)
+
+    assert result.shape == (9, 5)
+    assert numpy.allclose(result, expected)
+    assert numpy.isclose(result[0, 0], image[:4, :4].mean())
+
+
+def test_zoomed_out_tiles_do_not_alias(window):
+    checkerboard = (numpy.indices((400, 400)).sum(axis=0) % 2 * 255).astype(numpy.uint8)
+
+    for _ in range(4):
+        result = window.show_tiled(checkerboard, tile_size=128)
+
+    # the fitted image is drawn from its coarsest level 2, which averages the 4 x 4 blocks of the checkerboard to gray
+    view = result[4:-4, 12:-12]
+    assert view.min() >= 120 and view.max() <= 136
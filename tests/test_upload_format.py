@@ -0,0 +1,19 @@
+import numpy
+
+
+def test_float32_frames_are_shown_in_the_range_0_to_1(window):
+    result = window.show(numpy.full((48, 64, 3), 0.5, dtype=numpy.float32))
+
+    assert numpy.all(result == 128)
+
+
+def test_other_float_dtypes_are_cast_to_uint8(window):
+    result = window.show(numpy.full((48, 64, 3), 200.0, dtype=numpy.float64))
+
+    assert numpy.all(result == 200)
+
+
+def test_uint16_frames_are_shown_in_the_range_0_to_65535(window):
+    result = window.show(numpy.full((48, 64), 257 * 100, dtype=numpy.uint16))
+
+    assert numpy.all(result == 100)
@@ -0,0 +1,44 @@
+import numpy
+import pytest
+
+from SimpleWindow import SimpleWindow
+
+
+@pytest.mark.parametrize("color_space", ["bt601", "bt709"])
+def test_full_range_matrix_inverts_the_rgb_to_yuv_conversion(color_space):
+    kr, kb = SimpleWindow.YUV_COLOR_SPACES[color_space]
+    rgb = numpy.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [0.2, 0.5, 0.8]])
+    y = rgb @ numpy.array([kr, 1 - kr - kb, kb])
+    u = (rgb[:, 2] - y) / (2 * (1 - kb)) + 128 / 255
+    v = (rgb[:, 0] - y) / (2 * (1 - kr)) + 128 / 255
+    matrix, offset = SimpleWindow._get_yuv_matrix(color_space, True)
+
+    result = (numpy.stack([y, u, v], axis=1) - offset) @ matrix.T
+
+    assert numpy.allclose(result, rgb, atol=1e-5)
+
+
+def test_limited_range_matrix_maps_16_to_black_and_235_to_white():
+    matrix, offset = SimpleWindow._get_yuv_matrix("bt601", False)
+
+    black = matrix @ (numpy.array([16, 128, 128]) / 255 - offset)
+    white = matrix @ (numpy.array([235, 128, 128]) / 255 - offset)
+
+    assert numpy.allclose(black, 0, atol=1e-5)
+    assert numpy.allclose(white, 1, atol=1e-5)
+
+
+def test_nv12_frame_matches_opencv(window):
+    cv2 = pytest.importorskip("cv2")
+    random = numpy.random.default_rng(0)
+    y = random.integers(16, 236, (48, 64), dtype=numpy.uint8)
+    # flat chroma blocks of 16 x 16 pixels, so the interpolation of the chroma plane only matters at their borders
+    uv = numpy.repeat(numpy.repeat(random.integers(16, 241, (3, 4, 2), dtype=numpy.uint8), 8, axis=0), 8, axis=1)
+    frame = numpy.concatenate([y, uv.reshape(24, 64)])
+    inside = (numpy.arange(64) % 16 >= 2) & (numpy.arange(64) % 16 < 14)
+
+    result = window.show_yuv(frame, pixel_format="nv12")
+
+    expected = cv2.cvtColor(frame, cv2.COLOR_YUV2BGR_NV12)
+    difference = numpy.abs(result.astype(int) - expected)
+    assert difference[inside[:48]][:, inside].max() <= 3